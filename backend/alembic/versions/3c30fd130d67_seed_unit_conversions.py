@@ -0,0 +1,57 @@
+"""seed_unit_conversions
+
+Revision ID: 3c30fd130d67
+Revises: 8a154e9660b8
+Create Date: 2026-10-19 09:12:04.518230
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy import table, column
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3c30fd130d67'
+down_revision: Union[str, None] = '8a154e9660b8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Create reference table for bulk insert
+    unit_conversions = table('unit_conversions',
+        column('id', sa.Integer),
+        column('from_unit_id', sa.Integer),
+        column('to_unit_id', sa.Integer),
+        column('ratio', sa.Float)
+    )
+
+    # Every unit converts to its category's base unit (ml, g, pc).
+    # Other pairs are derived by the conversion engine's transitive closure.
+    op.bulk_insert(unit_conversions, [
+        # Volume -> Milliliter
+        {'id': 1, 'from_unit_id': 2, 'to_unit_id': 1, 'ratio': 1000.0},        # Liter
+        {'id': 2, 'from_unit_id': 3, 'to_unit_id': 1, 'ratio': 4.92892},       # Teaspoon
+        {'id': 3, 'from_unit_id': 4, 'to_unit_id': 1, 'ratio': 14.7868},       # Tablespoon
+        {'id': 4, 'from_unit_id': 5, 'to_unit_id': 1, 'ratio': 29.5735},       # Fluid Ounce
+        {'id': 5, 'from_unit_id': 6, 'to_unit_id': 1, 'ratio': 236.588},       # Cup
+        {'id': 6, 'from_unit_id': 7, 'to_unit_id': 1, 'ratio': 473.176},       # Pint
+        {'id': 7, 'from_unit_id': 8, 'to_unit_id': 1, 'ratio': 946.353},       # Quart
+        {'id': 8, 'from_unit_id': 9, 'to_unit_id': 1, 'ratio': 3785.41},       # Gallon
+
+        # Weight -> Gram
+        {'id': 9, 'from_unit_id': 10, 'to_unit_id': 11, 'ratio': 0.001},       # Milligram
+        {'id': 10, 'from_unit_id': 12, 'to_unit_id': 11, 'ratio': 1000.0},     # Kilogram
+        {'id': 11, 'from_unit_id': 13, 'to_unit_id': 11, 'ratio': 28.3495},    # Ounce
+        {'id': 12, 'from_unit_id': 14, 'to_unit_id': 11, 'ratio': 453.592},    # Pound
+
+        # Quantity -> Piece
+        {'id': 13, 'from_unit_id': 16, 'to_unit_id': 15, 'ratio': 12.0},       # Dozen
+    ])
+
+
+def downgrade() -> None:
+    # Remove all seeded data
+    op.execute('DELETE FROM unit_conversions')
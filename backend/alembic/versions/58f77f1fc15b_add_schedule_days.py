@@ -0,0 +1,47 @@
+"""add_schedule_days
+
+Revision ID: 58f77f1fc15b
+Revises: c3ddc5378d08
+Create Date: 2026-10-19 14:05:41.218806
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '58f77f1fc15b'
+down_revision: Union[str, None] = 'c3ddc5378d08'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # The app's create_all adds the table to databases created after this change
+    if not sa.inspect(op.get_bind()).has_table('schedule_days'):
+        op.create_table(
+            'schedule_days',
+            sa.Column('day', sa.Date(), nullable=False),
+            sa.Column('schedule_id', sa.Integer(), nullable=False),
+            sa.ForeignKeyConstraint(['schedule_id'], ['schedules.id'], ondelete='CASCADE'),
+            sa.PrimaryKeyConstraint('day', 'schedule_id')
+        )
+        op.create_index('ix_schedule_days_schedule_id', 'schedule_days', ['schedule_id'])
+
+    # Backfill one row per covered day of every existing schedule
+    op.execute("""
+        WITH RECURSIVE covered(day, schedule_id, end_date) AS (
+            SELECT start_date, id, end_date FROM schedules
+            UNION ALL
+            SELECT date(day, '+1 day'), schedule_id, end_date FROM covered WHERE day < end_date
+        )
+        INSERT OR IGNORE INTO schedule_days (day, schedule_id)
+        SELECT day, schedule_id FROM covered
+    """)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_schedule_days_schedule_id', table_name='schedule_days')
+    op.drop_table('schedule_days')
@@ -0,0 +1,36 @@
+"""add_cache_versions
+
+Revision ID: 7b2e4f1a9c35
+Revises: d41b7c9e2a60
+Create Date: 2026-10-19 17:02:41.318204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7b2e4f1a9c35'
+down_revision: Union[str, None] = 'd41b7c9e2a60'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # The app's create_all adds the table to databases created after this change
+    inspector = sa.inspect(op.get_bind())
+    if not inspector.has_table('cache_versions'):
+        op.create_table(
+            'cache_versions',
+            sa.Column('name', sa.String(), nullable=False),
+            sa.Column('version', sa.Integer(), nullable=False),
+            sa.PrimaryKeyConstraint('name')
+        )
+        op.create_index('ix_cache_versions_version', 'cache_versions', ['version'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_cache_versions_version', table_name='cache_versions')
+    op.drop_table('cache_versions')
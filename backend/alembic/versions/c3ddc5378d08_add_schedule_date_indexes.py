@@ -0,0 +1,60 @@
+"""add_schedule_date_indexes
+
+Revision ID: c3ddc5378d08
+Revises: fb8a5a5315aa
+Create Date: 2026-10-19 13:26:15.804417
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c3ddc5378d08'
+down_revision: Union[str, None] = 'fb8a5a5315aa'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # B-tree indexes for calendar overlap queries
+    op.create_index('ix_schedules_start_date_end_date', 'schedules', ['start_date', 'end_date'], if_not_exists=True)
+    op.create_index('ix_schedules_end_date', 'schedules', ['end_date'], if_not_exists=True)
+
+    # R*Tree over date ranges as integer Julian days, maintained by triggers
+    op.execute('CREATE VIRTUAL TABLE IF NOT EXISTS schedule_intervals USING rtree_i32(id, start_day, end_day)')
+    op.execute("""
+        CREATE TRIGGER IF NOT EXISTS schedule_intervals_insert AFTER INSERT ON schedules BEGIN
+            INSERT INTO schedule_intervals (id, start_day, end_day)
+            VALUES (new.id, CAST(julianday(new.start_date) AS INTEGER), CAST(julianday(new.end_date) AS INTEGER));
+        END
+    """)
+    op.execute("""
+        CREATE TRIGGER IF NOT EXISTS schedule_intervals_update AFTER UPDATE OF start_date, end_date ON schedules BEGIN
+            UPDATE schedule_intervals
+            SET start_day = CAST(julianday(new.start_date) AS INTEGER), end_day = CAST(julianday(new.end_date) AS INTEGER)
+            WHERE id = new.id;
+        END
+    """)
+    op.execute("""
+        CREATE TRIGGER IF NOT EXISTS schedule_intervals_delete AFTER DELETE ON schedules BEGIN
+            DELETE FROM schedule_intervals WHERE id = old.id;
+        END
+    """)
+
+    # Backfill existing schedules
+    op.execute("""
+        INSERT OR REPLACE INTO schedule_intervals (id, start_day, end_day)
+        SELECT id, CAST(julianday(start_date) AS INTEGER), CAST(julianday(end_date) AS INTEGER)
+        FROM schedules
+    """)
+
+
+def downgrade() -> None:
+    op.execute('DROP TRIGGER IF EXISTS schedule_intervals_delete')
+    op.execute('DROP TRIGGER IF EXISTS schedule_intervals_update')
+    op.execute('DROP TRIGGER IF EXISTS schedule_intervals_insert')
+    op.execute('DROP TABLE IF EXISTS schedule_intervals')
+    op.drop_index('ix_schedules_end_date', table_name='schedules')
+    op.drop_index('ix_schedules_start_date_end_date', table_name='schedules')
@@ -0,0 +1,37 @@
+"""add_recipe_documents
+
+Revision ID: c58d3e9a1f24
+Revises: 7b2e4f1a9c35
+Create Date: 2026-10-19 18:24:07.552913
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c58d3e9a1f24'
+down_revision: Union[str, None] = '7b2e4f1a9c35'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # The app's create_all adds the table to databases created after this change.
+    # Documents for existing recipes are built the first time each recipe is read.
+    inspector = sa.inspect(op.get_bind())
+    if not inspector.has_table('recipe_documents'):
+        op.create_table(
+            'recipe_documents',
+            sa.Column('recipe_id', sa.Integer(), nullable=False),
+            sa.Column('version', sa.Integer(), nullable=False),
+            sa.Column('body', sa.LargeBinary(), nullable=False),
+            sa.ForeignKeyConstraint(['recipe_id'], ['recipes.id'], ondelete='CASCADE'),
+            sa.PrimaryKeyConstraint('recipe_id')
+        )
+
+
+def downgrade() -> None:
+    op.drop_table('recipe_documents')
@@ -0,0 +1,58 @@
+"""add_week_templates
+
+Revision ID: d41b7c9e2a60
+Revises: 58f77f1fc15b
+Create Date: 2026-10-19 15:12:08.532190
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd41b7c9e2a60'
+down_revision: Union[str, None] = '58f77f1fc15b'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # The app's create_all adds the tables to databases created after this change
+    inspector = sa.inspect(op.get_bind())
+    meal_type = sa.Enum('BREAKFAST', 'LUNCH', 'DINNER', 'SNACKS', name='mealtype')
+
+    if not inspector.has_table('week_templates'):
+        op.create_table(
+            'week_templates',
+            sa.Column('id', sa.Integer(), nullable=False),
+            sa.Column('name', sa.String(), nullable=False),
+            sa.Column('description', sa.Text(), nullable=True),
+            sa.PrimaryKeyConstraint('id'),
+            sa.UniqueConstraint('name')
+        )
+
+    if not inspector.has_table('week_template_entries'):
+        op.create_table(
+            'week_template_entries',
+            sa.Column('id', sa.Integer(), nullable=False),
+            sa.Column('template_id', sa.Integer(), nullable=False),
+            sa.Column('recipe_id', sa.Integer(), nullable=False),
+            sa.Column('day_offset', sa.Integer(), nullable=False),
+            sa.Column('duration_days', sa.Integer(), nullable=False),
+            sa.Column('meal_type', meal_type, nullable=True),
+            sa.Column('notes', sa.Text(), nullable=True),
+            sa.CheckConstraint('day_offset BETWEEN 0 AND 6', name='valid_day_offset'),
+            sa.CheckConstraint('duration_days >= 1', name='valid_duration'),
+            sa.ForeignKeyConstraint(['recipe_id'], ['recipes.id']),
+            sa.ForeignKeyConstraint(['template_id'], ['week_templates.id'], ondelete='CASCADE'),
+            sa.PrimaryKeyConstraint('id')
+        )
+        op.create_index('ix_week_template_entries_template_id', 'week_template_entries', ['template_id'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_week_template_entries_template_id', table_name='week_template_entries')
+    op.drop_table('week_template_entries')
+    op.drop_table('week_templates')
@@ -0,0 +1,26 @@
+"""add_schedule_start_date_id_index
+
+Revision ID: e6a4c2b8d913
+Revises: c58d3e9a1f24
+Create Date: 2026-10-19 20:41:52.106377
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e6a4c2b8d913'
+down_revision: Union[str, None] = 'c58d3e9a1f24'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Serves the schedule range in (start_date, id) order, so pages and streams need no sort
+    op.create_index('ix_schedules_start_date_id', 'schedules', ['start_date', 'id'], if_not_exists=True)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_schedules_start_date_id', table_name='schedules')
@@ -0,0 +1,87 @@
+"""add_recipe_ingredient_base_quantity
+
+Revision ID: fb8a5a5315aa
+Revises: 3c30fd130d67
+Create Date: 2026-10-19 11:02:47.390164
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.sql import text
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'fb8a5a5315aa'
+down_revision: Union[str, None] = '3c30fd130d67'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Each category's base unit as of this revision, kept here so later app changes don't alter the backfill
+BASE_UNIT_ABBREVIATIONS = {'VOLUME': 'ml', 'WEIGHT': 'g', 'QUANTITY': 'pc'}
+
+
+def _ratios_to_base(unit_rows, conversions):
+    """
+    Maps each unit id to (multiplier to its category's base unit, base unit id), following
+    chains of conversions between units of the same category outward from each base unit
+    """
+    categories = {unit_id: category for unit_id, category, _ in unit_rows}
+    neighbours = {}
+    for from_id, to_id, ratio in conversions:
+        if from_id in categories and categories.get(to_id) == categories[from_id]:
+            neighbours.setdefault(to_id, []).append((from_id, ratio))         # 1 from_id = ratio to_id
+            neighbours.setdefault(from_id, []).append((to_id, 1.0 / ratio))
+
+    result = {}
+    for unit_id, category, abbreviation in unit_rows:
+        if BASE_UNIT_ABBREVIATIONS.get(category) != abbreviation:
+            continue
+        result[unit_id] = (1.0, unit_id)
+        pending = [unit_id]
+        while pending:
+            current = pending.pop()
+            for other, ratio in neighbours.get(current, []):
+                if other not in result:
+                    result[other] = (result[current][0] * ratio, unit_id)
+                    pending.append(other)
+    return result
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+
+    # The app's create_all adds the columns to databases created after this change
+    existing_columns = {column['name'] for column in sa.inspect(bind).get_columns('recipe_ingredients')}
+    if 'base_quantity' not in existing_columns:
+        with op.batch_alter_table('recipe_ingredients') as batch_op:
+            batch_op.add_column(sa.Column('base_quantity', sa.Float(), nullable=True))
+            batch_op.add_column(sa.Column('base_unit_id', sa.Integer(), nullable=True))
+            batch_op.create_foreign_key(
+                'fk_recipe_ingredients_base_unit_id', 'measurement_units', ['base_unit_id'], ['id']
+            )
+
+    # Backfill from the current conversion table
+    unit_rows = bind.execute(text('SELECT id, category, abbreviation FROM measurement_units')).all()
+    conversions = bind.execute(text('SELECT from_unit_id, to_unit_id, ratio FROM unit_conversions')).all()
+
+    for unit_id, (ratio, base_unit_id) in _ratios_to_base(unit_rows, conversions).items():
+        bind.execute(
+            text(
+                'UPDATE recipe_ingredients SET base_quantity = quantity * :ratio, base_unit_id = :base_unit_id '
+                'WHERE unit_id = :unit_id'
+            ),
+            {'ratio': ratio, 'base_unit_id': base_unit_id, 'unit_id': unit_id}
+        )
+
+
+def downgrade() -> None:
+    # Databases built with create_all before the model named this key have it unnamed;
+    # recreating the table without base_unit_id drops it either way
+    foreign_keys = {fk['name'] for fk in sa.inspect(op.get_bind()).get_foreign_keys('recipe_ingredients')}
+    with op.batch_alter_table('recipe_ingredients') as batch_op:
+        if 'fk_recipe_ingredients_base_unit_id' in foreign_keys:
+            batch_op.drop_constraint('fk_recipe_ingredients_base_unit_id', type_='foreignkey')
+        batch_op.drop_column('base_unit_id')
+        batch_op.drop_column('base_quantity')
@@ -0,0 +1,141 @@
+# backend/app/admission.py
+
+import asyncio
+import heapq
+import itertools
+import math
+import os
+import time
+from enum import IntEnum
+from typing import Callable, List, Optional
+
+from app.database import POOL_SIZE
+
+# Requests holding a slot at once; more than the pool has connections would just wait in the pool
+CONCURRENCY = int(os.environ.get("ADMISSION_CONCURRENCY", str(POOL_SIZE)))
+# Requests waiting for a slot; past this they're turned away straight away
+QUEUE_SIZE = int(os.environ.get("ADMISSION_QUEUE_SIZE", "100"))
+# Longest a request waits for a slot, well short of the pool's 30 s timeout
+MAX_WAIT_SECONDS = float(os.environ.get("ADMISSION_MAX_WAIT_MS", "2000")) / 1000
+MAX_RETRY_AFTER = 30
+
+
+class Priority(IntEnum):
+    READ = 0
+    WRITE = 1
+    BULK = 2
+
+
+# Waiting requests are admitted in order of arrival plus this delay, so reads go ahead of writes
+# that arrived slightly earlier, but a steady stream of reads can't hold writes back forever
+PRIORITY_DELAY = {Priority.READ: 0.0, Priority.WRITE: 0.25, Priority.BULK: 1.0}
+# Share of the queue each priority may fill, so bulk writes are shed before reads
+QUEUE_SHARE = {Priority.READ: 1.0, Priority.WRITE: 1.0, Priority.BULK: 0.5}
+
+
+class Rejected(Exception):
+    """No slot is free and the queue has no room, or the wait ran out"""
+
+    def __init__(self, retry_after: int, queued: int):
+        super().__init__(f"{queued} requests waiting")
+        self.retry_after = retry_after
+        self.queued = queued
+
+
+class AdmissionController:
+    """
+    Limits how many requests run at once, queueing a bounded number of others by priority.
+    Only used from the event loop, so it needs no locks; a freed slot goes straight to the
+    next waiter so a newcomer can't take it first.
+    """
+
+    def __init__(
+        self,
+        concurrency: int = CONCURRENCY,
+        queue_size: int = QUEUE_SIZE,
+        max_wait: float = MAX_WAIT_SECONDS
+    ):
+        self.concurrency = concurrency
+        self.queue_size = queue_size
+        self.max_wait = max_wait
+        self.active = 0
+        self.queued = 0
+        self.hold_seconds = 0.05      # moving average of how long a slot is held, for Retry-After
+        self._waiters: List[list] = []      # heap of [admission order, arrival order, future]
+        self._order = itertools.count()
+
+    def retry_after(self) -> int:
+        """Seconds until the current queue has probably drained"""
+        estimate = self.hold_seconds * (self.queued + 1) / self.concurrency
+        return min(max(math.ceil(estimate), 1), MAX_RETRY_AFTER)
+
+    def _has_room(self, priority: Priority) -> bool:
+        return self.queued < self.queue_size * QUEUE_SHARE[priority]
+
+    async def acquire(self, priority: Priority) -> float:
+        """
+        Takes a slot, waiting for one if needed. Returns the seconds spent waiting.
+        Raises Rejected when the queue has no room for this priority or max_wait passes.
+        """
+        if self.active < self.concurrency and not self.queued:
+            self.active += 1
+            return 0.0
+        if not self._has_room(priority):
+            raise Rejected(self.retry_after(), self.queued)
+
+        future = asyncio.get_running_loop().create_future()
+        start = time.perf_counter()
+        heapq.heappush(self._waiters, [start + PRIORITY_DELAY[priority], next(self._order), future])
+        self.queued += 1
+        try:
+            await asyncio.wait((future,), timeout=self.max_wait)
+        finally:
+            if not future.done():
+                # Timed out or cancelled; release() skips the cancelled entry
+                future.cancel()
+                self.queued -= 1
+            elif asyncio.current_task().cancelling():
+                # Cancelled just after being handed a slot
+                self.release()
+        if future.cancelled():
+            raise Rejected(self.retry_after(), self.queued)
+        return time.perf_counter() - start
+
+    def release(self, held_seconds: Optional[float] = None) -> None:
+        """Hands the slot to the next waiter, or frees it"""
+        if held_seconds is not None:
+            self.hold_seconds += (held_seconds - self.hold_seconds) * 0.1
+        while self._waiters:
+            _, _, future = heapq.heappop(self._waiters)
+            if not future.cancelled():
+                self.queued -= 1
+                future.set_result(None)
+                return
+        self.active -= 1
+
+
+_controller: Optional[AdmissionController] = None
+
+
+def controller() -> AdmissionController:
+    global _controller
+    if _controller is None:
+        _controller = AdmissionController()
+    return _controller
+
+
+def priority(level: Optional[Priority]) -> Callable[[Callable], Callable]:
+    """
+    Sets an endpoint's admission priority; by default reads are READ and other methods WRITE.
+    None exempts the endpoint, for routes that don't touch the database.
+    """
+    def decorate(endpoint: Callable) -> Callable:
+        endpoint.admission_priority = level
+        return endpoint
+    return decorate
+
+
+def route_priority(endpoint: Callable, methods: set) -> Optional[Priority]:
+    if hasattr(endpoint, "admission_priority"):
+        return endpoint.admission_priority
+    return Priority.READ if methods <= {"GET", "HEAD"} else Priority.WRITE
@@ -0,0 +1,220 @@
+# backend/app/cache.py
+
+import hashlib
+import os
+import sqlite3
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, List, Optional
+
+from sqlalchemy import event, func, select
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+from app.models.cache_model import CacheVersion
+
+
+class LRUCache:
+    """
+    Thread-safe least-recently-used cache.
+    Entries should be keyed by the versions they depend on, so stale entries simply stop being hit.
+    """
+
+    def __init__(self, maxsize: int = 1024):
+        self.maxsize = maxsize
+        self._data: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+        _caches.append(self)
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            try:
+                self._data.move_to_end(key)
+                return self._data[key]
+            except KeyError:
+                return default
+
+    def set(self, key: Hashable, value: Any) -> None:
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+_caches: List[LRUCache] = []
+_versions: Dict[str, int] = {}
+_versions_lock = threading.Lock()
+_subscribers: List[Callable[[List[str]], None]] = []
+
+
+def version(name: str) -> int:
+    """
+    Current version of a cached namespace, e.g. "ingredients" or "recipe:12"
+    """
+    return _versions.get(name, 0)
+
+
+def etag(*names: str, **params: Any) -> str:
+    """
+    Strong ETag for a response built from the given namespaces and request parameters.
+    Changes whenever one of the namespaces is touched, without reading any rows.
+    Versions are shared through the database, so every worker gives the same ETag.
+    """
+    key = repr(([(name, version(name)) for name in names], sorted(params.items())))
+    return f'"{hashlib.sha1(key.encode()).hexdigest()[:20]}"'
+
+
+def touch(db: Session, *names: str) -> None:
+    """
+    Marks namespaces as changed by the session's current transaction.
+    Their versions are written to cache_versions as the transaction commits, and forgotten on rollback.
+    """
+    db.info.setdefault("cache_touched", set()).update(names)
+
+
+def _record_versions(versions: Dict[str, int]) -> List[str]:
+    """Raises local versions to the given ones; returns the names that changed"""
+    changed = []
+    with _versions_lock:
+        for name, new_version in versions.items():
+            if new_version > _versions.get(name, 0):
+                _versions[name] = new_version
+                changed.append(name)
+    return changed
+
+
+@event.listens_for(Session, "before_commit")
+def _write_touched_versions(session: Session) -> None:
+    """
+    Each touched namespace takes the next value of one sequence: the highest version so far, read
+    by the INSERT itself while it holds SQLite's write lock, so versions increase in commit order
+    """
+    touched = session.info.get("cache_touched")
+    if not touched:
+        return
+    next_version = select(func.coalesce(func.max(CacheVersion.version), 0) + 1).scalar_subquery()
+    statement = sqlite_insert(CacheVersion).values([
+        {"name": name, "version": next_version} for name in sorted(touched)
+    ])
+    statement = statement.on_conflict_do_update(
+        index_elements=[CacheVersion.name], set_={"version": next_version}
+    ).returning(CacheVersion.name, CacheVersion.version)
+    session.info["cache_written"] = dict(session.execute(statement).all())
+
+
+@event.listens_for(Session, "after_commit")
+def _bump_touched_versions(session: Session) -> None:
+    session.info.pop("cache_touched", None)
+    written = session.info.pop("cache_written", None)
+    if written:
+        _record_versions(written)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_touched_versions(session: Session) -> None:
+    session.info.pop("cache_touched", None)
+    session.info.pop("cache_written", None)
+
+
+def subscribe(callback: Callable[[List[str]], None]) -> None:
+    """
+    Calls callback with the namespaces other processes changed, for in-process state that
+    isn't keyed by version and has to be refreshed
+    """
+    _subscribers.append(callback)
+
+
+class VersionWatcher:
+    """
+    Picks up versions committed by other processes sharing a SQLite file.
+    PRAGMA data_version on a dedicated connection changes whenever another connection commits,
+    so checking costs one pragma; only then are the versions past the highest seen read.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.pid = os.getpid()
+        self.highest = 0
+        self._data_version: Optional[int] = None
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.Lock()
+
+    def check(self) -> List[str]:
+        """Updates local versions from the database; returns the namespaces changed elsewhere"""
+        with self._lock:
+            try:
+                data_version = self._connection.execute("PRAGMA data_version").fetchone()[0]
+                if data_version == self._data_version:
+                    return []
+                rows = self._connection.execute(
+                    "SELECT name, version FROM cache_versions WHERE version > ?", (self.highest,)
+                ).fetchall()
+            except sqlite3.Error:
+                return []       # no cache_versions table yet
+            self._data_version = data_version
+            if rows:
+                self.highest = max(self.highest, max(row_version for _, row_version in rows))
+
+        changed = _record_versions(dict(rows))
+        if changed:
+            for callback in _subscribers:
+                callback(changed)
+        return changed
+
+    def close(self) -> None:
+        self._connection.close()
+
+
+_watcher: Optional[VersionWatcher] = None
+
+
+def watch(engine: Optional[Engine]) -> None:
+    """
+    Follows the versions in an engine's SQLite file, replacing any file watched before.
+    None stops watching.
+    """
+    global _watcher
+    if _watcher is not None:
+        _watcher.close()
+        _watcher = None
+    if engine is None or engine.dialect.name != "sqlite" or engine.url.database in (None, "", ":memory:"):
+        return
+    _watcher = VersionWatcher(engine.url.database)
+    _watcher.check()
+
+
+def sync() -> List[str]:
+    """
+    Catches up with versions committed by other workers. Cheap enough to run on every request.
+    """
+    global _watcher
+    watcher = _watcher
+    if watcher is None:
+        return []
+    if watcher.pid != os.getpid():
+        # SQLite connections can't be shared with a forked child
+        watcher = _watcher = VersionWatcher(watcher.path)
+    return watcher.check()
+
+
+def clear_all() -> None:
+    """
+    Empties every LRU cache and resets all versions
+    """
+    for cache in _caches:
+        cache.clear()
+    with _versions_lock:
+        _versions.clear()
+    if _watcher is not None:
+        with _watcher._lock:
+            _watcher.highest = 0
+            _watcher._data_version = None
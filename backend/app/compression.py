@@ -0,0 +1,183 @@
+# backend/app/compression.py
+
+import gzip
+import zlib
+from typing import Optional, Tuple
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:
+    import brotli
+except ImportError:     # brotli is optional; without it only gzip is offered
+    brotli = None
+
+MINIMUM_SIZE = 1024
+GZIP_LEVEL = 6
+BROTLI_QUALITY = 5
+
+# Preferred first when a client accepts several equally
+SUPPORTED_ENCODINGS: Tuple[str, ...] = ("br", "gzip") if brotli is not None else ("gzip",)
+
+# Event streams must reach the client event by event, unbuffered
+EXCLUDED_MEDIA_TYPES = ("text/event-stream",)
+
+
+def negotiate(accept_encoding: Optional[str]) -> Optional[str]:
+    """
+    Picks the supported content coding with the highest q-value in an Accept-Encoding header,
+    or None if the client accepts none of them
+    """
+    if not accept_encoding:
+        return None
+
+    weights = {}
+    for part in accept_encoding.split(","):
+        coding, _, params = part.strip().partition(";")
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                continue
+        weights[coding.strip().lower()] = quality
+
+    best, best_quality = None, 0.0
+    for encoding in SUPPORTED_ENCODINGS:
+        quality = weights.get(encoding, weights.get("*", 0.0))
+        if quality > best_quality:
+            best, best_quality = encoding, quality
+    return best
+
+
+def compress(body: bytes, encoding: str) -> bytes:
+    if encoding == "br":
+        return brotli.compress(body, quality=BROTLI_QUALITY)
+    return gzip.compress(body, compresslevel=GZIP_LEVEL, mtime=0)
+
+
+class _StreamCompressor:
+    """Compresses a streamed body chunk by chunk, flushing each so the client sees it promptly"""
+
+    def __init__(self, encoding: str):
+        if encoding == "br":
+            self._compressor = brotli.Compressor(quality=BROTLI_QUALITY)
+            self._compress = self._compressor.process
+            self._flush = self._compressor.flush
+            self._finish = self._compressor.finish
+        else:
+            self._compressor = zlib.compressobj(GZIP_LEVEL, zlib.DEFLATED, zlib.MAX_WBITS | 16)
+            self._compress = self._compressor.compress
+            self._flush = lambda: self._compressor.flush(zlib.Z_SYNC_FLUSH)
+            self._finish = self._compressor.flush
+
+    def chunk(self, data: bytes) -> bytes:
+        return self._compress(data) + self._flush()
+
+    def finish(self) -> bytes:
+        return self._finish()
+
+
+def _weaken_etag(headers: MutableHeaders) -> None:
+    # A strong ETag names exact bytes, which compressing here changes
+    etag = headers.get("etag")
+    if etag is not None and not etag.startswith("W/"):
+        headers["ETag"] = f"W/{etag}"
+
+
+class CompressionMiddleware:
+    """
+    Compresses responses with the best encoding the client accepts (brotli if installed, else gzip).
+    Bodies under minimum_size, already encoded responses and event streams are sent as they are.
+    Strong ETags on responses it compresses are made weak.
+    """
+
+    def __init__(self, app: ASGIApp, minimum_size: int = MINIMUM_SIZE):
+        self.app = app
+        self.minimum_size = minimum_size
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = negotiate(Headers(scope=scope).get("accept-encoding"))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        await _CompressionResponder(self.app, encoding, self.minimum_size)(scope, receive, send)
+
+
+class _CompressionResponder:
+    def __init__(self, app: ASGIApp, encoding: str, minimum_size: int):
+        self.app = app
+        self.encoding = encoding
+        self.minimum_size = minimum_size
+        self.send: Send = None
+        self.start_message: Optional[Message] = None
+        self.passthrough = False
+        self.stream: Optional[_StreamCompressor] = None
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        self.send = send
+        await self.app(scope, receive, self.send_compressed)
+
+    async def send_compressed(self, message: Message) -> None:
+        if message["type"] == "http.response.start":
+            # Held back until the first body chunk shows whether to compress
+            self.start_message = message
+            headers = Headers(raw=message["headers"])
+            self.passthrough = (
+                "content-encoding" in headers
+                or headers.get("content-type", "").startswith(EXCLUDED_MEDIA_TYPES)
+            )
+            return
+
+        if message["type"] != "http.response.body":
+            await self.send(message)
+            return
+
+        if self.passthrough:
+            if self.start_message is not None:
+                await self.send(self.start_message)
+                self.start_message = None
+            await self.send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+
+        if self.start_message is not None:
+            headers = MutableHeaders(raw=self.start_message["headers"])
+            if not more_body:
+                # Whole body in one message
+                if len(body) >= self.minimum_size:
+                    body = compress(body, self.encoding)
+                    headers["Content-Encoding"] = self.encoding
+                    headers["Content-Length"] = str(len(body))
+                    headers.add_vary_header("Accept-Encoding")
+                    _weaken_etag(headers)
+                await self.send(self.start_message)
+                self.start_message = None
+                await self.send({"type": "http.response.body", "body": body})
+                return
+
+            # Streamed body: compress incrementally
+            self.stream = _StreamCompressor(self.encoding)
+            headers["Content-Encoding"] = self.encoding
+            headers.add_vary_header("Accept-Encoding")
+            _weaken_etag(headers)
+            if "content-length" in headers:
+                del headers["Content-Length"]
+            await self.send(self.start_message)
+            self.start_message = None
+
+        if self.stream is None:
+            await self.send(message)
+            return
+
+        data = self.stream.chunk(body) if more_body else self.stream.chunk(body) + self.stream.finish()
+        await self.send({"type": "http.response.body", "body": data, "more_body": more_body})
+
@@ -8,11 +8,13 @@ if __name__ == "__main__":
     print(f"Database location: {os.path.join(BASE_DIR, 'sql_app.db')}")
 
 # Configure SQLite database
-SQLALCHEMY_DATABASE_URL = f"sqlite:///{os.path.join(BASE_DIR, 'sql_app.db')}"  # Creates a string that has information about the db we are connecting to
+POOL_SIZE = 20     # Max number of connections; app.admission admits this many requests at once
+# Creates a string that has information about the db we are connecting to; DATABASE_URL points the app at another file, e.g. a benchmark database
+SQLALCHEMY_DATABASE_URL = os.environ.get("DATABASE_URL", f"sqlite:///{os.path.join(BASE_DIR, 'sql_app.db')}")
 engine = create_engine(     # creates the engine object, which is used to connect from our app to the db
     SQLALCHEMY_DATABASE_URL,
     connect_args={"check_same_thread": False},   # allows multiple threads to use connection.  SQLAlchemy handles connection pooling and ensures thread safety.
-    pool_size=20,  # Increase max number of connections
+    pool_size=POOL_SIZE,
     max_overflow=0,  # Disable overflow connections
     pool_recycle=3600,  # Recycle connections after 1 hour
     pool_pre_ping=True  # Enable connection health checks
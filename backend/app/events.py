@@ -0,0 +1,83 @@
+# backend/app/events.py
+
+import asyncio
+import threading
+from typing import Iterable, Optional, Set
+
+from app.schemas.event_schema import ChangeEvent, EventAction, EventTopic
+
+QUEUE_SIZE = 256
+
+
+class Subscription:
+    """
+    One client's bounded queue of change events, owned by the event loop serving that client.
+    When the client falls behind, the oldest events are dropped and counted so it can resync.
+    """
+
+    def __init__(self, topics: Set[EventTopic], queue_size: int):
+        self.topics = topics
+        self.loop = asyncio.get_running_loop()
+        self.queue: "asyncio.Queue[ChangeEvent]" = asyncio.Queue(maxsize=queue_size)
+        self.missed = 0
+
+    def _offer(self, event: ChangeEvent) -> None:
+        """Runs on the subscriber's loop, so it never races with get()"""
+        if self.queue.full():
+            self.queue.get_nowait()
+            self.missed += 1
+        self.queue.put_nowait(event)
+
+    async def get(self) -> ChangeEvent:
+        return await self.queue.get()
+
+    def take_missed(self) -> int:
+        """Number of events dropped since the last call"""
+        missed, self.missed = self.missed, 0
+        return missed
+
+
+class EventBus:
+    """
+    In-process fan-out of change events to subscribers.
+    publish() is safe to call from the threadpool that runs sync route handlers.
+    """
+
+    def __init__(self, queue_size: int = QUEUE_SIZE):
+        self.queue_size = queue_size
+        self._subscriptions: Set[Subscription] = set()
+        self._lock = threading.Lock()
+
+    def subscribe(self, topics: Optional[Iterable[EventTopic]] = None) -> Subscription:
+        """Must be called from the event loop that will consume the subscription"""
+        subscription = Subscription(set(topics or EventTopic), self.queue_size)
+        with self._lock:
+            self._subscriptions.add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        with self._lock:
+            self._subscriptions.discard(subscription)
+
+    def publish(self, event: ChangeEvent) -> None:
+        with self._lock:
+            subscriptions = [s for s in self._subscriptions if event.topic in s.topics]
+        for subscription in subscriptions:
+            try:
+                subscription.loop.call_soon_threadsafe(subscription._offer, event)
+            except RuntimeError:
+                # The client's loop has closed; its handler will unsubscribe on the way out
+                pass
+
+    def __len__(self) -> int:
+        return len(self._subscriptions)
+
+
+bus = EventBus()
+
+
+def publish(topic: EventTopic, action: EventAction, id: int, recipe_id: Optional[int] = None) -> None:
+    """
+    Publishes a change event. Call only once the change has been committed.
+    """
+    bus.publish(ChangeEvent(topic=topic, action=action, id=id, recipe_id=recipe_id))
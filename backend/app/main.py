@@ -1,15 +1,31 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
+from app import cache
+from app.compression import CompressionMiddleware
 from app.database import engine
+from app.metrics import MetricsMiddleware
 from app.models import recipe_model, schedule_model
-from app.routes import recipes_routes, direction_routes, recipe_ingredients_routes, schedule_routes, ingredient_routes, measurement_routes
+from app.services import similarity
+from app.routes import recipes_routes, direction_routes, recipe_ingredients_routes, schedule_routes, ingredient_routes, measurement_routes, events_routes, week_template_routes, metrics_routes, admin_routes
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Worker processes for similar-recipe index builds live as long as the app
+    similarity.start_pool()
+    try:
+        yield
+    finally:
+        similarity.shutdown_pool()
 
 # Create the FastAPI app
 app = FastAPI(
     title = "Turtle Cafeteria",
     summary = "The backend APIs for the Turtle Tray application",
-    version = "0.0.1"
+    version = "0.0.1",
+    lifespan = lifespan
 )
 
 # Add CORSMiddleware to the application
@@ -22,12 +38,22 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["ETag", "X-Next-Cursor"],
 )
 
+# Compress responses the client accepts encoded; routes serving cached bodies compress them once
+app.add_middleware(CompressionMiddleware)
+
+# Added last so it's outermost and times the whole request
+app.add_middleware(MetricsMiddleware)
+
 # Create database tables
 recipe_model.Base.metadata.create_all(bind=engine)
 schedule_model.Base.metadata.create_all(bind=engine)
 
+# Pick up cache versions committed by other workers on the same database file
+cache.watch(engine)
+
 @app.get("/")   # Default endpoint
 def root():
     return {
@@ -47,4 +73,8 @@ app.include_router(direction_routes.router, prefix="/api/v1")
 app.include_router(recipe_ingredients_routes.router, prefix="/api/v1")
 app.include_router(schedule_routes.router, prefix="/api/v1")
 app.include_router(ingredient_routes.router, prefix="/api/v1")
-app.include_router(measurement_routes.router, prefix="/api/v1")
\ No newline at end of file
+app.include_router(measurement_routes.router, prefix="/api/v1")
+app.include_router(week_template_routes.router, prefix="/api/v1")
+app.include_router(events_routes.router, prefix="/api/v1")
+app.include_router(admin_routes.router, prefix="/api/v1")
+app.include_router(metrics_routes.router)
\ No newline at end of file
@@ -0,0 +1,320 @@
+# backend/app/metrics.py
+
+import functools
+import glob
+import inspect
+import os
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+from starlette.datastructures import MutableHeaders
+from starlette.routing import replace_params
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app import queries
+
+# Upper bounds of the latency histogram buckets, in seconds; the last bucket is +Inf
+BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+MAX_SERIES = 256
+
+# Columns of a series row
+COUNT = len(BUCKETS) + 1
+SUM = COUNT + 1
+DB_SECONDS = COUNT + 2
+SERIALIZE_SECONDS = COUNT + 3
+IN_FLIGHT = COUNT + 4
+STATUS = COUNT + 5     # 1xx to 5xx
+QUEUED = STATUS + 5
+QUEUE_WAIT_SECONDS = QUEUED + 1
+REJECTED = QUEUED + 2
+N_COLUMNS = REJECTED + 1
+
+OVERFLOW_SERIES = ("*", "other")
+UNMATCHED_ROUTE = "unmatched"
+
+# Each process writes its series to its own files here, and /metrics sums all of them
+MULTIPROC_DIR_ENV = "METRICS_MULTIPROC_DIR"
+
+
+class MetricsStore:
+    """
+    Preallocated per-route series for one process: a row of histogram buckets and counters per
+    (method, route). Rows are only written from the event loop thread, so updates need no locks.
+    With a directory, rows live in a memory-mapped file other worker processes can read.
+    """
+
+    def __init__(self, directory: Optional[str] = None, pid: Optional[int] = None):
+        self.directory = directory
+        self.pid = pid or os.getpid()
+        self._rows: Dict[Tuple[str, str], int] = {}
+        self._lock = threading.Lock()     # only taken to add a series
+
+        if directory is None:
+            self.values = np.zeros((MAX_SERIES, N_COLUMNS))
+            self._labels = None
+        else:
+            path = os.path.join(directory, f"metrics_{self.pid}")
+            self.values = np.memmap(f"{path}.dat", dtype=np.float64, mode="w+", shape=(MAX_SERIES, N_COLUMNS))
+            self._labels = open(f"{path}.labels", "w")
+
+    def series(self, method: str, route: str) -> np.ndarray:
+        """Row for a (method, route) pair; routes past MAX_SERIES share an overflow row"""
+        row = self._rows.get((method, route))
+        if row is None:
+            row = self._add((method, route))
+        return self.values[row]
+
+    def _add(self, key: Tuple[str, str]) -> int:
+        with self._lock:
+            if key in self._rows:
+                return self._rows[key]
+            if len(self._rows) >= MAX_SERIES - 1:
+                key = OVERFLOW_SERIES
+                if key in self._rows:
+                    return self._rows[key]
+
+            row = len(self._rows)
+            if self._labels is not None:
+                # Written before the row is used, so readers never see values without labels
+                self._labels.write(f"{key[0]} {key[1]}\n")
+                self._labels.flush()
+            self._rows[key] = row
+            return row
+
+    def collect(self) -> Dict[Tuple[str, str], np.ndarray]:
+        """Series of every process sharing the directory, summed, or this process's without one"""
+        if self.directory is None:
+            return {key: self.values[row].copy() for key, row in self._rows.items()}
+        return collect_directory(self.directory)
+
+
+def collect_directory(directory: str) -> Dict[Tuple[str, str], np.ndarray]:
+    totals: Dict[Tuple[str, str], np.ndarray] = {}
+    for labels_path in glob.glob(os.path.join(directory, "metrics_*.labels")):
+        with open(labels_path) as labels_file:
+            # A line without its newline is still being written
+            keys = [tuple(line[:-1].split(" ", 1)) for line in labels_file if line.endswith("\n")]
+        if not keys:
+            continue
+
+        values = np.memmap(
+            f"{labels_path[:-len('.labels')]}.dat", dtype=np.float64, mode="r", shape=(MAX_SERIES, N_COLUMNS)
+        )
+        for row, key in enumerate(keys):
+            totals[key] = totals[key] + values[row] if key in totals else np.array(values[row])
+    return totals
+
+
+_store: Optional[MetricsStore] = None
+_store_lock = threading.Lock()
+
+
+def store() -> MetricsStore:
+    """
+    This process's store, created on first use so each forked worker gets its own files.
+    The multiprocess directory should be emptied before the server starts.
+    """
+    global _store
+    if _store is None or _store.pid != os.getpid():
+        with _store_lock:
+            if _store is None or _store.pid != os.getpid():
+                _store = MetricsStore(os.environ.get(MULTIPROC_DIR_ENV))
+    return _store
+
+
+def observe(series: np.ndarray, seconds: float, status_code: int, db_seconds: float, serialize_seconds: float) -> None:
+    series[bisect_left(BUCKETS, seconds)] += 1
+    series[COUNT] += 1
+    series[SUM] += seconds
+    series[DB_SECONDS] += db_seconds
+    series[SERIALIZE_SECONDS] += serialize_seconds
+    series[STATUS + min(max(status_code // 100, 1), 5) - 1] += 1
+
+
+class RequestTimings:
+    """Time spent serializing the current request; SQL time is tracked by app.queries"""
+    __slots__ = ("serialize", "endpoint_end")
+
+    def __init__(self):
+        self.serialize = 0.0
+        self.endpoint_end: Optional[float] = None
+
+
+def server_timing(stats: queries.QueryStats, timings: RequestTimings, total: float) -> str:
+    return (
+        f'db;dur={stats.seconds * 1000:.2f};desc="{stats.count} queries", '
+        f"serialize;dur={timings.serialize * 1000:.2f}, total;dur={total * 1000:.2f}"
+    )
+
+
+_timings: ContextVar[Optional[RequestTimings]] = ContextVar("request_timings", default=None)
+
+
+def current_timings() -> Optional[RequestTimings]:
+    return _timings.get()
+
+
+@contextmanager
+def serializing() -> Iterator[None]:
+    """Counts the enclosed block as serialization time of the current request"""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        timings = _timings.get()
+        if timings is not None:
+            timings.serialize += time.perf_counter() - start
+
+
+def timed_endpoint(endpoint: Callable) -> Callable:
+    """
+    Wraps a route endpoint to note when it returns; whatever the route does after that
+    (response_model validation and rendering) is serialization
+    """
+    if getattr(endpoint, "_timed", False):
+        return endpoint
+
+    def done() -> None:
+        timings = _timings.get()
+        if timings is not None:
+            timings.endpoint_end = time.perf_counter()
+
+    if inspect.iscoroutinefunction(endpoint):
+        @functools.wraps(endpoint)
+        async def wrapper(*args, **kwargs):
+            try:
+                return await endpoint(*args, **kwargs)
+            finally:
+                done()
+    else:
+        @functools.wraps(endpoint)
+        def wrapper(*args, **kwargs):
+            try:
+                return endpoint(*args, **kwargs)
+            finally:
+                done()
+
+    wrapper._timed = True
+    return wrapper
+
+
+def route_label(scope: Scope) -> str:
+    """
+    Path template of the matched route as clients call it, e.g. /api/v1/recipe/{recipe_id}.
+    Routes of an included router may only know their path within it, so the prefix they were
+    included under is taken from the request path, in front of the route's own path.
+    """
+    route = scope.get("route")
+    path_format = getattr(route, "path_format", None)
+    if not path_format:
+        return UNMATCHED_ROUTE
+    route_path, _ = replace_params(path_format, route.param_convertors, dict(scope.get("path_params", {})))
+    path = scope["path"]
+    prefix = path[:-len(route_path)] if path.endswith(route_path) else ""
+    return prefix + path_format
+
+
+class MetricsMiddleware:
+    """
+    Records latency, status and phase timings per route, and adds a Server-Timing header with the
+    db, serialize and total phases. Outermost, so total covers every other middleware.
+    SQL statements are tracked per request, warning about likely N+1 loads.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        timings = RequestTimings()
+        token = _timings.set(timings)
+        start = time.perf_counter()
+        status_code = 500
+
+        with queries.track(f'{scope["method"]} {scope["path"]}', warn=True) as stats:
+            async def send_timed(message: Message) -> None:
+                nonlocal status_code
+                if message["type"] == "http.response.start":
+                    status_code = message["status"]
+                    MutableHeaders(scope=message).append(
+                        "Server-Timing", server_timing(stats, timings, time.perf_counter() - start)
+                    )
+                await send(message)
+
+            try:
+                await self.app(scope, receive, send_timed)
+            finally:
+                _timings.reset(token)
+                observe(
+                    store().series(scope["method"], route_label(scope)),
+                    time.perf_counter() - start,
+                    status_code,
+                    stats.seconds,
+                    timings.serialize
+                )
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def exposition(totals: Optional[Dict[Tuple[str, str], np.ndarray]] = None) -> str:
+    """
+    All series in the Prometheus text format
+    """
+    if totals is None:
+        totals = store().collect()
+    series = sorted(totals.items())
+    labels = {key: f'method="{_escape(key[0])}",route="{_escape(key[1])}"' for key, _ in series}
+
+    lines: List[str] = [
+        "# HELP http_request_duration_seconds Request latency by route.",
+        "# TYPE http_request_duration_seconds histogram",
+    ]
+    for key, values in series:
+        cumulative = np.cumsum(values[:COUNT])
+        for bound, count in zip((*BUCKETS, "+Inf"), cumulative):
+            lines.append(f'http_request_duration_seconds_bucket{{{labels[key]},le="{bound}"}} {count:.0f}')
+        lines.append(f"http_request_duration_seconds_sum{{{labels[key]}}} {float(values[SUM])}")
+        lines.append(f"http_request_duration_seconds_count{{{labels[key]}}} {values[COUNT]:.0f}")
+
+    lines += [
+        "# HELP http_requests_in_flight Requests being handled by route.",
+        "# TYPE http_requests_in_flight gauge",
+    ]
+    lines += [f"http_requests_in_flight{{{labels[key]}}} {values[IN_FLIGHT]:.0f}" for key, values in series]
+
+    lines += [
+        "# HELP http_requests_queued Requests waiting for admission by route.",
+        "# TYPE http_requests_queued gauge",
+    ]
+    lines += [f"http_requests_queued{{{labels[key]}}} {values[QUEUED]:.0f}" for key, values in series]
+
+    lines += [
+        "# HELP http_responses_total Responses by route and status class.",
+        "# TYPE http_responses_total counter",
+    ]
+    for key, values in series:
+        for status_class in range(5):
+            count = values[STATUS + status_class]
+            if count:
+                lines.append(f'http_responses_total{{{labels[key]},status="{status_class + 1}xx"}} {count:.0f}')
+
+    for name, column, help_text in [
+        ("http_request_db_seconds_total", DB_SECONDS, "Time spent executing SQL by route."),
+        ("http_request_serialize_seconds_total", SERIALIZE_SECONDS, "Time spent serializing responses by route."),
+        ("http_request_queue_wait_seconds_total", QUEUE_WAIT_SECONDS, "Time spent waiting for admission by route."),
+        ("http_requests_rejected_total", REJECTED, "Requests shed by admission control by route."),
+    ]:
+        lines += [f"# HELP {name} {help_text}", f"# TYPE {name} counter"]
+        lines += [f"{name}{{{labels[key]}}} {float(values[column])}" for key, values in series]
+
+    return "\n".join(lines) + "\n"
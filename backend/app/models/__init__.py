@@ -2,9 +2,11 @@
 
 from app.models.base import Base
 from app.models.recipe_model import Recipe, RecipeIngredient, Direction
-from app.models.schedule_model import Schedule
+from app.models.schedule_model import Schedule, ScheduleDay, WeekTemplate, WeekTemplateEntry
 from app.models.measurement_model import MeasurementUnit, UnitConversion, UnitCategory
 from app.models.ingredient_model import Ingredient, IngredientCategory
+from app.models.cache_model import CacheVersion
+from app.models.recipe_document_model import RecipeDocument
 
 __all__ = [
     'Base',
@@ -12,9 +14,14 @@ __all__ = [
     'RecipeIngredient',
     'Direction',
     'Schedule',
+    'ScheduleDay',
+    'WeekTemplate',
+    'WeekTemplateEntry',
     'MeasurementUnit',
     'UnitConversion',
     'UnitCategory',
     'Ingredient',
-    'IngredientCategory'
+    'IngredientCategory',
+    'CacheVersion',
+    'RecipeDocument'
 ]
\ No newline at end of file
@@ -0,0 +1,15 @@
+# backend/app/models/cache_model.py
+
+from sqlalchemy.orm import Mapped, mapped_column
+from app.models.base import Base
+
+class CacheVersion(Base):
+    """
+    Version of a cached namespace, e.g. "ingredients" or "recipe:12", shared by every worker.
+    Versions come from one increasing sequence, so workers can ask for everything changed since
+    the highest version they've seen.
+    """
+    __tablename__ = "cache_versions"
+
+    name: Mapped[str] = mapped_column(primary_key=True)
+    version: Mapped[int] = mapped_column(index=True)
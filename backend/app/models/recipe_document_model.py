@@ -0,0 +1,16 @@
+# backend/app/models/recipe_document_model.py
+
+from sqlalchemy import ForeignKey, LargeBinary
+from sqlalchemy.orm import Mapped, mapped_column
+from app.models.base import Base
+
+class RecipeDocument(Base):
+    """
+    A recipe's full detail response (directions, ingredients and units) serialized to JSON.
+    Rewritten in the same transaction as any change to the recipe, so reads need no ORM work.
+    """
+    __tablename__ = "recipe_documents"
+
+    recipe_id: Mapped[int] = mapped_column(ForeignKey("recipes.id", ondelete="CASCADE"), primary_key=True)
+    version: Mapped[int]        # times the document has been regenerated
+    body: Mapped[bytes] = mapped_column(LargeBinary)
@@ -1,6 +1,6 @@
 # backend/app/models/recipe_model.py
 
-from typing import List
+from typing import List, Optional
 from sqlalchemy import Text, ForeignKey, UniqueConstraint
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from app.models.base import Base
@@ -37,6 +37,12 @@ class Recipe(Base):
         back_populates="recipe",
         cascade="all, delete-orphan"
     )
+    # Week templates can't refer to a deleted recipe
+    template_entries: Mapped[List["WeekTemplateEntry"]] = relationship(
+        "WeekTemplateEntry",
+        back_populates="recipe",
+        cascade="all, delete-orphan"
+    )
 
 class Direction(Base):
     """
@@ -71,8 +77,15 @@ class RecipeIngredient(Base):
     ingredient_id: Mapped[int] = mapped_column(ForeignKey("ingredients.id"))
     quantity: Mapped[float] = mapped_column()
     unit_id: Mapped[int] = mapped_column(ForeignKey("measurement_units.id"))
+    # Quantity normalized to the unit category's base unit (ml, g, pc) for SQL aggregation.
+    # Null when the unit has no conversion path to a base unit.
+    base_quantity: Mapped[Optional[float]] = mapped_column(nullable=True)
+    # Named like the migration's key so it can be dropped on databases built with create_all
+    base_unit_id: Mapped[Optional[int]] = mapped_column(
+        ForeignKey("measurement_units.id", name="fk_recipe_ingredients_base_unit_id"), nullable=True
+    )
 
     # Relationship to recipe
     recipe: Mapped["Recipe"] = relationship("Recipe", back_populates="recipe_ingredients")
     ingredient: Mapped["Ingredient"] = relationship("Ingredient", back_populates="recipe_ingredients")
-    unit: Mapped["MeasurementUnit"] = relationship("MeasurementUnit")
\ No newline at end of file
+    unit: Mapped["MeasurementUnit"] = relationship("MeasurementUnit", foreign_keys=[unit_id])
\ No newline at end of file
@@ -1,9 +1,10 @@
 # backend/app/models/schedule_model.py
 
-from typing import Optional
+from typing import List, Optional, Tuple
 from datetime import date
 from enum import Enum as PyEnum
-from sqlalchemy import Text, ForeignKey, Date, CheckConstraint, Enum
+from sqlalchemy import Text, ForeignKey, Date, CheckConstraint, Enum, Index, DDL, event, select, table, column
+from sqlalchemy import and_, func, literal, or_, tuple_
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from app.models.base import Base
 
@@ -29,8 +30,161 @@ class Schedule(Base):
 
     # Relationship to recipes
     recipe: Mapped["Recipe"] = relationship("Recipe", back_populates="schedules")
+    # One row per covered day, rebuilt whenever the dates change
+    days: Mapped[List["ScheduleDay"]] = relationship(
+        "ScheduleDay",
+        back_populates="schedule",
+        cascade="all, delete-orphan"
+    )
 
     # Add constraints to ensure end_date >= start_date
+    # Indexes cover calendar overlap queries (start_date <= :end AND end_date >= :start),
+    # and (start_date, id) serves date ranges in order without sorting them
     __table_args__ = (
         CheckConstraint('end_date >= start_date', name='valid_date_range'),
-    )
\ No newline at end of file
+        Index('ix_schedules_start_date_end_date', 'start_date', 'end_date'),
+        Index('ix_schedules_end_date', 'end_date'),
+        Index('ix_schedules_start_date_id', 'start_date', 'id'),
+    )
+
+
+class ScheduleDay(Base):
+    """
+    Materialized calendar index with one row per (day, schedule).
+    Lets day, week and month views read a plain range of the primary key.
+    """
+    __tablename__ = "schedule_days"
+
+    day: Mapped[date] = mapped_column(Date, primary_key=True)
+    schedule_id: Mapped[int] = mapped_column(ForeignKey("schedules.id", ondelete="CASCADE"), primary_key=True, index=True)
+
+    schedule: Mapped["Schedule"] = relationship("Schedule", back_populates="days")
+
+
+class WeekTemplate(Base):
+    """
+    Saved week plan that can be applied to any week.
+    Entries are placed by day offset from the week's first day.
+    """
+    __tablename__ = "week_templates"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    name: Mapped[str] = mapped_column(unique=True)
+    description: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+
+    entries: Mapped[List["WeekTemplateEntry"]] = relationship(
+        "WeekTemplateEntry",
+        back_populates="template",
+        cascade="all, delete-orphan",
+        order_by="(WeekTemplateEntry.day_offset, WeekTemplateEntry.id)"
+    )
+
+
+class WeekTemplateEntry(Base):
+    """
+    One recipe in a week template, starting day_offset days into the week and lasting duration_days.
+    """
+    __tablename__ = "week_template_entries"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    template_id: Mapped[int] = mapped_column(ForeignKey("week_templates.id", ondelete="CASCADE"), index=True)
+    recipe_id: Mapped[int] = mapped_column(ForeignKey("recipes.id"))
+    day_offset: Mapped[int] = mapped_column()
+    duration_days: Mapped[int] = mapped_column(default=1)
+    meal_type: Mapped[Optional[MealType]] = mapped_column(Enum(MealType))
+    notes: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+
+    template: Mapped["WeekTemplate"] = relationship("WeekTemplate", back_populates="entries")
+    recipe: Mapped["Recipe"] = relationship("Recipe", back_populates="template_entries")
+
+    __table_args__ = (
+        CheckConstraint('day_offset BETWEEN 0 AND 6', name='valid_day_offset'),
+        CheckConstraint('duration_days >= 1', name='valid_duration'),
+    )
+
+
+# R*Tree over schedule date ranges as integer Julian days, kept in sync by triggers.
+# Overlap queries on it touch only matching rows, however much history builds up.
+schedule_intervals = table(
+    "schedule_intervals",
+    column("id"),
+    column("start_day"),
+    column("end_day"),
+)
+
+_JULIAN_DAY_OFFSET = 1721424    # date.toordinal() + offset == CAST(julianday(date) AS INTEGER)
+
+_schedule_interval_ddl = [
+    "CREATE VIRTUAL TABLE IF NOT EXISTS schedule_intervals USING rtree_i32(id, start_day, end_day)",
+    """
+    CREATE TRIGGER IF NOT EXISTS schedule_intervals_insert AFTER INSERT ON schedules BEGIN
+        INSERT INTO schedule_intervals (id, start_day, end_day)
+        VALUES (new.id, CAST(julianday(new.start_date) AS INTEGER), CAST(julianday(new.end_date) AS INTEGER));
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS schedule_intervals_update AFTER UPDATE OF start_date, end_date ON schedules BEGIN
+        UPDATE schedule_intervals
+        SET start_day = CAST(julianday(new.start_date) AS INTEGER), end_day = CAST(julianday(new.end_date) AS INTEGER)
+        WHERE id = new.id;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS schedule_intervals_delete AFTER DELETE ON schedules BEGIN
+        DELETE FROM schedule_intervals WHERE id = old.id;
+    END
+    """,
+]
+for statement in _schedule_interval_ddl:
+    event.listen(Schedule.__table__, "after_create", DDL(statement).execute_if(dialect="sqlite"))
+event.listen(
+    Schedule.__table__,
+    "before_drop",
+    DDL("DROP TABLE IF EXISTS schedule_intervals").execute_if(dialect="sqlite")
+)
+
+
+def julian_day(day: date) -> int:
+    return day.toordinal() + _JULIAN_DAY_OFFSET
+
+
+def overlapping(start_date: date, end_date: date):
+    """
+    Filter for schedules overlapping a date range, resolved through the R*Tree
+    """
+    return Schedule.id.in_(
+        select(schedule_intervals.c.id).where(
+            schedule_intervals.c.start_day <= julian_day(end_date),
+            schedule_intervals.c.end_day >= julian_day(start_date)
+        )
+    )
+
+
+def overlapping_in_order(start_date: date, end_date: date, after: Optional[Tuple[date, int]] = None):
+    """
+    The same filter as overlapping(), for queries ordered by (start_date, id), optionally resuming
+    strictly after a (start_date, id) keyset cursor: schedules starting within the range, plus those
+    the R*Tree finds starting earlier and running into it. The ix_schedules_start_date_id scan starts
+    at the cursor or the earliest of those, so rows come out already in order and a LIMIT stops the
+    scan early, instead of the whole range being read and sorted for every page.
+    """
+    running_into = and_(
+        schedule_intervals.c.start_day < julian_day(start_date),
+        schedule_intervals.c.end_day >= julian_day(start_date)
+    )
+    if after is not None:
+        lower_bound = tuple_(Schedule.start_date, Schedule.id) > tuple_(*after)
+    else:
+        # Julian day numbers start at noon, so +0.5 gives the date itself
+        earliest_start = select(
+            func.coalesce(func.date(func.min(schedule_intervals.c.start_day) + 0.5), literal(start_date, Date))
+        ).where(running_into).scalar_subquery()
+        lower_bound = Schedule.start_date >= earliest_start
+    return and_(
+        lower_bound,
+        Schedule.start_date <= end_date,
+        or_(
+            Schedule.start_date >= start_date,
+            Schedule.id.in_(select(schedule_intervals.c.id).where(running_into))
+        )
+    )
@@ -0,0 +1,124 @@
+# backend/app/queries.py
+
+import functools
+import logging
+import re
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app import slow_queries
+
+logger = logging.getLogger(__name__)
+
+# A request running one statement shape more often than this is probably loading lazily in a loop
+REPEAT_WARNING_THRESHOLD = 10
+
+_WHITESPACE = re.compile(r"\s+")
+_PLACEHOLDER_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+_NUMBER = re.compile(r"\b\d+(?:\.\d+)?\b")
+_STRING = re.compile(r"'(?:[^']|'')*'")
+
+
+@functools.lru_cache(maxsize=2048)
+def fingerprint(statement: str) -> str:
+    """
+    Shape of a statement: literals and IN lists of any length collapse to a single placeholder
+    """
+    shape = _STRING.sub("?", statement)
+    shape = _NUMBER.sub("?", shape)
+    shape = _PLACEHOLDER_LIST.sub("(?)", shape)
+    return _WHITESPACE.sub(" ", shape).strip()
+
+
+class QueryStats:
+    """
+    Statements run while tracking: count, total time and executions per statement shape.
+    Nested trackers also report to their parent, so a test can total several requests.
+    """
+
+    def __init__(self, name: Optional[str] = None, parent: Optional["QueryStats"] = None, warn: bool = False):
+        self.name = name
+        self.parent = parent
+        self.warn = warn
+        self.count = 0
+        self.seconds = 0.0
+        self.fingerprints: Dict[str, int] = {}
+
+    def record(self, statement: str, seconds: float) -> None:
+        shape = fingerprint(statement)
+        stats: Optional[QueryStats] = self
+        while stats is not None:
+            stats.count += 1
+            stats.seconds += seconds
+            executions = stats.fingerprints.get(shape, 0) + 1
+            stats.fingerprints[shape] = executions
+            if stats.warn and executions == REPEAT_WARNING_THRESHOLD + 1:
+                logger.warning(
+                    "Possible N+1: %s ran the same statement more than %d times: %s",
+                    stats.name or "request", REPEAT_WARNING_THRESHOLD, shape
+                )
+            stats = stats.parent
+
+    def repeated(self, threshold: int = 1) -> List[Tuple[str, int]]:
+        """Statement shapes run more than threshold times, most frequent first"""
+        return sorted(
+            ((shape, executions) for shape, executions in self.fingerprints.items() if executions > threshold),
+            key=lambda item: -item[1]
+        )
+
+    def summary(self) -> str:
+        lines = [f"{self.count} queries in {self.seconds * 1000:.2f} ms"]
+        lines += [
+            f"  {executions}x {shape}"
+            for shape, executions in sorted(self.fingerprints.items(), key=lambda item: -item[1])
+        ]
+        return "\n".join(lines)
+
+
+_stats: ContextVar[Optional[QueryStats]] = ContextVar("query_stats", default=None)
+
+
+def current() -> Optional[QueryStats]:
+    return _stats.get()
+
+
+@contextmanager
+def track(name: Optional[str] = None, warn: bool = False) -> Iterator[QueryStats]:
+    """
+    Records the statements run in the current context (including the threadpool running sync
+    route handlers) until the block exits
+    """
+    stats = QueryStats(name, parent=_stats.get(), warn=warn)
+    token = _stats.set(stats)
+    try:
+        yield stats
+    finally:
+        _stats.reset(token)
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _start_query(conn, cursor, statement, parameters, context, executemany) -> None:
+    conn.info.setdefault("query_start", []).append(time.perf_counter())
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _end_query(conn, cursor, statement, parameters, context, executemany) -> None:
+    elapsed = time.perf_counter() - conn.info["query_start"].pop()
+    stats = _stats.get()
+    if stats is not None:
+        stats.record(statement, elapsed)
+    if elapsed >= slow_queries.THRESHOLD_SECONDS:
+        slow_queries.record(
+            cursor, conn.dialect.name, statement, parameters, elapsed, executemany, stats.name if stats else None
+        )
+
+
+@event.listens_for(Engine, "handle_error")
+def _fail_query(context) -> None:
+    if context.connection is not None and context.connection.info.get("query_start"):
+        context.connection.info["query_start"].pop()
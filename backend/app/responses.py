@@ -0,0 +1,180 @@
+# backend/app/responses.py
+
+from contextvars import ContextVar
+from datetime import date
+from typing import Any, Callable, Mapping, Optional, Tuple
+
+import msgpack
+import orjson
+from fastapi import Request, Response, status
+from pydantic import TypeAdapter
+
+from app import cache
+from app.metrics import serializing
+from app.compression import MINIMUM_SIZE, compress, negotiate
+
+
+JSON_MEDIA_TYPE = "application/json"
+MSGPACK_MEDIA_TYPE = "application/msgpack"
+
+# Set per request by routing.MsgPackRoute when the client accepts MessagePack over JSON
+msgpack_requested: ContextVar[bool] = ContextVar("msgpack_requested", default=False)
+
+
+def render_json(content: Any) -> bytes:
+    return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+
+
+def _msgpack_default(value: Any) -> Any:
+    if isinstance(value, date):
+        return value.isoformat()
+    raise TypeError(f"Cannot serialize {type(value).__name__} to MessagePack")
+
+
+def render_msgpack(content: Any) -> bytes:
+    return msgpack.packb(content, default=_msgpack_default)
+
+
+def json_to_msgpack(body: bytes) -> bytes:
+    return msgpack.packb(orjson.loads(body))
+
+
+class MsgPackResponse(Response):
+    """
+    MessagePack response with the same structure as the JSON one; dates are ISO strings.
+    """
+    media_type = MSGPACK_MEDIA_TYPE
+
+    def render(self, content: Any) -> bytes:
+        return render_msgpack(content)
+
+
+class ORJSONResponse(Response):
+    """
+    JSON response rendered with orjson, or MessagePack when the client asked for it.
+    For plain dicts and lists built from trusted column rows; dates and enums serialize natively.
+    """
+    media_type = JSON_MEDIA_TYPE
+
+    def render(self, content: Any) -> bytes:
+        with serializing():
+            if msgpack_requested.get():
+                self.media_type = MSGPACK_MEDIA_TYPE
+                return render_msgpack(content)
+            return render_json(content)
+
+
+def orm_json(adapter: TypeAdapter, rows: Any) -> bytes:
+    """
+    Validates ORM objects into the adapter's schema once and dumps them to JSON bytes
+    """
+    return adapter.dump_json(adapter.validate_python(rows, from_attributes=True))
+
+
+def dump(
+    adapter: TypeAdapter,
+    content: Any,
+    status_code: int = 200,
+    headers: Optional[Mapping[str, str]] = None
+) -> Response:
+    """
+    Serializes already-validated content straight to JSON (or MessagePack) bytes with a prebuilt adapter.
+    The schema modules build their adapters once at import, since building one compiles its serializer.
+    Returning a Response skips FastAPI's response_model validation, which would only repeat the work.
+    """
+    with serializing():
+        if msgpack_requested.get():
+            return MsgPackResponse(
+                content=adapter.dump_python(content, mode="json"),
+                status_code=status_code,
+                headers=headers
+            )
+        return Response(
+            content=adapter.dump_json(content),
+            status_code=status_code,
+            headers=headers,
+            media_type=JSON_MEDIA_TYPE
+        )
+
+
+def dump_orm(
+    adapter: TypeAdapter,
+    rows: Any,
+    status_code: int = 200,
+    headers: Optional[Mapping[str, str]] = None
+) -> Response:
+    """
+    Validates ORM objects into the adapter's schema once, then serializes them as dump() does
+    """
+    with serializing():
+        content = adapter.validate_python(rows, from_attributes=True)
+    return dump(adapter, content, status_code, headers)
+
+
+def _opaque_tag(etag: str) -> str:
+    return etag[2:] if etag.startswith("W/") else etag
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    Weak comparison, as If-None-Match uses, so ETags weakened by CompressionMiddleware still match
+    """
+    if not if_none_match:
+        return False
+    etag = _opaque_tag(etag)
+    return if_none_match.strip() == "*" or etag in (_opaque_tag(tag.strip()) for tag in if_none_match.split(","))
+
+
+# Rendered bodies keyed by (ETag, media type, content coding); None is the uncompressed body
+_bodies = cache.LRUCache(maxsize=512)
+
+
+def _cached_body(
+    etag: str,
+    media_type: str,
+    encoding: Optional[str],
+    render: Callable[[], bytes]
+) -> Tuple[bytes, Optional[str]]:
+    key = (etag, media_type, encoding)
+    entry = _bodies.get(key)
+    if entry is None:
+        if encoding is not None:
+            body, _ = _cached_body(etag, media_type, None, render)
+            entry = (compress(body, encoding), encoding) if len(body) >= MINIMUM_SIZE else (body, None)
+        elif media_type == MSGPACK_MEDIA_TYPE:
+            body, _ = _cached_body(etag, JSON_MEDIA_TYPE, None, render)
+            entry = (json_to_msgpack(body), None)
+        else:
+            entry = (render(), None)
+        _bodies.set(key, entry)
+    return entry
+
+
+def cached(
+    request: Request,
+    etag: str,
+    render: Callable[[], bytes],
+    media_type: str = JSON_MEDIA_TYPE
+) -> Response:
+    """
+    Serves a GET whose body is fully determined by its ETag (see cache.etag).
+    A matching If-None-Match gets a 304. Otherwise the body is rendered and compressed at most once
+    per (ETag, media type, encoding), so hot responses are neither re-serialized nor re-compressed.
+    Each media type and negotiated encoding gets its own strong ETag, since their bytes differ.
+    render only runs on a miss and may raise HTTPException as a handler would.
+    JSON bodies are converted to MessagePack when the client asked for it.
+    """
+    if media_type == JSON_MEDIA_TYPE and msgpack_requested.get():
+        media_type = MSGPACK_MEDIA_TYPE
+        etag = f'{etag[:-1]}-msgpack"'
+
+    encoding = negotiate(request.headers.get("accept-encoding"))
+    response_etag = etag if encoding is None else f'{etag[:-1]}-{encoding}"'
+    headers = {"ETag": response_etag, "Cache-Control": "no-cache", "Vary": "Accept-Encoding"}
+    if etag_matches(request.headers.get("if-none-match"), response_etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    body, encoding = _cached_body(etag, media_type, encoding, render)
+    if encoding is not None:
+        headers["Content-Encoding"] = encoding
+    return Response(content=body, headers=headers, media_type=media_type)
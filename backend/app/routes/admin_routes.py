@@ -0,0 +1,44 @@
+# backend/app/routes/admin_routes.py
+
+from fastapi import APIRouter, status, Query
+from typing import List, Optional
+
+from app.schemas import admin_schema
+from app.routing import InstrumentedRoute
+from app import admission, slow_queries
+
+router = APIRouter(
+    prefix="/admin",
+    tags=["Admin"],
+    route_class=InstrumentedRoute
+)
+
+@router.get(
+    "/slow-queries",
+    response_model=List[admin_schema.SlowQuery]
+)
+@admission.priority(None)
+def get_slow_queries(
+    limit: Optional[int] = Query(None, ge=1, le=slow_queries.BUFFER_SIZE),
+    full_scans_only: bool = False
+):
+    """
+    Get a sample of recent slow queries, newest first, with their query plans.
+    - full_scans_only to only show queries whose plan reads a whole table
+    """
+    entries = slow_queries.recent()
+    if full_scans_only:
+        entries = [entry for entry in entries if entry["full_scans"]]
+    return entries[:limit]
+
+@router.delete(
+    "/slow-queries",
+    status_code=status.HTTP_204_NO_CONTENT
+)
+@admission.priority(None)
+def clear_slow_queries():
+    """
+    Empty the in-memory sample of slow queries.  The log file is kept.
+    """
+    slow_queries.clear()
+    return None
@@ -5,11 +5,15 @@ from typing import List
 
 from app.schemas import recipe_schema
 from app.models import recipe_model
+from app import cache, events
+from app.schemas.event_schema import EventTopic, EventAction
 from app.database import get_db
+from app.routing import InstrumentedRoute
 
 router = APIRouter(
     prefix="/direction",
-    tags=["Directions"]
+    tags=["Directions"],
+    route_class=InstrumentedRoute
 )
 
 @router.post(
@@ -44,8 +48,10 @@ def create_direction(
 
     try:
         db.add(db_direction)
+        cache.touch(db, f"recipe:{recipe_id}")
         db.commit()
         db.refresh(db_direction)
+        events.publish(EventTopic.RECIPE, EventAction.UPDATED, recipe_id)
         return db_direction
     except IntegrityError:
         db.rollback()
@@ -123,8 +129,10 @@ def update_direction(
     db_direction.direction_number = direction_update.direction_number
     db_direction.instruction = direction_update.instruction
 
+    cache.touch(db, f"recipe:{db_direction.recipe_id}")
     db.commit()
     db.refresh(db_direction)
+    events.publish(EventTopic.RECIPE, EventAction.UPDATED, db_direction.recipe_id)
     return db_direction
 
 @router.delete(
@@ -145,6 +153,9 @@ def delete_direction(
             detail=f"Direction with id {direction_id} not found"
         )
     
+    recipe_id = db_direction.recipe_id
     db.delete(db_direction)
+    cache.touch(db, f"recipe:{recipe_id}")
     db.commit()
+    events.publish(EventTopic.RECIPE, EventAction.UPDATED, recipe_id)
     return None
\ No newline at end of file
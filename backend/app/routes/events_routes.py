@@ -0,0 +1,89 @@
+import asyncio
+from typing import AsyncIterator, List, Optional
+
+from fastapi import APIRouter, Query, WebSocket, WebSocketDisconnect
+from fastapi.responses import StreamingResponse
+
+from app import events
+from app.schemas.event_schema import EventTopic
+
+router = APIRouter(
+    prefix="/events",
+    tags=["Events"]
+)
+
+KEEPALIVE_SECONDS = 15
+RETRY_MILLISECONDS = 3000
+
+async def _sse_stream(subscription: events.Subscription) -> AsyncIterator[str]:
+    try:
+        yield f"retry: {RETRY_MILLISECONDS}\n\n"
+        while True:
+            try:
+                event = await asyncio.wait_for(subscription.get(), timeout=KEEPALIVE_SECONDS)
+            except asyncio.TimeoutError:
+                yield ": keep-alive\n\n"     # Comment line keeps proxies from closing an idle stream
+                continue
+
+            # Events were dropped while the client lagged; it should refetch what it shows
+            missed = subscription.take_missed()
+            if missed:
+                yield f"event: lagged\ndata: {missed}\n\n"
+            yield f"event: {event.topic.value}\ndata: {event.model_dump_json()}\n\n"
+    finally:
+        events.bus.unsubscribe(subscription)
+
+@router.get(
+    "/",
+    response_class=StreamingResponse,
+    responses={200: {"content": {"text/event-stream": {}}, "description": "Stream of change events"}}
+)
+async def stream_events(
+    topic: Optional[List[EventTopic]] = Query(None, description="Topics to receive, all by default")
+):
+    """
+    Server-Sent Events stream of schedule and recipe changes.
+    Each client has a bounded queue; if it falls behind, the oldest events are dropped
+    and a 'lagged' event carrying the number dropped is sent before the next one.
+    """
+    subscription = events.bus.subscribe(topic)
+    return StreamingResponse(
+        _sse_stream(subscription),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+@router.websocket("/ws")
+async def websocket_events(
+    websocket: WebSocket,
+    topic: Optional[List[EventTopic]] = Query(None)
+):
+    """
+    WebSocket stream of the same change events, sent as JSON messages.
+    """
+    await websocket.accept()
+    subscription = events.bus.subscribe(topic)
+
+    async def forward():
+        while True:
+            event = await subscription.get()
+            missed = subscription.take_missed()
+            if missed:
+                await websocket.send_json({"lagged": missed})
+            await websocket.send_text(event.model_dump_json())
+
+    async def wait_for_disconnect():
+        while (await websocket.receive())["type"] != "websocket.disconnect":
+            pass    # Clients have nothing to send; ignore anything they do
+
+    # Stop forwarding as soon as the client goes away, even if no events are arriving
+    tasks = {asyncio.create_task(forward()), asyncio.create_task(wait_for_disconnect())}
+    try:
+        done, pending = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+        for task in pending:
+            task.cancel()
+        for task in done:
+            if not isinstance(task.exception(), (WebSocketDisconnect, type(None))):
+                raise task.exception()
+    finally:
+        events.bus.unsubscribe(subscription)
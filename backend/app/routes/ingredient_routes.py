@@ -1,6 +1,6 @@
 # backend/app/routes/ingredient_routes.py
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, status
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy import or_
@@ -8,11 +8,16 @@ from typing import List, Optional
 
 from app.schemas import ingredient_schema
 from app.models import ingredient_model, measurement_model
+from app import cache
 from app.database import get_db
+from app.routing import InstrumentedRoute
+from app.responses import cached, render_json
+from app.services import recipe_documents
 
 router = APIRouter(
     prefix="/ingredients",
-    tags=["Ingredients"]
+    tags=["Ingredients"],
+    route_class=InstrumentedRoute
 )
 
 
@@ -53,6 +58,7 @@ def create_ingredient(
     db_ingredient = ingredient_model.Ingredient(**ingredient.model_dump())
     try:
         db.add(db_ingredient)
+        cache.touch(db, "ingredients")
         db.commit()
         db.refresh(db_ingredient)
         return db_ingredient
@@ -70,6 +76,7 @@ def create_ingredient(
     response_model=List[ingredient_schema.Ingredient]
 )
 def get_ingredients(
+    request: Request,
     offset: int=0,
     limit: int=100,
     category: Optional[ingredient_model.IngredientCategory] = None,
@@ -81,9 +88,40 @@ def get_ingredients(
     - offset/limit for pagination
     - category to filter by ingredient category
     - search to filter by name (case-insensitive partial match)
+    Rendered and compressed bodies are cached until an ingredient or unit changes.
     """
+    etag = cache.etag(
+        "ingredients", "units", offset=offset, limit=limit, category=category, search=search
+    )
+    return cached(request, etag, lambda: _render_ingredients(db, offset, limit, category, search))
 
-    query = db.query(ingredient_model.Ingredient)
+def _render_ingredients(
+    db: Session,
+    offset: int,
+    limit: int,
+    category: Optional[ingredient_model.IngredientCategory],
+    search: Optional[str]
+) -> bytes:
+    """
+    Renders a page of the ingredient list to JSON
+    """
+
+    # One joined column query rendered straight to JSON, without ORM objects or response validation
+    unit = measurement_model.MeasurementUnit
+    query = db.query(
+        ingredient_model.Ingredient.name,
+        ingredient_model.Ingredient.preferred_unit_id,
+        ingredient_model.Ingredient.category,
+        ingredient_model.Ingredient.description,
+        ingredient_model.Ingredient.id,
+        unit.name.label("unit_name"),
+        unit.abbreviation.label("unit_abbreviation"),
+        unit.category.label("unit_category"),
+        unit.is_metric.label("unit_is_metric"),
+        unit.is_common.label("unit_is_common")
+    ).join(
+        unit, unit.id == ingredient_model.Ingredient.preferred_unit_id
+    )
 
     if category:
         query = query.filter(ingredient_model.Ingredient.category == category)
@@ -96,7 +134,25 @@ def get_ingredients(
         )
         query = query.filter(search_filter)
 
-    return query.offset(offset).limit(limit).all()
+    rows = query.offset(offset).limit(limit).all()
+    return render_json([
+        {
+            "name": row.name,
+            "preferred_unit_id": row.preferred_unit_id,
+            "category": row.category,
+            "description": row.description,
+            "id": row.id,
+            "preferred_unit": {
+                "name": row.unit_name,
+                "abbreviation": row.unit_abbreviation,
+                "category": row.unit_category,
+                "is_metric": row.unit_is_metric,
+                "is_common": row.unit_is_common,
+                "id": row.preferred_unit_id
+            }
+        }
+        for row in rows
+    ])
 
 
 
@@ -172,6 +228,8 @@ def update_ingredient(
     for key, value in ingredient_update.model_dump().items():
         setattr(db_ingredient, key, value)
 
+    cache.touch(db, "ingredients")
+    recipe_documents.touch_ingredient(db, ingredient_id)    # recipe documents embed the ingredient
     db.commit()
     db.refresh(db_ingredient)
     return db_ingredient
@@ -211,5 +269,6 @@ def delete_ingredient(
         )
     
     db.delete(ingredient)
+    cache.touch(db, "ingredients")
     db.commit()
     return None
\ No newline at end of file
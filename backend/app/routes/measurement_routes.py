@@ -1,16 +1,23 @@
 # backend/app/route/measurement_routes.py
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+import numpy as np
 from sqlalchemy.orm import Session
+from sqlalchemy.exc import IntegrityError
 from typing import List, Optional
 
 from app.schemas import measurement_schema
 from app.models.measurement_model import MeasurementUnit, UnitCategory, UnitConversion
+from app import admission, cache
 from app.database import get_db
+from app.routing import InstrumentedRoute
+from app.responses import cached, orm_json
+from app.services import recipe_documents, unit_conversion
 
 router = APIRouter(
     prefix="/units",
-    tags=["Measurement Units"]
+    tags=["Measurement Units"],
+    route_class=InstrumentedRoute
 )
 
 @router.get(
@@ -18,6 +25,7 @@ router = APIRouter(
     response_model=List[measurement_schema.MeasurementUnit],
 )
 def get_measurement_units(
+    request: Request,
     category: Optional[UnitCategory] = None,
     is_metric: Optional[bool] = None,
     is_common: Optional[bool] = None,
@@ -25,17 +33,194 @@ def get_measurement_units(
 ):
     """
     Gets measurement units with optional filtering.
+    Rendered and compressed bodies are cached until a unit changes.
     """
-    query = db.query(MeasurementUnit)
+    def render() -> bytes:
+        query = db.query(MeasurementUnit)
 
-    if category:
-        query = query.filter(MeasurementUnit.category == category)
-    if is_metric is not None:
-        query = query.filter(MeasurementUnit.is_metric == is_metric)
-    if is_common is not None:
-        query = query.filter(MeasurementUnit.is_common == is_common)
+        if category:
+            query = query.filter(MeasurementUnit.category == category)
+        if is_metric is not None:
+            query = query.filter(MeasurementUnit.is_metric == is_metric)
+        if is_common is not None:
+            query = query.filter(MeasurementUnit.is_common == is_common)
+
+        return orm_json(measurement_schema.MeasurementUnitListAdapter, query.all())
+
+    etag = cache.etag("units", category=category, is_metric=is_metric, is_common=is_common)
+    return cached(request, etag, render)
+
+
+
+@router.get(
+    "/convert",
+    response_model=measurement_schema.UnitConversionResult
+)
+def convert_quantity(
+    quantity: float,
+    from_unit_id: int,
+    to_unit_id: int,
+    db: Session = Depends(get_db)
+):
+    """
+    Converts a quantity between two units of the same category.
+    Conversions not stored directly are resolved through the precomputed conversion matrix.
+    """
+    matrix = unit_conversion.get_matrix(db)
+    for unit_id in (from_unit_id, to_unit_id):
+        if unit_id not in matrix.units:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Measurement unit with id {unit_id} not found"
+            )
+
+    ratio = matrix.ratio(from_unit_id, to_unit_id)
+    if ratio is None:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Cannot convert from unit {from_unit_id} to unit {to_unit_id}"
+        )
+
+    return measurement_schema.UnitConversionResult(
+        quantity=quantity,
+        from_unit_id=from_unit_id,
+        to_unit_id=to_unit_id,
+        ratio=ratio,
+        converted_quantity=quantity * ratio
+    )
+
+
+
+@router.post(
+    "/convert/batch",
+    response_model=measurement_schema.UnitConversionBatchResult
+)
+@admission.priority(admission.Priority.READ)
+def convert_quantities(
+    batch: measurement_schema.UnitConversionBatch,
+    db: Session = Depends(get_db)
+):
+    """
+    Converts many quantities at once.
+    The whole batch is rejected if any item can't be converted.
+    """
+    matrix = unit_conversion.get_matrix(db)
+    converted = matrix.convert_many(batch.quantities, batch.from_unit_ids, batch.to_unit_ids)
+
+    invalid = np.flatnonzero(np.isnan(converted))
+    if len(invalid):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Cannot convert {len(invalid)} item(s), first at indices {invalid[:10].tolist()}"
+        )
+
+    return measurement_schema.UnitConversionBatchResult(converted_quantities=converted.tolist())
+
+
+
+@router.get(
+    "/conversions/",
+    response_model=List[measurement_schema.UnitConversionResponse]
+)
+def get_unit_conversions(
+    db: Session = Depends(get_db)
+):
+    """
+    Gets all stored unit conversions
+    """
+    return db.query(UnitConversion).all()
+
+
+
+@router.post(
+    "/conversions/",
+    response_model=measurement_schema.UnitConversionResponse,
+    status_code=status.HTTP_201_CREATED
+)
+@admission.priority(admission.Priority.BULK)
+def create_unit_conversion(
+    conversion: measurement_schema.UnitConversionCreate,
+    db: Session = Depends(get_db)
+):
+    """
+    Creates a conversion ratio between two units of the same category.
+    Rebuilds the conversion matrix and recipe ingredient base quantities.
+    """
+    units = db.query(MeasurementUnit).filter(
+        MeasurementUnit.id.in_([conversion.from_unit_id, conversion.to_unit_id])
+    ).all()
+    found_ids = {unit.id for unit in units}
+    for unit_id in (conversion.from_unit_id, conversion.to_unit_id):
+        if unit_id not in found_ids:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Measurement unit with id {unit_id} not found"
+            )
     
-    return query.all()
+    if len({unit.category for unit in units}) > 1:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Cannot create a conversion between units of different categories"
+        )
+
+    db_conversion = UnitConversion(**conversion.model_dump())
+    try:
+        db.add(db_conversion)
+        db.flush()
+    except IntegrityError:
+        db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Conversion from unit {conversion.from_unit_id} to unit {conversion.to_unit_id} already exists"
+        )
+
+    # Base quantities are renormalized in the same transaction as the conversion
+    matrix = unit_conversion.load_matrix(db)
+    unit_conversion.refresh_base_quantities(db, matrix)
+    recipe_documents.clear(db)      # documents hold base quantities
+    cache.touch(db, "units")
+    db.commit()
+    db.refresh(db_conversion)
+
+    unit_conversion.install(matrix)
+    return db_conversion
+
+
+
+@router.delete(
+    "/conversions/{conversion_id}",
+    status_code=status.HTTP_204_NO_CONTENT
+)
+@admission.priority(admission.Priority.BULK)
+def delete_unit_conversion(
+    conversion_id: int,
+    db: Session = Depends(get_db)
+):
+    """
+    Deletes a unit conversion.
+    Rebuilds the conversion matrix and recipe ingredient base quantities.
+    """
+    db_conversion = db.query(UnitConversion).filter(
+        UnitConversion.id == conversion_id
+    ).first()
+    if db_conversion is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Unit conversion with id {conversion_id} not found"
+        )
+    
+    db.delete(db_conversion)
+    db.flush()
+
+    # Base quantities are renormalized in the same transaction as the conversion
+    matrix = unit_conversion.load_matrix(db)
+    unit_conversion.refresh_base_quantities(db, matrix)
+    recipe_documents.clear(db)      # documents hold base quantities
+    cache.touch(db, "units")
+    db.commit()
+
+    unit_conversion.install(matrix)
+    return None
 
 
 
@@ -0,0 +1,23 @@
+# backend/app/routes/metrics_routes.py
+
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+
+from app import metrics
+
+router = APIRouter(
+    tags=["Metrics"]
+)
+
+@router.get(
+    "/metrics",
+    response_class=PlainTextResponse
+)
+def get_metrics():
+    """
+    Request metrics of every worker in the Prometheus text format
+    """
+    return PlainTextResponse(
+        metrics.exposition(),
+        media_type="text/plain; version=0.0.4; charset=utf-8"
+    )
@@ -5,11 +5,16 @@ from typing import List
 
 from app.schemas import recipe_schema
 from app.models import recipe_model, ingredient_model, measurement_model
+from app import cache, events
+from app.schemas.event_schema import EventTopic, EventAction
 from app.database import get_db
+from app.routing import InstrumentedRoute
+from app.services import similarity, unit_conversion
 
 router = APIRouter(
     prefix="/recipe_ingredients",
-    tags=["Recipe Ingredients"]
+    tags=["Recipe Ingredients"],
+    route_class=InstrumentedRoute
 )
 
 @router.post(
@@ -57,24 +62,34 @@ def create_recipe_ingredient(
             detail=f"Measurement unit with id {recipe_ingredient.unit_id} not found"
         )
   
+    base_quantity, base_unit_id = unit_conversion.get_matrix(db).to_base(
+        recipe_ingredient.quantity,
+        recipe_ingredient.unit_id
+    )
     db_recipe_ingredient = recipe_model.RecipeIngredient(
         recipe_id = recipe_id,
         ingredient_id = recipe_ingredient.ingredient_id,
         quantity = recipe_ingredient.quantity,
-        unit_id = recipe_ingredient.unit_id
+        unit_id = recipe_ingredient.unit_id,
+        base_quantity = base_quantity,
+        base_unit_id = base_unit_id
     )
 
     try:
         db.add(db_recipe_ingredient)
+        cache.touch(db, f"recipe:{recipe_id}")
         db.commit()
         db.refresh(db_recipe_ingredient)
-        return db_recipe_ingredient
     except IntegrityError as e:
         db.rollback()
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Error creating recipe ingredient.  Possible duplicate entry."
-        )  
+        )
+
+    similarity.refresh_recipe(db, recipe_id)
+    events.publish(EventTopic.RECIPE, EventAction.UPDATED, recipe_id)
+    return db_recipe_ingredient
 
 
 
@@ -181,11 +196,15 @@ def update_recipe_ingredient(
     db_recipe_ingredient.ingredient_id = recipe_ingredient_update.ingredient_id
     db_recipe_ingredient.quantity = recipe_ingredient_update.quantity
     db_recipe_ingredient.unit_id = recipe_ingredient_update.unit_id
+    db_recipe_ingredient.base_quantity, db_recipe_ingredient.base_unit_id = unit_conversion.get_matrix(db).to_base(
+        recipe_ingredient_update.quantity,
+        recipe_ingredient_update.unit_id
+    )
+    cache.touch(db, f"recipe:{db_recipe_ingredient.recipe_id}")
 
     try:
         db.commit()
         db.refresh(db_recipe_ingredient)
-        return db_recipe_ingredient
     except IntegrityError:
         db.rollback()
         raise HTTPException(
@@ -193,6 +212,10 @@ def update_recipe_ingredient(
             detail="Error updating recipe ingredient.  Possible duplicate entry."
         )
 
+    similarity.refresh_recipe(db, db_recipe_ingredient.recipe_id)
+    events.publish(EventTopic.RECIPE, EventAction.UPDATED, db_recipe_ingredient.recipe_id)
+    return db_recipe_ingredient
+
 @router.delete(
     "/{recipe_ingredient_id}",
     status_code=status.HTTP_204_NO_CONTENT
@@ -213,6 +236,10 @@ def delete_recipe_ingredient(
             detail=f"Recipe Ingredient with id {recipe_ingredient_id} not found"
         )
     
+    recipe_id = db_recipe_ingredient.recipe_id
     db.delete(db_recipe_ingredient)
+    cache.touch(db, f"recipe:{recipe_id}")
     db.commit()
+    similarity.refresh_recipe(db, recipe_id)
+    events.publish(EventTopic.RECIPE, EventAction.UPDATED, recipe_id)
     return None
\ No newline at end of file
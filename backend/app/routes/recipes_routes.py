@@ -1,14 +1,20 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, status, Query
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
 
 from app.schemas import recipe_schema
 from app.models import recipe_model
+from app import cache, events
+from app.schemas.event_schema import EventTopic, EventAction
 from app.database import get_db
+from app.routing import InstrumentedRoute
+from app.responses import cached, dump_orm
+from app.services import similarity, recipe_documents, recipe_scaling
 
 router = APIRouter(
     prefix="/recipe",
-    tags=["Recipes"]
+    tags=["Recipes"],
+    route_class=InstrumentedRoute
 )
 
 @router.post(
@@ -34,8 +40,11 @@ def create_recipe(
     )
 
     db.add(db_recipe)       # Add the new recipe to the database session
+    db.flush()              # Assigns the id, so the recipe's document is written in the same commit
+    cache.touch(db, f"recipe:{db_recipe.id}")
     db.commit()             # Commit the transaction to save the recipe
     db.refresh(db_recipe)   # Refresh the recipe object to ensure it contains any database-generated values
+    events.publish(EventTopic.RECIPE, EventAction.CREATED, db_recipe.id)
 
     return db_recipe
 
@@ -53,8 +62,10 @@ def get_recipes(
     offset: number of recipes to offset (for pagination)
     limit: maximum number of recipes to return
     """
-    recipes = db.query(recipe_model.Recipe).offset(offset).limit(limit).all()
-    return recipes
+    recipes = db.query(recipe_model.Recipe).options(
+        *recipe_documents.GRAPH_OPTIONS
+    ).offset(offset).limit(limit).all()
+    return dump_orm(recipe_schema.RecipeListAdapter, recipes)
 
 @router.get(
     "/{recipe_id}",
@@ -62,18 +73,79 @@ def get_recipes(
 )
 def get_recipe(
     recipe_id: int,
+    request: Request,
     db: Session = Depends(get_db)
 ):
     """
-    Retrieves a specific recipe by its ID
+    Retrieves a specific recipe by its ID.
+    The body is the recipe's stored document, rewritten whenever the recipe or one of its
+    ingredients changes; compressed bodies are cached until then or until a unit changes.
     """
-    recipe = db.query(recipe_model.Recipe).filter(recipe_model.Recipe.id == recipe_id).first()
-    if recipe is None:
+    def render() -> bytes:
+        body = recipe_documents.get(db, recipe_id)
+        if body is None:
+            raise HTTPException(
+                status_code = status.HTTP_404_NOT_FOUND,
+                detail=f"Recipe with id {recipe_id} not found"
+            )
+        return body
+
+    etag = cache.etag(f"recipe:{recipe_id}", "units")
+    return cached(request, etag, render)
+
+@router.get(
+    "/{recipe_id}/similar",
+    response_model=List[recipe_schema.SimilarRecipe]
+)
+def get_similar_recipes(
+    recipe_id: int,
+    limit: int = Query(10, ge=1, le=100),
+    db: Session = Depends(get_db)
+):
+    """
+    Retrieves recipes with similar ingredient sets.
+    Similarity is an approximate Jaccard score from the MinHash/LSH index.
+    """
+    recipe_exists = db.query(recipe_model.Recipe).filter(recipe_model.Recipe.id == recipe_id).first() is not None
+    if not recipe_exists:
+        raise HTTPException(
+            status_code = status.HTTP_404_NOT_FOUND,
+            detail=f"Recipe with id {recipe_id} not found"
+        )
+
+    matches = similarity.similar_recipes(db, recipe_id, limit)
+    titles = dict(
+        db.query(recipe_model.Recipe.id, recipe_model.Recipe.title).filter(
+            recipe_model.Recipe.id.in_([match_id for match_id, _ in matches])
+        ).all()
+    )
+    return [
+        recipe_schema.SimilarRecipe(id=match_id, title=titles[match_id], similarity=score)
+        for match_id, score in matches
+        if match_id in titles
+    ]
+
+@router.get(
+    "/{recipe_id}/scaled",
+    response_model=recipe_schema.ScaledRecipe
+)
+def get_scaled_recipe(
+    recipe_id: int,
+    servings: Optional[int] = Query(None, ge=1, description="Servings to scale to, defaults to the recipe's own"),
+    units: Optional[recipe_schema.UnitSystem] = Query(None, description="Unit system to convert quantities to"),
+    db: Session = Depends(get_db)
+):
+    """
+    Retrieves a recipe's ingredients scaled to a number of servings,
+    optionally converted to preferred, metric or imperial units.
+    """
+    scaled = recipe_scaling.scale_recipe(db, recipe_id, servings, units)
+    if scaled is None:
         raise HTTPException(
             status_code = status.HTTP_404_NOT_FOUND,
             detail=f"Recipe with id {recipe_id} not found"
         )
-    return recipe
+    return scaled
 
 @router.put(
     "/{recipe_id}",
@@ -100,8 +172,10 @@ def update_recipe(
     update_data = recipe_updates.model_dump()
     for key, value in update_data.items():          # Update the recipe's attributes for provided fields
         setattr(db_recipe, key, value)
+    cache.touch(db, f"recipe:{recipe_id}", "recipes")
     db.commit()             # Commit the changes
     db.refresh(db_recipe)   # Refresh the recipe object to ensure it's up to date
+    events.publish(EventTopic.RECIPE, EventAction.UPDATED, recipe_id)
 
     return db_recipe
 
@@ -126,6 +200,12 @@ def deleted_recipe(
             detail = f"Recipe with id {recipe_id} not found."
         )
     
+    schedule_ids = [schedule.id for schedule in db_recipe.schedules]
     db.delete(db_recipe)    # Delete the recipe
+    cache.touch(db, f"recipe:{recipe_id}", "recipes", "schedules")     # schedules are deleted by cascade
     db.commit()
+    similarity.remove_recipe(recipe_id)
+    events.publish(EventTopic.RECIPE, EventAction.DELETED, recipe_id)
+    for schedule_id in schedule_ids:
+        events.publish(EventTopic.SCHEDULE, EventAction.DELETED, schedule_id, recipe_id=recipe_id)
     return None
\ No newline at end of file
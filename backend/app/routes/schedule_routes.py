@@ -1,18 +1,80 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Header, Response
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session, joinedload
 from sqlalchemy.exc import IntegrityError
-from typing import List
-from datetime import date
+from typing import List, Literal, Optional, Union
+from datetime import date, timedelta
+import calendar
 
-from app.schemas import schedule_schema
-from app.models import schedule_model, recipe_model
+import orjson
+
+from app.schemas import schedule_schema, recipe_schema
+from app.models import schedule_model, recipe_model, ingredient_model
+from app import admission, cache, events
+from app.schemas.event_schema import EventTopic, EventAction
 from app.database import get_db
+from app.routing import InstrumentedRoute
+from app.responses import ORJSONResponse, dump, etag_matches
+from app.services import shopping_list, schedule_check, ical, schedule_copy
 
 router = APIRouter(
     prefix="/schedule",
-    tags=["Schedules"]
+    tags=["Schedules"],
+    route_class=InstrumentedRoute
+)
+
+# Eager loads the whole recipe graph a full Schedule response serializes, avoiding lazy loads per row
+_full_recipe = joinedload(schedule_model.Schedule.recipe)
+_full_recipe_options = (
+    _full_recipe.selectinload(recipe_model.Recipe.directions),
+    _full_recipe.selectinload(recipe_model.Recipe.recipe_ingredients).options(
+        joinedload(recipe_model.RecipeIngredient.ingredient).joinedload(ingredient_model.Ingredient.preferred_unit),
+        joinedload(recipe_model.RecipeIngredient.unit)
+    ),
 )
 
+# Columns for the lightweight calendar projection, read without building ORM objects
+_calendar_columns = (
+    schedule_model.Schedule.id,
+    schedule_model.Schedule.recipe_id,
+    schedule_model.Schedule.start_date,
+    schedule_model.Schedule.end_date,
+    schedule_model.Schedule.meal_type,
+    schedule_model.Schedule.notes,
+    recipe_model.Recipe.title,
+    recipe_model.Recipe.cooking_time,
+    recipe_model.Recipe.servings,
+)
+
+def _calendar_schedule(row) -> dict:
+    """
+    CalendarSchedule as plain data, for rendering column rows straight to JSON
+    """
+    return {
+        "start_date": row.start_date,
+        "end_date": row.end_date,
+        "meal_type": row.meal_type,
+        "notes": row.notes,
+        "id": row.id,
+        "recipe_id": row.recipe_id,
+        "recipe": {
+            "id": row.recipe_id,
+            "title": row.title,
+            "cooking_time": row.cooking_time,
+            "servings": row.servings
+        }
+    }
+
+def _schedule_days(db_schedule: schedule_model.Schedule) -> List[schedule_model.ScheduleDay]:
+    """
+    Calendar index rows for every day a schedule covers
+    """
+    span = (db_schedule.end_date - db_schedule.start_date).days + 1
+    return [
+        schedule_model.ScheduleDay(day=db_schedule.start_date + timedelta(days=offset))
+        for offset in range(span)
+    ]
+
 @router.post(
     "/recipe/{recipe_id}",
     response_model=schedule_schema.Schedule,
@@ -43,12 +105,14 @@ def create_schedule(
         recipe_id=recipe_id,
         **schedule.model_dump()
     )
+    db_schedule.days = _schedule_days(db_schedule)
 
     try:
         db.add(db_schedule)
+        cache.touch(db, "schedules")
+        db.flush()
+        schedule_id = db_schedule.id
         db.commit()
-        db.refresh(db_schedule)
-        return db_schedule
     except IntegrityError:
         db.rollback()
         raise HTTPException(
@@ -56,6 +120,100 @@ def create_schedule(
             detail="Invalid schedule data.  Check date range constraints."
         )
 
+    events.publish(EventTopic.SCHEDULE, EventAction.CREATED, schedule_id, recipe_id=recipe_id)
+    # Reload with the recipe graph eager loaded, rather than lazy loading it row by row while serializing
+    return db.query(schedule_model.Schedule).options(*_full_recipe_options).filter(
+        schedule_model.Schedule.id == schedule_id
+    ).first()
+
+@router.post(
+    "/copy",
+    response_model=schedule_schema.ScheduleCopyResult,
+    status_code=status.HTTP_201_CREATED
+)
+@admission.priority(admission.Priority.BULK)
+def copy_schedules(
+    copy: schedule_schema.ScheduleCopy,
+    db: Session = Depends(get_db)
+):
+    """
+    Copy every schedule starting within a source range so the range starts on target_start_date,
+    e.g. repeating last week's plan.  All schedules are inserted with a single INSERT ... SELECT
+    in one transaction.
+    """
+    created = schedule_copy.copy_range(db, copy.source_start_date, copy.source_end_date, copy.target_start_date)
+    cache.touch(db, "schedules")
+    db.commit()
+
+    for schedule_id, recipe_id in created:
+        events.publish(EventTopic.SCHEDULE, EventAction.CREATED, schedule_id, recipe_id=recipe_id)
+    return schedule_schema.ScheduleCopyResult(schedule_ids=[schedule_id for schedule_id, _ in created])
+
+@router.get(
+    "/shopping-list",
+    response_model=schedule_schema.ShoppingList,
+    tags=["Calendar"]
+)
+def get_shopping_list(
+    start_date: date = Query(..., description="Start date for the shopping list"),
+    end_date: date = Query(..., description="End date for the shopping list"),
+    db: Session = Depends(get_db)
+):
+    """
+    Get the ingredients needed for every schedule within a date range, grouped by ingredient category.
+    A multi-day schedule is the recipe once per day, as the calendar shows it on each of its days:
+    a recipe scheduled Monday to Wednesday needs its ingredients three times. Only days within the
+    range count, and schedule_count still counts the schedule once.
+    """
+    return shopping_list.build_shopping_list(db, start_date, end_date)
+
+@router.get(
+    "/check",
+    response_model=schedule_schema.ScheduleCheck,
+    tags=["Calendar"]
+)
+def check_schedules(
+    start_date: date = Query(..., description="Start date to check"),
+    end_date: date = Query(..., description="End date to check"),
+    meal_type: Optional[List[schedule_model.MealType]] = Query(None, description="Meal types to check, all by default"),
+    db: Session = Depends(get_db)
+):
+    """
+    Get conflicts (overlapping schedules for the same meal type) and gaps (days with nothing planned
+    for a meal type) within a date range.
+    """
+    return schedule_check.check_schedules(db, start_date, end_date, meal_type)
+
+@router.get(
+    "/feed.ics",
+    response_class=StreamingResponse,
+    responses={
+        200: {"content": {"text/calendar": {}}, "description": "iCalendar feed of schedules"},
+        304: {"description": "Feed unchanged since the ETag given in If-None-Match"}
+    },
+    tags=["Calendar"]
+)
+def get_schedule_feed(
+    start_date: Optional[date] = Query(None, description="Only include schedules ending on or after this date"),
+    end_date: Optional[date] = Query(None, description="Only include schedules starting on or before this date"),
+    if_none_match: Optional[str] = Header(None),
+    db: Session = Depends(get_db)
+):
+    """
+    Get schedules as an iCalendar feed of all-day events, for subscribing from calendar clients.
+    The ETag follows schedule and recipe changes, so polls with If-None-Match get a 304 without reading any rows.
+    """
+    etag = cache.etag("schedules", "recipes", start_date=start_date, end_date=end_date)
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    return StreamingResponse(
+        ical.stream_feed(db, start_date, end_date),
+        media_type="text/calendar; charset=utf-8",
+        headers={**headers, "Content-Disposition": 'inline; filename="turtle-cafeteria.ics"'}
+    )
+
 @router.get(
     "/{schedule_id}",
     response_model=schedule_schema.Schedule
@@ -68,7 +226,7 @@ def get_schedule(
     Get a specific schedule by ID
     """
     schedule = db.query(schedule_model.Schedule).options(
-        joinedload(schedule_model.Schedule.recipe)
+        *_full_recipe_options
     ).filter(
         schedule_model.Schedule.id == schedule_id
     ).first()
@@ -80,27 +238,158 @@ def get_schedule(
         )
     return schedule
 
+RANGE_STREAM_BATCH_SIZE = 500
+
+def _parse_cursor(cursor: str):
+    """
+    Cursors are '<start_date>:<id>' of the last schedule already returned
+    """
+    try:
+        cursor_date, cursor_id = cursor.split(":")
+        return date.fromisoformat(cursor_date), int(cursor_id)
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Invalid cursor {cursor}"
+        )
+
+def _range_query(db: Session, start_date: date, end_date: date, expand: Optional[str], cursor: Optional[str]):
+    if expand == "recipe":
+        query = db.query(schedule_model.Schedule).options(*_full_recipe_options)
+    else:
+        # Joined column query, no ORM objects
+        query = db.query(*_calendar_columns).join(
+            recipe_model.Recipe, recipe_model.Recipe.id == schedule_model.Schedule.recipe_id
+        )
+    # Keyset pagination: resume strictly after the cursor in (start_date, id) order
+    after = _parse_cursor(cursor) if cursor is not None else None
+    query = query.filter(schedule_model.overlapping_in_order(start_date, end_date, after))
+    return query.order_by(
+        schedule_model.Schedule.start_date,
+        schedule_model.Schedule.id
+    )
+
+def _expanded_schedule(row: schedule_model.Schedule, recipes: dict) -> schedule_schema.Schedule:
+    """
+    Schedule response model built around a recipe graph validated once per distinct recipe,
+    since a calendar range repeats the same few recipes many times
+    """
+    recipe = recipes.get(row.recipe_id)
+    if recipe is None:
+        recipe = recipes[row.recipe_id] = recipe_schema.Recipe.model_validate(row.recipe)
+    return schedule_schema.Schedule.model_construct(
+        start_date=row.start_date,
+        end_date=row.end_date,
+        meal_type=row.meal_type,
+        notes=row.notes,
+        id=row.id,
+        recipe_id=row.recipe_id,
+        recipe=recipe
+    )
+
+def _range_line(row, expand: Optional[str], recipes: dict) -> bytes:
+    if expand == "recipe":
+        return _expanded_schedule(row, recipes).model_dump_json().encode() + b"\n"
+    return orjson.dumps(_calendar_schedule(row)) + b"\n"
+
 @router.get(
     "/range/",
-    response_model=List[schedule_schema.Schedule],
+    response_model=Union[List[schedule_schema.CalendarSchedule], List[schedule_schema.Schedule]],
+    responses={200: {"content": {"application/x-ndjson": {}}}},
     tags=["Calendar"]
 )
 def get_schedules_by_date_Range(
     start_date: date = Query(..., description="Start date for schedule query"),
     end_date: date = Query(..., description="End date for schedule query"),
+    expand: Optional[Literal["recipe"]] = Query(None, description="Set to 'recipe' to include full nested recipes"),
+    limit: Optional[int] = Query(None, ge=1, le=1000, description="Maximum number of schedules to return"),
+    cursor: Optional[str] = Query(None, description="X-Next-Cursor header of the previous page"),
+    response_format: Literal["json", "ndjson"] = Query("json", alias="format", description="Set to 'ndjson' to stream one schedule per line"),
     db: Session = Depends(get_db)
 ):
     """
     Get all schedules within a date range (across all recipes)
-    Primary endpoint for calendar view
+    Primary endpoint for calendar view.
+    Returns a lightweight recipe summary per schedule unless expand=recipe is given.
+    Schedules are ordered by (start_date, id). With limit, the X-Next-Cursor header is set when more remain;
+    pass it back as cursor to get the next page.  format=ndjson streams rows as they are read instead.
     """
-    schedules = db.query(schedule_model.Schedule).options(
-        joinedload(schedule_model.Schedule.recipe)
+    query = _range_query(db, start_date, end_date, expand, cursor)
+    if limit is not None:
+        query = query.limit(limit + 1 if response_format == "json" else limit)
+
+    if response_format == "ndjson":
+        def stream():
+            recipes = {}
+            for row in query.yield_per(RANGE_STREAM_BATCH_SIZE):
+                yield _range_line(row, expand, recipes)
+
+        return StreamingResponse(stream(), media_type="application/x-ndjson")
+
+    rows = query.all()
+    headers = {}
+    if limit is not None and len(rows) > limit:
+        rows = rows[:limit]
+        headers["X-Next-Cursor"] = f"{rows[-1].start_date.isoformat()}:{rows[-1].id}"
+
+    if expand == "recipe":
+        recipes = {}
+        return dump(
+            schedule_schema.ScheduleListAdapter,
+            [_expanded_schedule(row, recipes) for row in rows],
+            headers=headers
+        )
+    return ORJSONResponse([_calendar_schedule(row) for row in rows], headers=headers)
+
+@router.get(
+    "/calendar/",
+    response_model=List[schedule_schema.CalendarDay],
+    tags=["Calendar"]
+)
+def get_calendar(
+    view: schedule_schema.CalendarView = Query(..., description="Calendar view to return"),
+    day: date = Query(..., description="Any day within the view"),
+    db: Session = Depends(get_db)
+):
+    """
+    Get schedules grouped by day for the day, week (Sunday to Saturday) or month containing a date.
+    Reads the materialized schedule_days index with a single range scan.
+    """
+    if view == schedule_schema.CalendarView.DAY:
+        first_day, last_day = day, day
+    elif view == schedule_schema.CalendarView.WEEK:
+        first_day = day - timedelta(days=(day.weekday() + 1) % 7)
+        last_day = first_day + timedelta(days=6)
+    else:
+        first_day = day.replace(day=1)
+        last_day = day.replace(day=calendar.monthrange(day.year, day.month)[1])
+
+    rows = db.query(
+        schedule_model.ScheduleDay.day,
+        *_calendar_columns
+    ).select_from(schedule_model.ScheduleDay).join(
+        schedule_model.Schedule, schedule_model.Schedule.id == schedule_model.ScheduleDay.schedule_id
+    ).join(
+        recipe_model.Recipe, recipe_model.Recipe.id == schedule_model.Schedule.recipe_id
     ).filter(
-        schedule_model.Schedule.start_date <= end_date,
-        schedule_model.Schedule.end_date >= start_date
+        schedule_model.ScheduleDay.day >= first_day,
+        schedule_model.ScheduleDay.day <= last_day
+    ).order_by(
+        schedule_model.ScheduleDay.day,
+        schedule_model.Schedule.id
     ).all()
-    return schedules
+
+    # Every day in the view is present, even with nothing scheduled
+    days = {
+        first_day + timedelta(days=offset): []
+        for offset in range((last_day - first_day).days + 1)
+    }
+    for row in rows:
+        days[row.day].append(_calendar_schedule(row))
+    return ORJSONResponse([
+        {"day": calendar_day, "schedules": schedules}
+        for calendar_day, schedules in days.items()
+    ])
 
 @router.put(
     "/{schedule_id}",
@@ -125,18 +414,27 @@ def update_schedule(
         )
     
     # Update fields
-    for key, value in schedule_update.model_dump(exclude_unset=True).items():
+    update_data = schedule_update.model_dump(exclude_unset=True)
+    for key, value in update_data.items():
         setattr(db_schedule, key, value)
 
+    # Rebuild the calendar index rows if the dates moved
+    if "start_date" in update_data or "end_date" in update_data:
+        db_schedule.days = _schedule_days(db_schedule)
+
     try:
+        cache.touch(db, "schedules")
         db.commit()
         db.refresh(db_schedule)
-        return db_schedule
     except IntegrityError:
+        db.rollback()
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Invalid schedule data.  Check date range constraints."
         )
+
+    events.publish(EventTopic.SCHEDULE, EventAction.UPDATED, schedule_id, recipe_id=db_schedule.recipe_id)
+    return db_schedule
     
 @router.delete(
     "/{schedule_id}",
@@ -159,6 +457,9 @@ def delete_schedule(
             detail=f"Schedule with id {schedule_id} not found"
         )
     
-    db.delete(db_schedule)
+    recipe_id = db_schedule.recipe_id
+    db.delete(db_schedule)     # Calendar index rows are removed by the days cascade
+    cache.touch(db, "schedules")
     db.commit()
+    events.publish(EventTopic.SCHEDULE, EventAction.DELETED, schedule_id, recipe_id=recipe_id)
     return None
\ No newline at end of file
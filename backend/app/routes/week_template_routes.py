@@ -0,0 +1,184 @@
+from fastapi import APIRouter, Depends, HTTPException, status, Query
+from sqlalchemy.orm import Session, selectinload
+from sqlalchemy.exc import IntegrityError
+from typing import List
+from datetime import date
+
+from app.schemas import schedule_schema
+from app.schemas.event_schema import EventTopic, EventAction
+from app.models import schedule_model, recipe_model
+from app import admission, cache, events
+from app.database import get_db
+from app.routing import InstrumentedRoute
+from app.services import schedule_copy
+
+router = APIRouter(
+    prefix="/week-templates",
+    tags=["Week Templates"],
+    route_class=InstrumentedRoute
+)
+
+def _get_template_or_404(db: Session, template_id: int) -> schedule_model.WeekTemplate:
+    db_template = db.query(schedule_model.WeekTemplate).options(
+        selectinload(schedule_model.WeekTemplate.entries)
+    ).filter(
+        schedule_model.WeekTemplate.id == template_id
+    ).first()
+
+    if db_template is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Week template with id {template_id} not found"
+        )
+    return db_template
+
+def _commit_template(db: Session, db_template: schedule_model.WeekTemplate) -> schedule_model.WeekTemplate:
+    try:
+        db.commit()
+    except IntegrityError:
+        db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Week template named {db_template.name} already exists"
+        )
+    return _get_template_or_404(db, db_template.id)
+
+@router.post(
+    "/",
+    response_model=schedule_schema.WeekTemplate,
+    status_code=status.HTTP_201_CREATED
+)
+def create_week_template(
+    template: schedule_schema.WeekTemplateCreate,
+    db: Session = Depends(get_db)
+):
+    """
+    Create a week template from a list of entries
+    """
+    # Verify every recipe exists
+    recipe_ids = {entry.recipe_id for entry in template.entries}
+    found_ids = {
+        recipe_id for recipe_id, in db.query(recipe_model.Recipe.id).filter(recipe_model.Recipe.id.in_(recipe_ids))
+    }
+    missing_ids = sorted(recipe_ids - found_ids)
+    if missing_ids:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Recipe with id {missing_ids[0]} not found"
+        )
+
+    db_template = schedule_model.WeekTemplate(
+        name=template.name,
+        description=template.description,
+        entries=[schedule_model.WeekTemplateEntry(**entry.model_dump()) for entry in template.entries]
+    )
+    db.add(db_template)
+    return _commit_template(db, db_template)
+
+@router.post(
+    "/from-week",
+    response_model=schedule_schema.WeekTemplate,
+    status_code=status.HTTP_201_CREATED
+)
+def create_week_template_from_week(
+    template: schedule_schema.WeekTemplateBase,
+    start_date: date = Query(..., description="First day of the week to save"),
+    db: Session = Depends(get_db)
+):
+    """
+    Save the schedules starting within the 7 days from start_date as a week template.
+    Entries are copied with a single INSERT ... SELECT.
+    """
+    db_template = schedule_model.WeekTemplate(
+        name=template.name,
+        description=template.description
+    )
+    db.add(db_template)
+    try:
+        db.flush()
+    except IntegrityError:
+        db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Week template named {template.name} already exists"
+        )
+
+    schedule_copy.save_week(db, db_template.id, start_date)
+    return _commit_template(db, db_template)
+
+@router.get(
+    "/",
+    response_model=List[schedule_schema.WeekTemplate]
+)
+def get_week_templates(
+    db: Session = Depends(get_db)
+):
+    """
+    Get all week templates
+    """
+    return db.query(schedule_model.WeekTemplate).options(
+        selectinload(schedule_model.WeekTemplate.entries)
+    ).order_by(schedule_model.WeekTemplate.name).all()
+
+@router.get(
+    "/{template_id}",
+    response_model=schedule_schema.WeekTemplate
+)
+def get_week_template(
+    template_id: int,
+    db: Session = Depends(get_db)
+):
+    """
+    Get a specific week template by ID
+    """
+    return _get_template_or_404(db, template_id)
+
+@router.post(
+    "/{template_id}/apply",
+    response_model=schedule_schema.ScheduleCopyResult,
+    status_code=status.HTTP_201_CREATED
+)
+@admission.priority(admission.Priority.BULK)
+def apply_week_template(
+    template_id: int,
+    start_date: date = Query(..., description="First day of the week to schedule the template in"),
+    db: Session = Depends(get_db)
+):
+    """
+    Schedule every entry of a week template in the week starting on start_date.
+    All schedules are inserted with a single INSERT ... SELECT in one transaction.
+    """
+    template_exists = db.query(schedule_model.WeekTemplate.id).filter(
+        schedule_model.WeekTemplate.id == template_id
+    ).first() is not None
+
+    if not template_exists:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Week template with id {template_id} not found"
+        )
+
+    created = schedule_copy.apply_template(db, template_id, start_date)
+    cache.touch(db, "schedules")
+    db.commit()
+
+    for schedule_id, recipe_id in created:
+        events.publish(EventTopic.SCHEDULE, EventAction.CREATED, schedule_id, recipe_id=recipe_id)
+    return schedule_schema.ScheduleCopyResult(schedule_ids=[schedule_id for schedule_id, _ in created])
+
+@router.delete(
+    "/{template_id}",
+    status_code=status.HTTP_204_NO_CONTENT
+)
+def delete_week_template(
+    template_id: int,
+    db: Session = Depends(get_db)
+):
+    """
+    Delete a week template.  Schedules created from it are kept.
+    """
+    db_template = _get_template_or_404(db, template_id)
+
+    db.delete(db_template)
+    db.commit()
+    return None
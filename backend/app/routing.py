@@ -0,0 +1,190 @@
+# backend/app/routing.py
+
+import time
+from typing import Any, Callable, Coroutine, Optional
+
+import msgpack
+from fastapi import HTTPException, Request, Response, status
+from fastapi.routing import APIRoute
+from starlette.datastructures import MutableHeaders
+from starlette.responses import StreamingResponse
+from starlette.types import Receive, Scope, Send
+
+from app import admission, cache, metrics
+from app.metrics import IN_FLIGHT, QUEUE_WAIT_SECONDS, QUEUED, REJECTED
+from app.responses import JSON_MEDIA_TYPE, MSGPACK_MEDIA_TYPE, json_to_msgpack, msgpack_requested
+
+MSGPACK_MEDIA_TYPES = (MSGPACK_MEDIA_TYPE, "application/x-msgpack")
+
+
+def _media_type(value: Optional[str]) -> str:
+    return (value or "").split(";", 1)[0].strip().lower()
+
+
+def accepts_msgpack(accept: Optional[str]) -> bool:
+    """
+    Whether an Accept header ranks MessagePack at least as high as JSON.
+    Wildcards count for JSON only, so clients have to ask for MessagePack explicitly.
+    """
+    if not accept:
+        return False
+
+    msgpack_quality, json_quality = 0.0, 0.0
+    for part in accept.split(","):
+        media_type, _, params = part.strip().partition(";")
+        media_type = media_type.strip().lower()
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                continue
+        if media_type in MSGPACK_MEDIA_TYPES:
+            msgpack_quality = max(msgpack_quality, quality)
+        elif media_type in (JSON_MEDIA_TYPE, "application/*", "*/*"):
+            json_quality = max(json_quality, quality)
+    return msgpack_quality > 0 and msgpack_quality >= json_quality
+
+
+class MsgPackRequest(Request):
+    """
+    Request with a MessagePack body.
+    FastAPI's body parsing sees it as JSON that's already decoded, so the usual schemas validate it.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        headers = MutableHeaders(raw=list(self.scope["headers"]))
+        headers["content-type"] = JSON_MEDIA_TYPE
+        self._headers = headers
+
+    async def json(self) -> Any:
+        if not hasattr(self, "_json"):
+            self._json = msgpack.unpackb(await self.body(), timestamp=3)
+        return self._json
+
+
+def _to_msgpack(response: Response) -> None:
+    """Re-encodes a rendered JSON response (FastAPI's response_model path) as MessagePack"""
+    response.body = json_to_msgpack(response.body)
+    response.media_type = MSGPACK_MEDIA_TYPE
+    response.headers["content-type"] = MSGPACK_MEDIA_TYPE
+    response.headers["content-length"] = str(len(response.body))
+
+
+class MsgPackRoute(APIRoute):
+    """
+    Route accepting MessagePack request bodies (Content-Type: application/msgpack) and answering
+    in MessagePack when the client prefers it (Accept: application/msgpack).
+    The fast response helpers in app.responses render MessagePack directly; anything else rendered
+    as JSON is re-encoded. Streams and error responses keep their own formats.
+    """
+
+    def get_route_handler(self) -> Callable[[Request], Coroutine[Any, Any, Response]]:
+        handler = super().get_route_handler()
+
+        async def route_handler(request: Request) -> Response:
+            if _media_type(request.headers.get("content-type")) in MSGPACK_MEDIA_TYPES:
+                request = MsgPackRequest(request.scope, request.receive)
+
+            wants_msgpack = accepts_msgpack(request.headers.get("accept"))
+            token = msgpack_requested.set(wants_msgpack)
+            try:
+                response = await handler(request)
+            finally:
+                msgpack_requested.reset(token)
+
+            if isinstance(response, StreamingResponse):
+                return response
+            media_type = _media_type(response.headers.get("content-type"))
+            if wants_msgpack and media_type == JSON_MEDIA_TYPE and response.body:
+                _to_msgpack(response)
+                media_type = MSGPACK_MEDIA_TYPE
+            if media_type in (JSON_MEDIA_TYPE, MSGPACK_MEDIA_TYPE):
+                response.headers.add_vary_header("Accept")
+            return response
+
+        return route_handler
+
+
+class HeldStream:
+    """
+    Sends a streamed response, then calls finish. A stream's request keeps its database session
+    until the body has been sent, so the request's admission slot is held until then too.
+    Runs finish even if sending fails or the client disconnects.
+    """
+
+    def __init__(self, response: StreamingResponse, finish: Callable[[], None]):
+        self.response = response
+        self.finish = finish
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.response, name)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        try:
+            await self.response(scope, receive, send)
+        finally:
+            self.finish()
+
+
+class InstrumentedRoute(MsgPackRoute):
+    """
+    MsgPackRoute that counts its in-flight requests and times serialization: everything the route
+    does after the endpoint returns, plus rendering inside the endpoint (see metrics.serializing).
+    Requests go through admission control first, by the endpoint's priority (see admission.priority),
+    so a burst gets a quick 503 instead of waiting out the connection pool's timeout. Admitted
+    requests then catch up with cache versions other workers committed. Streamed responses hold
+    their slot until the body has been sent.
+    """
+
+    def __init__(self, path: str, endpoint: Callable[..., Any], **kwargs: Any):
+        super().__init__(path, metrics.timed_endpoint(endpoint), **kwargs)
+        self.admission_priority = admission.route_priority(endpoint, self.methods)
+
+    async def _admit(self, series) -> None:
+        series[QUEUED] += 1
+        try:
+            series[QUEUE_WAIT_SECONDS] += await admission.controller().acquire(self.admission_priority)
+        except admission.Rejected as rejected:
+            series[REJECTED] += 1
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail=f"Server is busy with {rejected.queued} requests waiting; retry in {rejected.retry_after} s",
+                headers={"Retry-After": str(rejected.retry_after)}
+            )
+        finally:
+            series[QUEUED] -= 1
+
+    def get_route_handler(self) -> Callable[[Request], Coroutine[Any, Any, Response]]:
+        handler = super().get_route_handler()
+
+        async def route_handler(request: Request) -> Response:
+            series = metrics.store().series(request.method, metrics.route_label(request.scope))
+            if self.admission_priority is not None:
+                await self._admit(series)
+            admitted = time.perf_counter()
+            series[IN_FLIGHT] += 1
+
+            def finish() -> None:
+                series[IN_FLIGHT] -= 1
+                if self.admission_priority is not None:
+                    admission.controller().release(time.perf_counter() - admitted)
+
+            try:
+                cache.sync()
+                response = await handler(request)
+            except BaseException:
+                finish()
+                raise
+
+            timings = metrics.current_timings()
+            if timings is not None and timings.endpoint_end is not None:
+                timings.serialize += time.perf_counter() - timings.endpoint_end
+            if isinstance(response, StreamingResponse):
+                return HeldStream(response, finish)
+            finish()
+            return response
+
+        return route_handler
@@ -0,0 +1,19 @@
+# backend/app/schemas/admin_schema.py
+
+from datetime import datetime
+from typing import Any, List, Optional
+from pydantic import BaseModel
+
+class SlowQuery(BaseModel):
+    """
+    A statement that ran past the slow query threshold.
+    Text and blob parameters are redacted to their type and length.
+    """
+    timestamp: datetime
+    duration_ms: float
+    route: Optional[str] = None     # Method and path of the request that ran it
+    statement: str
+    parameters: Any = None
+    executemany: bool = False
+    plan: List[str]                 # EXPLAIN QUERY PLAN steps, indented under their parent
+    full_scans: List[str]           # Plan steps reading a whole table without an index
@@ -0,0 +1,25 @@
+# backend/app/schemas/event_schema.py
+
+from enum import Enum as PyEnum
+from typing import Optional
+from pydantic import BaseModel
+
+class EventTopic(str, PyEnum):
+    """Kinds of entity change events are published for"""
+    SCHEDULE = "schedule"
+    RECIPE = "recipe"
+
+class EventAction(str, PyEnum):
+    CREATED = "created"
+    UPDATED = "updated"
+    DELETED = "deleted"
+
+class ChangeEvent(BaseModel):
+    """
+    Published after a write commits.
+    Direction and recipe ingredient changes are published as updates of their recipe.
+    """
+    topic: EventTopic
+    action: EventAction
+    id: int
+    recipe_id: Optional[int] = None     # Set on schedule events
@@ -1,7 +1,7 @@
 # backend/app/schemas/measurement_schema.py
 
-from typing import Optional, List
-from pydantic import BaseModel, ConfigDict, field_validator, Field
+from typing import Annotated, Optional, List
+from pydantic import BaseModel, ConfigDict, TypeAdapter, field_validator, model_validator, Field
 from app.models.measurement_model import UnitCategory
 
 class MeasurementUnitBase(BaseModel):
@@ -32,8 +32,9 @@ class UnitConversionBase(BaseModel):
     )
 
     @field_validator('to_unit_id')
-    def units_must_be_different(cls, v: int, values: dict) -> int:
-        if 'from_unit_id' in values and v == values['from_unit_id']:
+    @classmethod
+    def units_must_be_different(cls, v: int, info) -> int:
+        if v == info.data.get('from_unit_id'):
             raise ValueError('from_unit and to_unit must be different')
         return v
     
@@ -45,4 +46,34 @@ class UnitConversionResponse(UnitConversionBase):
     from_unit: MeasurementUnit
     to_unit: MeasurementUnit
 
-    model_config = ConfigDict(from_attributes=True)
\ No newline at end of file
+    model_config = ConfigDict(from_attributes=True)
+
+
+class UnitConversionResult(BaseModel):
+    quantity: float
+    from_unit_id: int
+    to_unit_id: int
+    ratio: float
+    converted_quantity: float
+
+
+# Bounded so ids fit the conversion matrix's native integer index arrays
+BatchUnitId = Annotated[int, Field(ge=1, le=2**31 - 1)]
+
+class UnitConversionBatch(BaseModel):
+    quantities: List[float]
+    from_unit_ids: List[BatchUnitId]
+    to_unit_ids: List[BatchUnitId]
+
+    @model_validator(mode='after')
+    def lists_must_have_same_length(self):
+        if not len(self.quantities) == len(self.from_unit_ids) == len(self.to_unit_ids):
+            raise ValueError('quantities, from_unit_ids and to_unit_ids must have the same length')
+        return self
+
+
+class UnitConversionBatchResult(BaseModel):
+    converted_quantities: List[float]
+
+
+MeasurementUnitListAdapter = TypeAdapter(List[MeasurementUnit])
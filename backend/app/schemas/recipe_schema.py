@@ -1,6 +1,7 @@
 # backend/app/schemas/recipe_schema.py
 
-from pydantic import BaseModel, ConfigDict, Field
+from enum import Enum as PyEnum
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
 from app.schemas.ingredient_schema import Ingredient
 from app.schemas.measurement_schema import MeasurementUnit
 
@@ -40,6 +41,8 @@ class RecipeIngredientCreate(RecipeIngredientBase):
 class RecipeIngredient(RecipeIngredientBase):
     id: int
     recipe_id: int
+    base_quantity: float | None = None   # quantity in the unit category's base unit
+    base_unit_id: int | None = None
     ingredient: Ingredient
     unit: MeasurementUnit
 
@@ -65,3 +68,52 @@ class Recipe(RecipeBase):
     model_config = ConfigDict(from_attributes=True)
     directions: list[Direction] | None = None
     recipe_ingredients: list[RecipeIngredient] | None = None
+
+
+class RecipeSummary(BaseModel):
+    """Recipe fields needed to render a calendar entry"""
+    id: int
+    title: str
+    cooking_time: int
+    servings: int
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class SimilarRecipe(BaseModel):
+    id: int
+    title: str
+    similarity: float   # estimated Jaccard similarity of ingredient sets
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+# Scaled recipe schemas
+
+
+class UnitSystem(str, PyEnum):
+    """Unit systems a scaled recipe can be converted to"""
+    PREFERRED = "preferred"     # each ingredient's preferred unit
+    METRIC = "metric"
+    IMPERIAL = "imperial"
+
+
+class ScaledIngredient(BaseModel):
+    ingredient_id: int
+    name: str
+    quantity: float
+    unit_id: int
+    unit_abbreviation: str
+
+
+class ScaledRecipe(BaseModel):
+    id: int
+    title: str
+    servings: int
+    original_servings: int
+    scale_factor: float
+    ingredients: list[ScaledIngredient]
+
+
+RecipeAdapter = TypeAdapter(Recipe)
+RecipeListAdapter = TypeAdapter(list[Recipe])
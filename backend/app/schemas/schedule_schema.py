@@ -1,10 +1,12 @@
 # backend/app/schema/schedule_schema.py
 
 from datetime import date
-from typing import Optional
-from pydantic import BaseModel, ConfigDict, field_validator
-from app.schemas.recipe_schema import Recipe
+from enum import Enum as PyEnum
+from typing import List, Optional
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, field_validator
+from app.schemas.recipe_schema import Recipe, RecipeSummary
 from app.models.schedule_model import MealType
+from app.models.ingredient_model import IngredientCategory
 
 # Schedule schemas
 
@@ -48,4 +50,114 @@ class ScheduleUpdate(BaseModel):
 class Schedule(ScheduleBase):
     id: int
     recipe_id: int
-    recipe: Recipe      # Enrich API response to include all recipe base data
\ No newline at end of file
+    recipe: Recipe      # Enrich API response to include all recipe base data
+
+class CalendarSchedule(ScheduleBase):
+    """Lightweight calendar projection of a schedule"""
+    id: int
+    recipe_id: int
+    recipe: RecipeSummary
+
+# Calendar schemas
+
+class CalendarView(str, PyEnum):
+    """Spans the calendar endpoint can return"""
+    DAY = "day"
+    WEEK = "week"
+    MONTH = "month"
+
+class CalendarDay(BaseModel):
+    day: date
+    schedules: List[CalendarSchedule]
+
+# Conflict and gap schemas
+
+class ScheduleConflict(BaseModel):
+    """Days on which two or more schedules share a meal type"""
+    meal_type: MealType
+    start_date: date
+    end_date: date
+    schedule_ids: List[int]
+
+class ScheduleGap(BaseModel):
+    """Days with nothing planned for a meal type"""
+    meal_type: MealType
+    start_date: date
+    end_date: date
+
+class ScheduleCheck(BaseModel):
+    start_date: date
+    end_date: date
+    conflicts: List[ScheduleConflict]
+    gaps: List[ScheduleGap]
+
+# Week template schemas
+
+class WeekTemplateEntryBase(BaseModel):
+    recipe_id: int
+    day_offset: int = Field(ge=0, le=6)     # days after the first day of the week
+    duration_days: int = Field(default=1, ge=1)
+    meal_type: Optional[MealType] = None
+    notes: Optional[str] = None
+
+    model_config = ConfigDict(from_attributes=True)
+
+class WeekTemplateEntryCreate(WeekTemplateEntryBase):
+    pass
+
+class WeekTemplateEntry(WeekTemplateEntryBase):
+    id: int
+
+class WeekTemplateBase(BaseModel):
+    name: str
+    description: Optional[str] = None
+
+    model_config = ConfigDict(from_attributes=True)
+
+class WeekTemplateCreate(WeekTemplateBase):
+    entries: List[WeekTemplateEntryCreate] = []
+
+class WeekTemplate(WeekTemplateBase):
+    id: int
+    entries: List[WeekTemplateEntry]
+
+# Bulk copy schemas
+
+class ScheduleCopy(BaseModel):
+    """Copies every schedule starting within the source range, shifted to start at target_start_date"""
+    source_start_date: date
+    source_end_date: date
+    target_start_date: date
+
+    @field_validator('source_end_date')
+    @classmethod
+    def end_date_must_not_precede_start_date(cls, v: date, info) -> date:
+        start_date = info.data.get('source_start_date')
+        if start_date and v < start_date:
+            raise ValueError('source_end_date must not be before source_start_date')
+        return v
+
+class ScheduleCopyResult(BaseModel):
+    """Schedules created by a copy or a template application"""
+    schedule_ids: List[int]
+
+# Shopping list schemas
+
+class ShoppingListItem(BaseModel):
+    ingredient_id: int
+    name: str
+    quantity: float
+    unit_id: int
+    unit_abbreviation: str
+    schedule_count: int     # number of scheduled meals that need the ingredient
+
+class ShoppingListCategory(BaseModel):
+    category: IngredientCategory
+    items: List[ShoppingListItem]
+
+class ShoppingList(BaseModel):
+    start_date: date
+    end_date: date
+    categories: List[ShoppingListCategory]
+
+ScheduleListAdapter = TypeAdapter(List[Schedule])
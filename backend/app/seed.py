@@ -0,0 +1,409 @@
+# backend/app/seed.py
+"""
+Fills a database with a deterministic synthetic dataset for benchmarks and staging: ingredients
+using the seeded measurement units, recipes with realistic direction and ingredient counts, and
+years of daily schedules. Rows are generated column-wise with numpy and written with multi-row
+Core INSERTs in one transaction, with SQLite in bulk mode and secondary indexes built afterwards.
+
+Seed the app's database (or DATABASE_URL) from the backend directory:
+    python -m app.seed --recipes 60000
+Only databases with none of the seeded rows yet are loaded. The rollback journal stays on unless the
+file is created by the load, since without it a failed load can't be undone.
+"""
+
+import argparse
+import importlib.util
+import os
+import time
+from contextlib import contextmanager
+from datetime import date, timedelta
+from itertools import chain
+from typing import Dict, Iterator, List, Optional
+
+import numpy as np
+from alembic.migration import MigrationContext
+from alembic.operations import Operations
+from sqlalchemy import Table, bindparam, create_engine, func, insert, select
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.orm import Session
+
+from app.models import (
+    Base, Direction, Ingredient, IngredientCategory, MeasurementUnit, Recipe, RecipeIngredient, Schedule, UnitCategory
+)
+from app.models.schedule_model import MealType
+from app.services import schedule_copy, unit_conversion
+
+VERSIONS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "alembic", "versions")
+# Migrations seeding measurement units and their conversions, replayed so the data matches production
+SEED_MIGRATIONS = ("8a154e9660b8_seed_measurement_units.py", "3c30fd130d67_seed_unit_conversions.py")
+
+FIRST_DAY = date(2023, 1, 1)
+# SQLite's limit on bound parameters per statement (SQLITE_MAX_VARIABLE_NUMBER since 3.32)
+MAX_PARAMETERS = 32_766
+MAX_DIRECTIONS = 15
+MAX_RECIPE_INGREDIENTS = 14
+
+# Applied for the load and restored afterwards. Without a rollback journal a failed load can't
+# be rolled back, so journal_mode is only changed for files the load creates.
+BULK_PRAGMAS = {
+    "journal_mode": "OFF",
+    "synchronous": "OFF",
+    "cache_size": "-262144",      # 256 MiB
+    "temp_store": "MEMORY",
+    "foreign_keys": "OFF",
+}
+
+_ADJECTIVES = (
+    "Smoky", "Crispy", "Creamy", "Spicy", "Roasted", "Braised", "Grilled", "Lemony", "Garlicky", "Herbed",
+    "Honey", "Sticky", "Charred", "Slow-cooked", "Zesty", "Rustic", "Golden", "Tangy", "Savory", "Sweet",
+)
+_DISHES = (
+    "Chicken", "Tofu", "Salmon", "Lentil Stew", "Risotto", "Noodles", "Tacos", "Curry", "Flatbread", "Salad",
+    "Soup", "Pasta", "Meatballs", "Dumplings", "Frittata", "Chili", "Pilaf", "Casserole", "Stir-fry", "Bowl",
+)
+_STYLES = ("", " with Greens", " for Two", " Traybake", " Skewers", " Bake", " Wraps", " Hash")
+FOODS = (
+    "onion", "garlic", "carrot", "celery", "tomato", "potato", "spinach", "kale", "pepper", "leek",
+    "rice", "flour", "oats", "barley", "lentils", "chickpeas", "beans", "butter", "milk", "cream",
+    "yogurt", "cheddar", "parmesan", "egg", "chicken", "beef", "pork", "lamb", "salmon", "tofu",
+    "cumin", "paprika", "oregano", "thyme", "basil", "ginger", "turmeric", "oil", "vinegar", "honey",
+)
+_VARIETIES = ("", "red ", "green ", "smoked ", "dried ", "fresh ", "ground ", "whole ", "organic ", "baby ")
+_VERBS = ("Chop", "Stir", "Simmer", "Whisk", "Fold", "Season", "Roast", "Sear", "Drain", "Rest", "Slice", "Toss")
+
+# Typical units for each ingredient category
+_CATEGORY_UNITS = {
+    IngredientCategory.PRODUCE: UnitCategory.QUANTITY,
+    IngredientCategory.MEAT: UnitCategory.WEIGHT,
+    IngredientCategory.DAIRY: UnitCategory.VOLUME,
+    IngredientCategory.GRAINS: UnitCategory.WEIGHT,
+    IngredientCategory.SPICES: UnitCategory.VOLUME,
+    IngredientCategory.PANTRY: UnitCategory.VOLUME,
+    IngredientCategory.OTHER: UnitCategory.QUANTITY,
+}
+_MEALS = (MealType.BREAKFAST, MealType.LUNCH, MealType.DINNER)
+
+
+def seed_reference_data(connection: Connection) -> None:
+    """
+    Inserts the measurement units and conversions by replaying their seed migrations
+    """
+    operations = Operations(MigrationContext.configure(connection))
+    for filename in SEED_MIGRATIONS:
+        spec = importlib.util.spec_from_file_location(filename[:-3], os.path.join(VERSIONS_DIR, filename))
+        migration = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(migration)
+        with Operations.context(operations.migration_context):
+            migration.upgrade()
+
+
+def _pick(rng: np.random.Generator, options, size: int) -> List:
+    return [options[i] for i in rng.integers(len(options), size=size)]
+
+
+def _group_offsets(counts: np.ndarray) -> np.ndarray:
+    """Position of each row within its group, for groups of the given sizes laid out in order"""
+    starts = np.repeat(np.cumsum(counts) - counts, counts)
+    return np.arange(counts.sum()) - starts
+
+
+def generate(
+    matrix: unit_conversion.ConversionMatrix,
+    recipes: int = 1_000,
+    ingredients: int = 400,
+    years: int = 3,
+    seed: int = 0
+) -> Dict[str, Dict[str, list]]:
+    """
+    Columns of each table, with explicit ids so rows can reference each other before insertion.
+    Recipes have 3-15 directions and 4-14 distinct ingredients, popular ingredients turning up far
+    more often; every day has breakfast, lunch and dinner scheduled, some dinners lasting two days.
+    """
+    if ingredients < MAX_RECIPE_INGREDIENTS:
+        raise ValueError(f"At least {MAX_RECIPE_INGREDIENTS} ingredients are needed, got {ingredients}")
+    rng = np.random.default_rng(seed)
+    unit_ids = np.array(sorted(matrix.units))
+    units_by_category = {
+        category: unit_ids[[matrix.units[unit_id] == category for unit_id in unit_ids]]
+        for category in set(matrix.units.values())
+    }
+
+    # Ingredients: each one's units come from its category's usual unit category
+    combinations = [f"{variety}{food}" for food in FOODS for variety in _VARIETIES]
+    names = [
+        combinations[i % len(combinations)] + (f" #{i // len(combinations)}" if i >= len(combinations) else "")
+        for i in rng.permutation(ingredients)
+    ]
+    categories = list(IngredientCategory)
+    category_index = rng.integers(len(categories), size=ingredients)
+    ingredient_units = [units_by_category[_CATEGORY_UNITS[categories[i]]] for i in category_index]
+    preferred_units = [int(options[rng.integers(len(options))]) for options in ingredient_units]
+    has_description = rng.random(ingredients) < 0.5
+    ingredient_columns = {
+        "id": list(range(1, ingredients + 1)),
+        "name": names,
+        "preferred_unit_id": preferred_units,
+        "category": [categories[i] for i in category_index],
+        "description": [
+            f"{categories[i].value.title()} staple" if described else None
+            for i, described in zip(category_index, has_description)
+        ],
+    }
+
+    # Recipes
+    recipe_ids = np.arange(1, recipes + 1)
+    titles = [
+        f"{adjective} {dish}{style} #{recipe_id}" for adjective, dish, style, recipe_id in zip(
+            _pick(rng, _ADJECTIVES, recipes), _pick(rng, _DISHES, recipes), _pick(rng, _STYLES, recipes), recipe_ids
+        )
+    ]
+    recipe_columns = {
+        "id": recipe_ids.tolist(),
+        "title": titles,
+        "description": [f"A {title.lower()} that comes together on a weeknight." for title in titles],
+        "cooking_time": rng.choice([10, 15, 20, 30, 45, 60, 90, 120], size=recipes).tolist(),
+        "servings": rng.choice([1, 2, 4, 4, 4, 6, 8], size=recipes).tolist(),
+    }
+
+    # Directions, numbered from 1 within each recipe
+    direction_counts = np.clip(rng.poisson(7, size=recipes), 3, MAX_DIRECTIONS)
+    total = int(direction_counts.sum())
+    direction_columns = {
+        "recipe_id": np.repeat(recipe_ids, direction_counts).tolist(),
+        "direction_number": (_group_offsets(direction_counts) + 1).tolist(),
+        "instruction": [
+            f"{verb} for {minutes} minutes."
+            for verb, minutes in zip(_pick(rng, _VERBS, total), rng.integers(1, 15, size=total))
+        ],
+    }
+
+    # Recipe ingredients: from a popularity-weighted first ingredient, each recipe steps forward by
+    # gaps small enough that it never wraps around to an ingredient it already has
+    ingredient_counts = np.clip(rng.poisson(8, size=recipes), 4, MAX_RECIPE_INGREDIENTS)
+    total = int(ingredient_counts.sum())
+    popularity = 1 / np.arange(1, ingredients + 1) ** 0.8
+    first = rng.choice(ingredients, size=recipes, p=popularity / popularity.sum())
+    gaps = rng.integers(1, (ingredients - 1) // (MAX_RECIPE_INGREDIENTS - 1) + 1, size=total)
+    gaps[np.cumsum(ingredient_counts) - ingredient_counts] = 0
+    steps = np.cumsum(gaps)
+    steps -= np.repeat(steps[np.cumsum(ingredient_counts) - ingredient_counts], ingredient_counts)
+    ingredient_index = (np.repeat(first, ingredient_counts) + steps) % ingredients
+
+    choice = rng.integers(1_000_000, size=total)
+    unit_choices = [ingredient_units[i] for i in ingredient_index]
+    units = np.array([options[c % len(options)] for options, c in zip(unit_choices, choice)])
+    quantities = np.round(rng.lognormal(1.5, 1.0, size=total), 2)
+
+    # Base quantities are computed here rather than by an UPDATE per unit afterwards
+    ratios, base_units = {}, {}
+    for unit_id in matrix.units:
+        ratios[unit_id], base_units[unit_id] = matrix.to_base(1.0, unit_id)
+    recipe_ingredient_columns = {
+        "recipe_id": np.repeat(recipe_ids, ingredient_counts).tolist(),
+        "ingredient_id": (ingredient_index + 1).tolist(),
+        "quantity": quantities.tolist(),
+        "unit_id": units.tolist(),
+        "base_quantity": [
+            quantity * ratios[unit_id] if ratios[unit_id] is not None else None
+            for quantity, unit_id in zip(quantities.tolist(), units.tolist())
+        ],
+        "base_unit_id": [base_units[unit_id] for unit_id in units.tolist()],
+    }
+
+    # Schedules: three meals a day; a fifth of dinners leave leftovers for the next day
+    days = np.repeat(np.arange(365 * years), len(_MEALS))
+    meals = np.tile(np.arange(len(_MEALS)), 365 * years)
+    lengths = ((meals == len(_MEALS) - 1) & (rng.random(len(days)) < 0.2)).astype(int)
+    schedule_columns = {
+        "recipe_id": rng.integers(1, recipes + 1, size=len(days)).tolist(),
+        "start_date": [FIRST_DAY + timedelta(days=int(day)) for day in days],
+        "end_date": [FIRST_DAY + timedelta(days=int(day + length)) for day, length in zip(days, lengths)],
+        "meal_type": [_MEALS[meal] for meal in meals],
+        "notes": ["Leftovers tomorrow" if length else None for length in lengths],
+    }
+
+    return {
+        "ingredients": ingredient_columns,
+        "recipes": recipe_columns,
+        "directions": direction_columns,
+        "recipe_ingredients": recipe_ingredient_columns,
+        "schedules": schedule_columns,
+    }
+
+
+@contextmanager
+def bulk_mode(connection: Connection, journal: bool = True) -> Iterator[None]:
+    """
+    SQLite settings for a one-off load: no fsyncs, a large page cache and no foreign key checks
+    (generated rows reference each other correctly by construction). With journal=False the
+    rollback journal is off too, for new files a failed load can simply be deleted from.
+    """
+    if connection.dialect.name != "sqlite":
+        yield
+        return
+    pragmas = {pragma: value for pragma, value in BULK_PRAGMAS.items() if not journal or pragma != "journal_mode"}
+    previous = {pragma: connection.exec_driver_sql(f"PRAGMA {pragma}").scalar() for pragma in pragmas}
+    for pragma, value in pragmas.items():
+        connection.exec_driver_sql(f"PRAGMA {pragma} = {value}")
+    connection.commit()
+    try:
+        yield
+    finally:
+        connection.rollback()
+        for pragma, value in previous.items():
+            connection.exec_driver_sql(f"PRAGMA {pragma} = {value}")
+        connection.commit()
+
+
+@contextmanager
+def deferred_indexes(connection: Connection, tables: List[Table]) -> Iterator[None]:
+    """
+    Drops the tables' secondary indexes for the block and builds them once it's done,
+    which sorts each index once instead of updating it row by row.
+    Runs outside the block's transaction: pysqlite commits DDL as it goes, so the drops can't be
+    rolled back with a failed load, and the indexes are rebuilt whether the block fails or not.
+    """
+    indexes = [index for table in tables for index in table.indexes]
+    for index in indexes:
+        index.drop(connection, checkfirst=True)
+    connection.commit()
+    try:
+        yield
+    finally:
+        connection.rollback()
+        for index in indexes:
+            index.create(connection, checkfirst=True)
+        connection.commit()
+
+
+def _values_sql(connection: Connection, table: Table, names: List[str], rows: int) -> str:
+    """
+    SQL of a Core INSERT of rows rows, compiled once per table and chunk size: compiling
+    thousands of literal rows costs more than executing them, and multi-row VALUES aren't cached
+    """
+    statement = insert(table).values([
+        {name: bindparam(f"{name}_{row}", type_=table.c[name].type) for name in names} for row in range(rows)
+    ])
+    return str(statement.compile(dialect=connection.dialect))
+
+
+def insert_columns(connection: Connection, table: Table, columns: Dict[str, list], chunk_size: int) -> int:
+    """
+    Inserts column lists as multi-row INSERT ... VALUES statements of chunk_size rows,
+    or as many as fit in SQLite's bound parameter limit
+    """
+    dialect = connection.dialect
+    names = [column.name for column in table.columns if column.name in columns]     # the order VALUES binds them
+    processed = []
+    for name in names:
+        processor = table.c[name].type.dialect_impl(dialect).bind_processor(dialect)
+        processed.append([processor(value) for value in columns[name]] if processor else columns[name])
+    rows = list(zip(*processed))
+
+    chunk_size = min(chunk_size, MAX_PARAMETERS // len(names))
+    statements: Dict[int, str] = {}
+    for start in range(0, len(rows), chunk_size):
+        chunk = rows[start:start + chunk_size]
+        if len(chunk) not in statements:
+            statements[len(chunk)] = _values_sql(connection, table, names, len(chunk))
+        connection.exec_driver_sql(statements[len(chunk)], tuple(chain.from_iterable(chunk)))
+    return len(rows)
+
+
+def is_new_file(engine: Engine) -> bool:
+    """Whether the engine's SQLite database is in memory or a file that doesn't exist or is empty"""
+    if engine.dialect.name != "sqlite":
+        return False
+    path = engine.url.database
+    if not path or path == ":memory:":
+        return True
+    return not os.path.exists(path) or os.path.getsize(path) == 0
+
+
+def seed(
+    engine: Engine,
+    recipes: int = 1_000,
+    ingredients: int = 400,
+    years: int = 3,
+    seed: int = 0,
+    chunk_size: int = 5_000,
+    new_file: bool = False
+) -> Dict[str, int]:
+    """
+    Creates the schema if needed and loads generate(...) into a database with no recipe, ingredient
+    or schedule data yet. With new_file the database must not exist beforehand.
+    Returns the row count of each table.
+    """
+    created = is_new_file(engine)
+    if new_file and not created:
+        raise ValueError(f"{engine.url.database} already exists")
+
+    models = (Ingredient, Recipe, Direction, RecipeIngredient, Schedule)
+    tables = [model.__table__ for model in models] + [Base.metadata.tables["schedule_days"]]
+    Base.metadata.create_all(bind=engine)
+    with engine.begin() as connection:
+        existing = {
+            table.name: connection.execute(select(func.count()).select_from(table)).scalar() for table in tables
+        }
+        existing = {name: count for name, count in existing.items() if count}
+        if existing:
+            listed = ", ".join(f"{count} {name}" for name, count in existing.items())
+            raise ValueError(f"Database already has {listed}; seed an empty database")
+        if not connection.execute(select(func.count()).select_from(MeasurementUnit.__table__)).scalar():
+            seed_reference_data(connection)
+
+    counts = {}
+    with engine.connect() as connection, bulk_mode(connection, journal=not created):
+        with deferred_indexes(connection, [model.__table__ for model in models]), connection.begin():
+            session = Session(bind=connection)
+            dataset = generate(
+                unit_conversion.load_matrix(session), recipes=recipes, ingredients=ingredients, years=years, seed=seed
+            )
+            for model in models:
+                table = model.__table__
+                counts[table.name] = insert_columns(connection, table, dataset[table.name], chunk_size)
+            # Calendar index rows; the R*Tree was filled by the schedules' insert trigger
+            schedule_copy.index_new_schedules(session, 0)
+            counts["schedule_days"] = session.execute(select(func.count()).select_from(
+                Base.metadata.tables["schedule_days"]
+            )).scalar()
+            session.close()
+    return counts
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="Seed a database with synthetic recipes, ingredients and schedules")
+    parser.add_argument("--database-url", help="Database to seed; defaults to the app's (DATABASE_URL)")
+    parser.add_argument("--recipes", type=int, default=60_000)
+    parser.add_argument("--ingredients", type=int, default=2_000)
+    parser.add_argument("--years", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--chunk-size", type=int, default=5_000, help="Rows per INSERT statement")
+    parser.add_argument(
+        "--new-file", action="store_true",
+        help="Refuse to seed an existing database file; new files are loaded without a rollback journal"
+    )
+    args = parser.parse_args(argv)
+
+    if args.database_url:
+        engine = create_engine(args.database_url)
+    else:
+        from app.database import engine
+
+    start = time.perf_counter()
+    try:
+        counts = seed(
+            engine, recipes=args.recipes, ingredients=args.ingredients, years=args.years, seed=args.seed,
+            chunk_size=args.chunk_size, new_file=args.new_file
+        )
+    except ValueError as error:
+        parser.error(str(error))
+    elapsed = time.perf_counter() - start
+
+    for table, count in counts.items():
+        print(f"{table:<20}{count:>12,}")
+    print(f"{'total':<20}{sum(counts.values()):>12,} rows in {elapsed:.1f} s")
+
+
+if __name__ == "__main__":
+    main()
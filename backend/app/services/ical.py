@@ -0,0 +1,101 @@
+# backend/app/services/ical.py
+
+from datetime import date, datetime, timedelta, timezone
+from typing import Iterator, Optional
+
+from sqlalchemy.orm import Session
+
+from app.models.recipe_model import Recipe
+from app.models.schedule_model import Schedule, overlapping
+
+PRODUCT_ID = "-//Turtle Cafeteria//Meal Plan//EN"
+UID_DOMAIN = "turtle-cafeteria"
+BATCH_SIZE = 500
+
+# Feed content only changes with the data versions in its ETag, so DTSTAMP is fixed per process
+_STAMP = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+
+
+def _escape(text: str) -> str:
+    """Escapes a TEXT value (RFC 5545 section 3.3.11)"""
+    return (
+        text.replace("\\", "\\\\")
+        .replace(";", "\\;")
+        .replace(",", "\\,")
+        .replace("\r\n", "\\n")
+        .replace("\n", "\\n")
+    )
+
+
+def _fold(line: str) -> bytes:
+    """Encodes a content line, folding it at 75 octets without splitting UTF-8 characters"""
+    encoded = line.encode("utf-8")
+    if len(encoded) <= 75:
+        return encoded + b"\r\n"
+
+    parts = []
+    limit = 75
+    while len(encoded) > limit:
+        cut = limit
+        while encoded[cut] & 0xC0 == 0x80:     # back off continuation bytes
+            cut -= 1
+        parts.append(encoded[:cut])
+        encoded = encoded[cut:]
+        limit = 74                              # continuation lines start with a space
+    parts.append(encoded)
+    return b"\r\n ".join(parts) + b"\r\n"
+
+
+def _event(row) -> bytes:
+    summary = f"{row.meal_type.value.title()}: {row.title}" if row.meal_type else row.title
+    lines = [
+        "BEGIN:VEVENT",
+        f"UID:schedule-{row.id}@{UID_DOMAIN}",
+        f"DTSTAMP:{_STAMP}",
+        f"DTSTART;VALUE=DATE:{row.start_date:%Y%m%d}",
+        f"DTEND;VALUE=DATE:{row.end_date + timedelta(days=1):%Y%m%d}",     # DTEND is exclusive
+        f"SUMMARY:{_escape(summary)}",
+    ]
+    if row.notes:
+        lines.append(f"DESCRIPTION:{_escape(row.notes)}")
+    if row.meal_type:
+        lines.append(f"CATEGORIES:{row.meal_type.value.upper()}")
+    lines.append("END:VEVENT")
+    return b"".join(_fold(line) for line in lines)
+
+
+def stream_feed(db: Session, start_date: Optional[date], end_date: Optional[date]) -> Iterator[bytes]:
+    """
+    Yields an iCalendar document of schedules as all-day events, one event per chunk.
+    Rows are fetched in batches as the response is sent, so the feed is never held in memory.
+    """
+    yield b"".join(_fold(line) for line in (
+        "BEGIN:VCALENDAR",
+        "VERSION:2.0",
+        f"PRODID:{PRODUCT_ID}",
+        "CALSCALE:GREGORIAN",
+        "X-WR-CALNAME:Turtle Cafeteria",
+    ))
+
+    rows = db.query(
+        Schedule.id,
+        Schedule.start_date,
+        Schedule.end_date,
+        Schedule.meal_type,
+        Schedule.notes,
+        Recipe.title
+    ).join(
+        Recipe, Recipe.id == Schedule.recipe_id
+    ).filter(
+        overlapping(start_date or date.min, end_date or date.max)
+    ).order_by(
+        Schedule.start_date,
+        Schedule.id
+    ).execution_options(
+        stream_results=True
+    ).yield_per(BATCH_SIZE)
+
+    for row in rows:
+        yield _event(row)
+
+    yield _fold("END:VCALENDAR")
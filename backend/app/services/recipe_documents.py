@@ -0,0 +1,105 @@
+# backend/app/services/recipe_documents.py
+
+from typing import Dict, Iterable, Optional
+
+from sqlalchemy import delete, event, select
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import Session, joinedload, selectinload
+
+from app import cache
+from app.models.ingredient_model import Ingredient
+from app.models.recipe_document_model import RecipeDocument
+from app.models.recipe_model import Recipe, RecipeIngredient
+from app.responses import orm_json
+from app.schemas import recipe_schema
+
+CHUNK_SIZE = 500    # recipes regenerated per query, keeping IN lists and upserts well inside SQLite's parameter limit
+
+# Eager loads the whole graph a Recipe response serializes, avoiding lazy loads per recipe
+GRAPH_OPTIONS = (
+    selectinload(Recipe.directions),
+    selectinload(Recipe.recipe_ingredients).options(
+        joinedload(RecipeIngredient.ingredient).joinedload(Ingredient.preferred_unit),
+        joinedload(RecipeIngredient.unit)
+    ),
+)
+
+
+def regenerate(db: Session, recipe_ids: Iterable[int]) -> Dict[int, bytes]:
+    """
+    Renders the given recipes and writes their documents, removing documents of recipes that no
+    longer exist. Returns the rendered bodies by recipe id.
+    """
+    recipe_ids = sorted(set(recipe_ids))
+    bodies = {}
+    for start in range(0, len(recipe_ids), CHUNK_SIZE):
+        chunk = recipe_ids[start:start + CHUNK_SIZE]
+        # populate_existing reloads collections the session may hold from before this transaction's changes
+        recipes = db.query(Recipe).options(*GRAPH_OPTIONS).filter(
+            Recipe.id.in_(chunk)
+        ).populate_existing().all()
+        rendered = {recipe.id: orm_json(recipe_schema.RecipeAdapter, recipe) for recipe in recipes}
+
+        missing = set(chunk) - set(rendered)
+        if missing:
+            db.execute(delete(RecipeDocument).where(RecipeDocument.recipe_id.in_(missing)))
+        if rendered:
+            statement = sqlite_insert(RecipeDocument).values([
+                {"recipe_id": recipe_id, "version": 1, "body": body} for recipe_id, body in rendered.items()
+            ])
+            statement = statement.on_conflict_do_update(
+                index_elements=[RecipeDocument.recipe_id],
+                set_={"version": RecipeDocument.version + 1, "body": statement.excluded.body}
+            )
+            db.execute(statement)
+        bodies.update(rendered)
+    return bodies
+
+
+def get(db: Session, recipe_id: int) -> Optional[bytes]:
+    """
+    Returns a recipe's stored document, or None if the recipe doesn't exist.
+    Recipes without a document yet (created before the store, or after a unit conversion changed)
+    are rendered once and stored.
+    """
+    body = db.scalar(select(RecipeDocument.body).where(RecipeDocument.recipe_id == recipe_id))
+    if body is not None:
+        return body
+
+    body = regenerate(db, [recipe_id]).get(recipe_id)
+    try:
+        db.commit()
+    except OperationalError:
+        # The database is busy with a write; serve the rendered body and store it next time
+        db.rollback()
+    return body
+
+
+def touch_ingredient(db: Session, ingredient_id: int) -> None:
+    """
+    Marks every recipe using an ingredient as changed, so their documents and cached
+    responses are regenerated when the ingredient's change commits
+    """
+    recipe_ids = db.scalars(
+        select(RecipeIngredient.recipe_id).where(RecipeIngredient.ingredient_id == ingredient_id).distinct()
+    )
+    cache.touch(db, *(f"recipe:{recipe_id}" for recipe_id in recipe_ids))
+
+
+def clear(db: Session) -> None:
+    """
+    Removes every document, for changes that reach all recipes (unit conversions rewrite base
+    quantities); each document is rebuilt the next time its recipe is read
+    """
+    db.execute(delete(RecipeDocument))
+
+
+@event.listens_for(Session, "before_commit")
+def _regenerate_touched(session: Session) -> None:
+    """Rewrites the documents of recipes touched by the committing transaction"""
+    touched = session.info.get("cache_touched")
+    recipe_ids = [int(name.split(":", 1)[1]) for name in touched or () if name.startswith("recipe:")]
+    if recipe_ids:
+        session.flush()
+        regenerate(session, recipe_ids)
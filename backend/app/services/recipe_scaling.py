@@ -0,0 +1,124 @@
+# backend/app/services/recipe_scaling.py
+
+from typing import Optional
+
+import numpy as np
+from sqlalchemy.orm import Session
+
+from app import cache
+from app.models.ingredient_model import Ingredient
+from app.models.measurement_model import MeasurementUnit
+from app.models.recipe_model import Recipe, RecipeIngredient
+from app.schemas import recipe_schema
+from app.schemas.recipe_schema import UnitSystem
+from app.services import unit_conversion
+
+_scaled_recipes = cache.LRUCache(maxsize=1024)
+
+
+def _target_units(
+    matrix: unit_conversion.ConversionMatrix,
+    quantities: np.ndarray,
+    unit_ids: np.ndarray,
+    candidate_ids: np.ndarray
+) -> np.ndarray:
+    """
+    Picks, per row, the largest candidate unit that keeps the quantity at or above 1
+    (the smallest one if every candidate is below 1).
+    Rows with no convertible candidate keep their own unit.
+    """
+    if len(candidate_ids) == 0:
+        return unit_ids
+    values = quantities[:, None] * matrix.ratios[unit_ids[:, None], candidate_ids[None, :]]
+
+    at_least_one = np.where(values >= 1, values, np.inf)    # NaN compares False, so drops out
+    below_one = np.where(np.isnan(values), -np.inf, values)
+    has_at_least_one = np.isfinite(at_least_one.min(axis=1))
+    has_candidate = np.isfinite(below_one.max(axis=1))
+
+    choice = np.where(has_at_least_one, at_least_one.argmin(axis=1), below_one.argmax(axis=1))
+    return np.where(has_candidate, candidate_ids[choice], unit_ids)
+
+
+def scale_recipe(
+    db: Session,
+    recipe_id: int,
+    servings: Optional[int],
+    units: Optional[UnitSystem]
+) -> Optional[recipe_schema.ScaledRecipe]:
+    """
+    Scales a recipe's ingredients to a number of servings and converts them to a unit system.
+    Results are cached by recipe, ingredient and unit versions plus the parameters.
+    Returns None if the recipe doesn't exist.
+    """
+    key = (
+        recipe_id,
+        cache.version(f"recipe:{recipe_id}"),
+        cache.version("ingredients"),
+        cache.version("units"),
+        servings,
+        units
+    )
+    cached = _scaled_recipes.get(key)
+    if cached is not None:
+        return cached
+
+    recipe = db.query(Recipe.id, Recipe.title, Recipe.servings).filter(Recipe.id == recipe_id).first()
+    if recipe is None:
+        return None
+    target_servings = servings or recipe.servings
+
+    # All ingredient rows for the recipe in one query
+    rows = db.query(
+        RecipeIngredient.ingredient_id,
+        Ingredient.name,
+        Ingredient.preferred_unit_id,
+        RecipeIngredient.quantity,
+        RecipeIngredient.unit_id
+    ).join(Ingredient, RecipeIngredient.ingredient_id == Ingredient.id).filter(
+        RecipeIngredient.recipe_id == recipe_id
+    ).order_by(RecipeIngredient.id).all()
+
+    catalog = {unit.id: unit for unit in db.query(MeasurementUnit).all()}
+    matrix = unit_conversion.get_matrix(db)
+
+    scale_factor = target_servings / recipe.servings if recipe.servings else 1.0
+    quantities = np.array([row.quantity for row in rows], dtype=np.float64) * scale_factor
+    unit_ids = np.array([row.unit_id for row in rows], dtype=np.intp)
+
+    if units == UnitSystem.PREFERRED:
+        # Ingredients whose preferred unit is in another category keep their own unit
+        preferred = np.array([row.preferred_unit_id for row in rows], dtype=np.intp)
+        convertible = ~np.isnan(matrix.ratios[unit_ids, preferred])
+        target_ids = np.where(convertible, preferred, unit_ids)
+    elif units in (UnitSystem.METRIC, UnitSystem.IMPERIAL):
+        want_metric = units == UnitSystem.METRIC
+        candidates = np.array(
+            [unit.id for unit in catalog.values() if unit.is_metric == want_metric and unit.is_common],
+            dtype=np.intp
+        )
+        target_ids = _target_units(matrix, quantities, unit_ids, candidates)
+    else:
+        target_ids = unit_ids
+
+    converted = np.round(matrix.convert_many(quantities, unit_ids, target_ids), 3)
+
+    scaled = recipe_schema.ScaledRecipe(
+        id=recipe.id,
+        title=recipe.title,
+        servings=target_servings,
+        original_servings=recipe.servings,
+        scale_factor=scale_factor,
+        ingredients=[
+            recipe_schema.ScaledIngredient(
+                ingredient_id=row.ingredient_id,
+                name=row.name,
+                quantity=quantity,
+                unit_id=unit_id,
+                unit_abbreviation=catalog[unit_id].abbreviation
+            )
+            for row, quantity, unit_id in zip(rows, converted.tolist(), target_ids.tolist())
+        ]
+    )
+    _scaled_recipes.set(key, scaled)
+    return scaled
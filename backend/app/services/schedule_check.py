@@ -0,0 +1,121 @@
+# backend/app/services/schedule_check.py
+
+import heapq
+from datetime import date, timedelta
+from typing import Dict, List, Optional
+
+from sqlalchemy.orm import Session
+
+from app.models.schedule_model import MealType, Schedule, overlapping
+from app.schemas import schedule_schema
+
+_ONE_DAY = timedelta(days=1)
+
+
+class _MealSweep:
+    """
+    Sweep state for one meal type over schedules arriving in start_date order.
+    Keeps a heap of the end dates still active, so each schedule is pushed and popped once.
+    """
+
+    def __init__(self, meal_type: MealType, start_date: date, end_date: date):
+        self.meal_type = meal_type
+        self.start_date = start_date
+        self.end_date = end_date
+        self.covered_until = start_date - _ONE_DAY
+        self.active = []                            # heap of (end_date, schedule_id)
+        self.conflict: Optional[schedule_schema.ScheduleConflict] = None
+        self.conflicts: List[schedule_schema.ScheduleConflict] = []
+        self.gaps: List[schedule_schema.ScheduleGap] = []
+
+    def _expire(self, before: Optional[date]):
+        """Drops schedules ending before a day, closing the open conflict when fewer than two remain"""
+        while self.active and (before is None or self.active[0][0] < before):
+            ended, _ = heapq.heappop(self.active)
+            if self.conflict is not None and len(self.active) < 2:
+                self.conflict.end_date = min(ended, self.end_date)
+                self.conflicts.append(self.conflict)
+                self.conflict = None
+
+    def add(self, schedule_id: int, start_date: date, end_date: date):
+        self._expire(start_date)
+
+        # Nothing covered the days between the furthest end so far and this start
+        if start_date > self.covered_until + _ONE_DAY:
+            self.gaps.append(schedule_schema.ScheduleGap(
+                meal_type=self.meal_type,
+                start_date=self.covered_until + _ONE_DAY,
+                end_date=start_date - _ONE_DAY
+            ))
+        self.covered_until = max(self.covered_until, end_date)
+
+        heapq.heappush(self.active, (end_date, schedule_id))
+        if len(self.active) < 2:
+            return
+        if self.conflict is None:
+            self.conflict = schedule_schema.ScheduleConflict(
+                meal_type=self.meal_type,
+                start_date=max(start_date, self.start_date),
+                end_date=end_date,
+                schedule_ids=sorted(active_id for _, active_id in self.active)
+            )
+        else:
+            self.conflict.schedule_ids.append(schedule_id)
+
+    def finish(self):
+        self._expire(None)
+        if self.covered_until < self.end_date:
+            self.gaps.append(schedule_schema.ScheduleGap(
+                meal_type=self.meal_type,
+                start_date=self.covered_until + _ONE_DAY,
+                end_date=self.end_date
+            ))
+
+
+def check_schedules(
+    db: Session,
+    start_date: date,
+    end_date: date,
+    meal_types: Optional[List[MealType]] = None
+) -> schedule_schema.ScheduleCheck:
+    """
+    Finds conflicts (overlapping schedules with the same meal type) and gaps (days with nothing planned
+    for a meal type) within a date range, in one sweep over schedules read in start_date order.
+    Schedules without a meal type fill no slot, so they are ignored.
+    """
+    meal_types = meal_types or list(MealType)
+    sweeps: Dict[MealType, _MealSweep] = {
+        meal_type: _MealSweep(meal_type, start_date, end_date) for meal_type in meal_types
+    }
+
+    if start_date <= end_date:
+        rows = db.query(
+            Schedule.id,
+            Schedule.meal_type,
+            Schedule.start_date,
+            Schedule.end_date
+        ).filter(
+            overlapping(start_date, end_date),
+            Schedule.meal_type.in_(meal_types)
+        ).order_by(
+            Schedule.start_date,
+            Schedule.id
+        ).all()
+
+        for row in rows:
+            sweeps[row.meal_type].add(row.id, row.start_date, row.end_date)
+        for sweep in sweeps.values():
+            sweep.finish()
+
+    return schedule_schema.ScheduleCheck(
+        start_date=start_date,
+        end_date=end_date,
+        conflicts=sorted(
+            (conflict for sweep in sweeps.values() for conflict in sweep.conflicts),
+            key=lambda conflict: (conflict.start_date, meal_types.index(conflict.meal_type))
+        ),
+        gaps=sorted(
+            (gap for sweep in sweeps.values() for gap in sweep.gaps),
+            key=lambda gap: (gap.start_date, meal_types.index(gap.meal_type))
+        )
+    )
@@ -0,0 +1,115 @@
+# backend/app/services/schedule_copy.py
+
+from datetime import date
+from typing import List, Tuple
+
+from sqlalchemy import Integer, Select, cast, func, insert, literal, select
+from sqlalchemy.orm import Session
+
+from app.models.schedule_model import Schedule, ScheduleDay, WeekTemplateEntry
+
+# Set-based copies: each operation is one INSERT ... SELECT into schedules, followed by one
+# INSERT ... SELECT that expands the new rows into schedule_days. The R*Tree is kept in sync by its
+# triggers. Callers commit, so a copy lands in a single transaction or not at all.
+
+
+def index_new_schedules(db: Session, after_id: int) -> None:
+    """
+    Adds schedule_days rows for every schedule inserted after after_id.
+    Only call this while the transaction holds SQLite's write lock, so no other writer's rows are above after_id.
+    """
+    covered = select(
+        Schedule.start_date.label("day"),
+        Schedule.id.label("schedule_id"),
+        Schedule.end_date.label("end_date")
+    ).where(Schedule.id > after_id).cte("covered", recursive=True)
+    covered = covered.union_all(
+        select(
+            func.date(covered.c.day, "+1 day"),
+            covered.c.schedule_id,
+            covered.c.end_date
+        ).where(covered.c.day < covered.c.end_date)
+    )
+    db.execute(
+        insert(ScheduleDay).from_select(["day", "schedule_id"], select(covered.c.day, covered.c.schedule_id))
+    )
+
+
+def _insert_schedules(db: Session, rows: Select) -> List[Tuple[int, int]]:
+    """
+    Inserts a schedule for every row of a (recipe_id, start_date, end_date, meal_type, notes) select
+    and indexes their days. Returns the (id, recipe_id) of the new schedules.
+    The new ids come back from the INSERT itself, which holds SQLite's write lock until commit, so
+    every schedule from the first new id up is ours. A max(id) read beforehand would not be: pysqlite
+    only begins the transaction at the first write, and another writer could insert in between.
+    """
+    created = sorted((schedule_id, recipe_id) for schedule_id, recipe_id in db.execute(
+        insert(Schedule).from_select(["recipe_id", "start_date", "end_date", "meal_type", "notes"], rows).returning(
+            Schedule.id, Schedule.recipe_id
+        )
+    ))
+    if created:
+        index_new_schedules(db, created[0][0] - 1)
+    return created
+
+
+def copy_range(db: Session, source_start: date, source_end: date, target_start: date) -> List[Tuple[int, int]]:
+    """
+    Copies every schedule starting within [source_start, source_end], shifting both dates so the
+    range starts on target_start. Returns the (id, recipe_id) of the new schedules.
+    """
+    shift = f"{(target_start - source_start).days:+d} days"
+
+    # SQLite reads the whole source range before inserting, so new rows are never copied again
+    return _insert_schedules(db, select(
+        Schedule.recipe_id,
+        func.date(Schedule.start_date, shift),
+        func.date(Schedule.end_date, shift),
+        Schedule.meal_type,
+        Schedule.notes
+    ).where(
+        Schedule.start_date >= source_start,
+        Schedule.start_date <= source_end
+    ).order_by(Schedule.start_date, Schedule.id))
+
+
+def save_week(db: Session, template_id: int, week_start: date) -> None:
+    """
+    Adds an entry to a template for every schedule starting within the 7 days from week_start
+    """
+    week_days = func.julianday(week_start)
+    db.execute(
+        insert(WeekTemplateEntry).from_select(
+            ["template_id", "recipe_id", "day_offset", "duration_days", "meal_type", "notes"],
+            select(
+                literal(template_id),
+                Schedule.recipe_id,
+                cast(func.julianday(Schedule.start_date) - week_days, Integer),
+                cast(func.julianday(Schedule.end_date) - func.julianday(Schedule.start_date), Integer) + 1,
+                Schedule.meal_type,
+                Schedule.notes
+            ).where(
+                Schedule.start_date >= week_start,
+                Schedule.start_date <= func.date(week_start, "+6 days")
+            ).order_by(Schedule.start_date, Schedule.id)
+        )
+    )
+
+
+def apply_template(db: Session, template_id: int, week_start: date) -> List[Tuple[int, int]]:
+    """
+    Schedules every entry of a template in the week starting on week_start.
+    Returns the (id, recipe_id) of the new schedules.
+    """
+    return _insert_schedules(db, select(
+        WeekTemplateEntry.recipe_id,
+        func.date(week_start, func.printf("%+d days", WeekTemplateEntry.day_offset)),
+        func.date(
+            week_start,
+            func.printf("%+d days", WeekTemplateEntry.day_offset + WeekTemplateEntry.duration_days - 1)
+        ),
+        WeekTemplateEntry.meal_type,
+        WeekTemplateEntry.notes
+    ).where(
+        WeekTemplateEntry.template_id == template_id
+    ).order_by(WeekTemplateEntry.day_offset, WeekTemplateEntry.id))
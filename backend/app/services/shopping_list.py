@@ -0,0 +1,96 @@
+# backend/app/services/shopping_list.py
+
+from datetime import date
+from itertools import groupby
+
+import numpy as np
+from sqlalchemy import func
+from sqlalchemy.orm import Session, aliased
+
+from app.models.ingredient_model import Ingredient
+from app.models.measurement_model import MeasurementUnit
+from app.models.recipe_model import RecipeIngredient
+from app.models.schedule_model import Schedule, overlapping
+from app.schemas import schedule_schema
+from app.services import unit_conversion
+
+
+def build_shopping_list(db: Session, start_date: date, end_date: date) -> schedule_schema.ShoppingList:
+    """
+    Totals every ingredient needed by schedules overlapping a date range in one aggregate query.
+    A schedule counts once for each of its days inside the range, matching how the calendar shows it.
+    Quantities are summed in base units, then shown in each ingredient's preferred unit where possible.
+    """
+    # Days of each schedule that fall inside the requested range
+    days_in_range = (
+        func.julianday(func.min(Schedule.end_date, end_date))
+        - func.julianday(func.max(Schedule.start_date, start_date))
+        + 1
+    )
+    # Ingredients whose unit has no base unit are totalled in their own unit
+    unit_id = func.coalesce(RecipeIngredient.base_unit_id, RecipeIngredient.unit_id)
+    quantity = func.coalesce(RecipeIngredient.base_quantity, RecipeIngredient.quantity)
+
+    unit = aliased(MeasurementUnit)
+    preferred_unit = aliased(MeasurementUnit)
+
+    rows = db.query(
+        Ingredient.id,
+        Ingredient.name,
+        Ingredient.category,
+        unit_id.label("unit_id"),
+        unit.abbreviation.label("unit_abbreviation"),
+        Ingredient.preferred_unit_id,
+        preferred_unit.abbreviation.label("preferred_unit_abbreviation"),
+        func.sum(quantity * days_in_range).label("quantity"),
+        func.count(func.distinct(Schedule.id)).label("schedule_count")
+    ).select_from(Schedule).join(
+        RecipeIngredient, RecipeIngredient.recipe_id == Schedule.recipe_id
+    ).join(
+        Ingredient, Ingredient.id == RecipeIngredient.ingredient_id
+    ).join(
+        unit, unit.id == unit_id
+    ).join(
+        preferred_unit, preferred_unit.id == Ingredient.preferred_unit_id
+    ).filter(
+        overlapping(start_date, end_date)
+    ).group_by(
+        Ingredient.id, unit_id
+    ).order_by(
+        Ingredient.category, Ingredient.name, unit_id
+    ).all()
+
+    # Convert every total to its preferred unit in one pass, keeping base units that can't convert
+    matrix = unit_conversion.get_matrix(db)
+    totals = np.array([row.quantity for row in rows], dtype=np.float64)
+    preferred = matrix.convert_many(
+        totals,
+        np.array([row.unit_id for row in rows], dtype=np.intp),
+        np.array([row.preferred_unit_id for row in rows], dtype=np.intp)
+    )
+    use_preferred = ~np.isnan(preferred)
+    quantities = np.round(np.where(use_preferred, preferred, totals), 3)
+
+    items = [
+        (
+            row.category,
+            schedule_schema.ShoppingListItem(
+                ingredient_id=row.id,
+                name=row.name,
+                quantity=quantity,
+                unit_id=row.preferred_unit_id if converted else row.unit_id,
+                unit_abbreviation=row.preferred_unit_abbreviation if converted else row.unit_abbreviation,
+                schedule_count=row.schedule_count
+            )
+        )
+        for row, quantity, converted in zip(rows, quantities.tolist(), use_preferred.tolist())
+    ]
+
+    return schedule_schema.ShoppingList(
+        start_date=start_date,
+        end_date=end_date,
+        categories=[
+            schedule_schema.ShoppingListCategory(category=category, items=[item for _, item in group])
+            for category, group in groupby(items, key=lambda entry: entry[0])
+        ]
+    )
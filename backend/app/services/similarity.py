@@ -0,0 +1,250 @@
+# backend/app/services/similarity.py
+
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Set, Tuple
+
+import numpy as np
+from sqlalchemy.orm import Session
+
+from app import cache
+from app.models.recipe_model import RecipeIngredient
+
+# MinHash / LSH parameters.
+# 32 bands of 4 rows puts the LSH threshold around a Jaccard similarity of 0.42
+NUM_PERMUTATIONS = 128
+NUM_BANDS = 32
+ROWS_PER_BAND = NUM_PERMUTATIONS // NUM_BANDS
+
+_PRIME = (1 << 31) - 1    # Keeps a * x + b inside int64 for any ingredient id below 2^31
+_rng = np.random.default_rng(20250215)
+_A = _rng.integers(1, _PRIME, size=NUM_PERMUTATIONS, dtype=np.int64)
+_B = _rng.integers(0, _PRIME, size=NUM_PERMUTATIONS, dtype=np.int64)
+
+CHUNK_ROWS = 20_000                 # recipe ingredient rows hashed per chunk, about 20 MB of hashes
+PARALLEL_THRESHOLD_ROWS = 200_000   # below this a process pool costs more than it saves
+# Worker processes for large builds, started with the app; 0 hashes every build in the serving process
+WORKERS = int(os.environ.get("SIMILARITY_WORKERS", str(os.cpu_count() or 1)))
+
+_pool: Optional[ProcessPoolExecutor] = None
+
+
+def compute_signatures(recipe_ids: np.ndarray, ingredient_ids: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Computes MinHash signatures for (recipe_id, ingredient_id) pairs sorted by recipe_id.
+    Returns the distinct recipe ids and a (recipes x NUM_PERMUTATIONS) signature matrix.
+    """
+    if len(recipe_ids) == 0:
+        return np.empty(0, dtype=np.int64), np.empty((0, NUM_PERMUTATIONS), dtype=np.uint32)
+
+    starts = np.flatnonzero(np.r_[True, recipe_ids[1:] != recipe_ids[:-1]])
+    hashes = (np.outer(ingredient_ids.astype(np.int64), _A) + _B) % _PRIME
+    signatures = np.minimum.reduceat(hashes, starts, axis=0).astype(np.uint32)
+    return recipe_ids[starts], signatures
+
+
+def signature_for(ingredient_ids) -> np.ndarray:
+    """
+    MinHash signature for a single ingredient set
+    """
+    ids = np.fromiter(ingredient_ids, dtype=np.int64)
+    return ((np.outer(ids, _A) + _B) % _PRIME).min(axis=0).astype(np.uint32)
+
+
+def _chunk_bounds(recipe_ids: np.ndarray, chunk_rows: int) -> List[Tuple[int, int]]:
+    """
+    Splits sorted pair arrays into chunks of roughly chunk_rows without splitting a recipe
+    """
+    starts = np.flatnonzero(np.r_[True, recipe_ids[1:] != recipe_ids[:-1]])
+    bounds = []
+    lo = 0
+    while lo < len(recipe_ids):
+        # First recipe boundary at or after lo + chunk_rows
+        i = np.searchsorted(starts, lo + chunk_rows)
+        hi = int(starts[i]) if i < len(starts) else len(recipe_ids)
+        bounds.append((lo, hi))
+        lo = hi
+    return bounds
+
+
+class MinHashLSHIndex:
+    """
+    In-process MinHash signatures with an LSH banding index over recipe ingredient sets.
+    Built lazily from the database and updated incrementally as recipe ingredients change.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._signatures: Dict[int, np.ndarray] = {}
+        self._buckets: List[Dict[bytes, Set[int]]] = [{} for _ in range(NUM_BANDS)]
+        self.is_built = False
+
+    def clear(self) -> None:
+        with self._lock:
+            self._signatures = {}
+            self._buckets = [{} for _ in range(NUM_BANDS)]
+            self.is_built = False
+
+    def build(self, db: Session) -> None:
+        """
+        Rebuilds the index from every recipe ingredient row, hashing a chunk of rows at a time.
+        Large catalogs are hashed across the process pool when the app started one.
+        """
+        rows = db.query(
+            RecipeIngredient.recipe_id,
+            RecipeIngredient.ingredient_id
+        ).order_by(RecipeIngredient.recipe_id).all()
+
+        pairs = np.array(rows, dtype=np.int64).reshape(-1, 2)
+        recipe_ids, ingredient_ids = pairs[:, 0], pairs[:, 1]
+
+        bounds = _chunk_bounds(recipe_ids, CHUNK_ROWS)
+        chunks = ([recipe_ids[lo:hi] for lo, hi in bounds], [ingredient_ids[lo:hi] for lo, hi in bounds])
+        if _pool is not None and len(recipe_ids) >= PARALLEL_THRESHOLD_ROWS:
+            results = list(_pool.map(compute_signatures, *chunks))
+        else:
+            results = list(map(compute_signatures, *chunks))
+
+        signatures: Dict[int, np.ndarray] = {}
+        buckets: List[Dict[bytes, Set[int]]] = [{} for _ in range(NUM_BANDS)]
+        for ids, sigs in results:
+            for recipe_id, signature in zip(ids.tolist(), sigs):
+                signatures[recipe_id] = signature
+                for band, key in enumerate(self._band_keys(signature)):
+                    buckets[band].setdefault(key, set()).add(recipe_id)
+
+        with self._lock:
+            self._signatures = signatures
+            self._buckets = buckets
+            self.is_built = True
+
+    def upsert(self, recipe_id: int, signature: np.ndarray) -> None:
+        with self._lock:
+            self._discard(recipe_id)
+            self._signatures[recipe_id] = signature
+            for band, key in enumerate(self._band_keys(signature)):
+                self._buckets[band].setdefault(key, set()).add(recipe_id)
+
+    def remove(self, recipe_id: int) -> None:
+        with self._lock:
+            self._discard(recipe_id)
+
+    def query(self, recipe_id: int, limit: int) -> List[Tuple[int, float]]:
+        """
+        Returns up to limit (recipe_id, estimated Jaccard similarity) pairs, most similar first
+        """
+        with self._lock:
+            signature = self._signatures.get(recipe_id)
+            if signature is None:
+                return []
+            candidates: Set[int] = set()
+            for band, key in enumerate(self._band_keys(signature)):
+                candidates |= self._buckets[band].get(key, set())
+            candidates.discard(recipe_id)
+            if not candidates:
+                return []
+            candidate_ids = sorted(candidates)
+            candidate_sigs = np.stack([self._signatures[c] for c in candidate_ids])
+
+        scores = (candidate_sigs == signature).mean(axis=1)
+        order = np.lexsort((candidate_ids, -scores))[:limit]
+        return [(candidate_ids[i], float(scores[i])) for i in order]
+
+    def _discard(self, recipe_id: int) -> None:
+        # Caller must hold the lock
+        signature = self._signatures.pop(recipe_id, None)
+        if signature is None:
+            return
+        for band, key in enumerate(self._band_keys(signature)):
+            bucket = self._buckets[band].get(key)
+            if bucket is not None:
+                bucket.discard(recipe_id)
+                if not bucket:
+                    del self._buckets[band][key]
+
+    @staticmethod
+    def _band_keys(signature: np.ndarray) -> List[bytes]:
+        return [
+            signature[band * ROWS_PER_BAND:(band + 1) * ROWS_PER_BAND].tobytes()
+            for band in range(NUM_BANDS)
+        ]
+
+
+def start_pool() -> None:
+    """
+    Starts the worker processes for large index builds.
+    Called from the app's lifespan, so workers are forked at startup rather than inside a request.
+    """
+    global _pool
+    if WORKERS > 0 and _pool is None:
+        _pool = ProcessPoolExecutor(max_workers=WORKERS)
+        # The executor only forks once it has work
+        _pool.submit(int).result()
+
+
+def shutdown_pool() -> None:
+    global _pool
+    if _pool is not None:
+        _pool.shutdown()
+        _pool = None
+
+
+index = MinHashLSHIndex()
+_build_lock = threading.Lock()
+# Recipes changed by other workers, refreshed before the next query
+_stale: Set[int] = set()
+_stale_lock = threading.Lock()
+
+
+def ensure_built(db: Session) -> None:
+    """
+    Builds the shared index on first use
+    """
+    if index.is_built:
+        return
+    with _build_lock:
+        if not index.is_built:
+            index.build(db)
+
+
+def similar_recipes(db: Session, recipe_id: int, limit: int) -> List[Tuple[int, float]]:
+    ensure_built(db)
+    with _stale_lock:
+        stale = list(_stale)
+        _stale.clear()
+    for stale_id in stale:
+        refresh_recipe(db, stale_id)
+    return index.query(recipe_id, limit)
+
+
+def refresh_recipe(db: Session, recipe_id: int) -> None:
+    """
+    Recomputes one recipe's signature after its ingredients change.
+    Does nothing until the index has been built, since the build will pick up the change.
+    """
+    if not index.is_built:
+        return
+    ingredient_ids = [
+        ingredient_id for (ingredient_id,) in db.query(RecipeIngredient.ingredient_id).filter(
+            RecipeIngredient.recipe_id == recipe_id
+        ).all()
+    ]
+    if ingredient_ids:
+        index.upsert(recipe_id, signature_for(ingredient_ids))
+    else:
+        index.remove(recipe_id)
+
+
+def remove_recipe(recipe_id: int) -> None:
+    index.remove(recipe_id)
+
+
+def _mark_stale(names: List[str]) -> None:
+    recipe_ids = {int(name.split(":", 1)[1]) for name in names if name.startswith("recipe:")}
+    if recipe_ids and index.is_built:
+        with _stale_lock:
+            _stale.update(recipe_ids)
+
+
+cache.subscribe(_mark_stale)
@@ -0,0 +1,195 @@
+# backend/app/services/unit_conversion.py
+
+import threading
+from typing import Dict, Iterable, Optional, Tuple
+
+import numpy as np
+from sqlalchemy.orm import Session
+
+from app import cache
+from app.models.measurement_model import MeasurementUnit, UnitCategory, UnitConversion
+from app.models.recipe_model import RecipeIngredient
+
+# Canonical unit per category that recipe ingredient quantities are normalized to
+BASE_UNIT_ABBREVIATIONS = {
+    UnitCategory.VOLUME: "ml",
+    UnitCategory.WEIGHT: "g",
+    UnitCategory.QUANTITY: "pc",
+}
+
+
+class ConversionMatrix:
+    """
+    Immutable snapshot of every unit-to-unit ratio, indexed by unit id.
+    ratios[from_unit_id, to_unit_id] is the multiplier from one unit to the other,
+    or NaN when the units are in different categories or no conversion path exists.
+    """
+
+    def __init__(
+        self,
+        units: Dict[int, UnitCategory],
+        conversions: Iterable[Tuple[int, int, float]],
+        base_units: Optional[Dict[UnitCategory, int]] = None
+    ):
+        conversions = list(conversions)
+        base_units = base_units or {}
+        size = max(units, default=0) + 2    # Last row and column are never a unit, so stay NaN
+        ratios = np.full((size, size), np.nan)
+        categories = np.full(size, -1, dtype=np.int8)
+        base_unit_ids = np.full(size, size - 1, dtype=np.intp)     # NaN row for units without a base
+
+        # Transitive closure is computed per category, so each category fills its own block
+        for code, category in enumerate(UnitCategory):
+            members = [unit_id for unit_id, unit_category in units.items() if unit_category == category]
+            if not members:
+                continue
+            local = {unit_id: i for i, unit_id in enumerate(members)}
+
+            block = np.full((len(members), len(members)), np.nan)
+            np.fill_diagonal(block, 1.0)
+            for from_id, to_id, ratio in conversions:
+                if from_id in local and to_id in local:
+                    block[local[from_id], local[to_id]] = ratio
+                    block[local[to_id], local[from_id]] = 1.0 / ratio
+
+            # Floyd-Warshall over products: fill any missing ratio via intermediate unit k
+            for k in range(len(members)):
+                block = np.where(np.isnan(block), block[:, k:k + 1] * block[k:k + 1, :], block)
+
+            index = np.array(members, dtype=np.intp)
+            ratios[np.ix_(index, index)] = block
+            categories[index] = code
+            if category in base_units:
+                base_unit_ids[index] = base_units[category]
+
+        ratios.setflags(write=False)
+        categories.setflags(write=False)
+        base_unit_ids.setflags(write=False)
+        self.ratios = ratios
+        self.categories = categories
+        self.base_unit_ids = base_unit_ids
+        self.units = dict(units)
+
+    def ratio(self, from_unit_id: int, to_unit_id: int) -> Optional[float]:
+        """
+        Returns the multiplier from one unit to another, or None if they can't be converted
+        """
+        if not (0 <= from_unit_id < len(self.ratios) and 0 <= to_unit_id < len(self.ratios)):
+            return None
+        value = self.ratios[from_unit_id, to_unit_id]
+        return None if np.isnan(value) else float(value)
+
+    def convert_many(
+        self,
+        quantities: np.ndarray,
+        from_unit_ids: np.ndarray,
+        to_unit_ids: np.ndarray
+    ) -> np.ndarray:
+        """
+        Converts arrays of quantities in one gather-and-multiply against the ratio matrix.
+        Items that can't be converted (unknown units, different categories) come back as NaN.
+        """
+        quantities = np.asarray(quantities, dtype=np.float64)
+        from_unit_ids = np.asarray(from_unit_ids, dtype=np.intp)
+        to_unit_ids = np.asarray(to_unit_ids, dtype=np.intp)
+
+        size = len(self.ratios)
+        flat_index = from_unit_ids * size
+        flat_index += to_unit_ids
+        if len(flat_index) and (
+            min(from_unit_ids.min(), to_unit_ids.min()) < 0 or max(from_unit_ids.max(), to_unit_ids.max()) >= size
+        ):
+            # Out-of-range ids are pointed at the last cell, which is always NaN
+            known = (from_unit_ids >= 0) & (from_unit_ids < size) & (to_unit_ids >= 0) & (to_unit_ids < size)
+            flat_index[~known] = size * size - 1
+
+        converted = np.take(self.ratios.ravel(), flat_index)
+        converted *= quantities
+        return converted
+
+    def to_base(self, quantity: float, unit_id: int) -> Tuple[Optional[float], Optional[int]]:
+        """
+        Converts a quantity to its category's base unit.
+        Returns (None, None) if the unit has no path to a base unit.
+        """
+        if not 0 <= unit_id < len(self.base_unit_ids):
+            return None, None
+        base_unit_id = int(self.base_unit_ids[unit_id])
+        ratio = self.ratio(unit_id, base_unit_id)
+        if ratio is None:
+            return None, None
+        return quantity * ratio, base_unit_id
+
+
+def load_matrix(db: Session) -> ConversionMatrix:
+    """
+    Builds a new conversion matrix from the measurement_units and unit_conversions tables
+    """
+    unit_rows = db.query(MeasurementUnit.id, MeasurementUnit.category, MeasurementUnit.abbreviation).all()
+    units = {unit_id: category for unit_id, category, _ in unit_rows}
+    base_units = {
+        category: unit_id for unit_id, category, abbreviation in unit_rows
+        if BASE_UNIT_ABBREVIATIONS.get(category) == abbreviation
+    }
+    conversions = db.query(
+        UnitConversion.from_unit_id,
+        UnitConversion.to_unit_id,
+        UnitConversion.ratio
+    ).all()
+    return ConversionMatrix(units, conversions, base_units)
+
+
+def refresh_base_quantities(db: Session, matrix: ConversionMatrix) -> None:
+    """
+    Recomputes every recipe ingredient's base quantity from a new matrix.
+    One UPDATE per unit, run in the caller's transaction alongside the conversion change.
+    """
+    for unit_id in matrix.units:
+        ratio, base_unit_id = matrix.to_base(1.0, unit_id)
+        db.query(RecipeIngredient).filter(RecipeIngredient.unit_id == unit_id).update(
+            {
+                RecipeIngredient.base_quantity: RecipeIngredient.quantity * ratio if ratio is not None else None,
+                RecipeIngredient.base_unit_id: base_unit_id
+            },
+            synchronize_session=False
+        )
+
+
+_matrix: Optional[ConversionMatrix] = None
+_matrix_version: Optional[int] = None
+_lock = threading.Lock()
+
+
+def get_matrix(db: Session) -> ConversionMatrix:
+    """
+    Returns the shared conversion matrix, loading it on first use and again once the "units"
+    cache version moves on, e.g. after another worker changed a conversion
+    """
+    global _matrix, _matrix_version
+    units_version = cache.version("units")
+    matrix = _matrix
+    if matrix is None or _matrix_version != units_version:
+        with _lock:
+            if _matrix is None or _matrix_version != units_version:
+                _matrix = load_matrix(db)
+                _matrix_version = units_version
+            matrix = _matrix
+    return matrix
+
+
+def install(matrix: ConversionMatrix) -> None:
+    """
+    Replaces the shared matrix after conversions change, once the change is committed.
+    The new matrix is swapped in whole, so readers never see a partial rebuild.
+    """
+    global _matrix, _matrix_version
+    with _lock:
+        _matrix = matrix
+        _matrix_version = cache.version("units")
+
+
+def reset() -> None:
+    global _matrix, _matrix_version
+    with _lock:
+        _matrix = None
+        _matrix_version = None
@@ -0,0 +1,142 @@
+# backend/app/slow_queries.py
+
+import json
+import logging
+import os
+import random
+import threading
+from collections import deque
+from datetime import date, datetime, timezone
+from logging.handlers import RotatingFileHandler
+from typing import Any, Deque, Dict, List, Optional
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Statements running at least this long are logged with their query plan
+THRESHOLD_SECONDS = float(os.environ.get("SLOW_QUERY_MS", "100")) / 1000
+# Fraction of slow queries also kept in memory for GET /admin/slow-queries
+SAMPLE_RATE = float(os.environ.get("SLOW_QUERY_SAMPLE_RATE", "1.0"))
+BUFFER_SIZE = 200
+
+LOG_PATH = os.environ.get("SLOW_QUERY_LOG", os.path.join(BASE_DIR, "slow_queries.log"))
+LOG_MAX_BYTES = 10 * 1024 * 1024
+LOG_BACKUPS = 5
+
+logger = logging.getLogger(__name__)
+logger.propagate = False
+
+_buffer: Deque[Dict[str, Any]] = deque(maxlen=BUFFER_SIZE)
+_handler_lock = threading.Lock()
+
+
+def configure_log(path: str) -> None:
+    """
+    Writes slow queries as JSON lines to a log file rotated at LOG_MAX_BYTES
+    """
+    handler = RotatingFileHandler(path, maxBytes=LOG_MAX_BYTES, backupCount=LOG_BACKUPS, delay=True)
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    with _handler_lock:
+        for old_handler in logger.handlers[:]:
+            logger.removeHandler(old_handler)
+            old_handler.close()
+        logger.addHandler(handler)
+        logger.setLevel(logging.WARNING)
+
+
+def _ensure_handler() -> None:
+    """The default log file is only set up once there is something to write"""
+    if not logger.handlers:
+        configure_log(LOG_PATH)
+
+
+def redact(value: Any) -> Any:
+    """
+    Keeps numbers, dates and NULLs, which show how a query was bound; text and blobs may hold
+    user data, so only their type and length are kept
+    """
+    if value is None or isinstance(value, (bool, int, float, date)):
+        return value.isoformat() if isinstance(value, date) else value
+    if isinstance(value, (str, bytes)):
+        return f"<{type(value).__name__}:{len(value)}>"
+    if isinstance(value, dict):
+        return {key: redact(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [redact(item) for item in value]
+    return f"<{type(value).__name__}>"
+
+
+def explain(dbapi_connection: Any, statement: str, parameters: Any) -> List[str]:
+    """
+    SQLite's EXPLAIN QUERY PLAN for a statement, one line per step, indented under its parent
+    """
+    cursor = dbapi_connection.cursor()
+    try:
+        rows = cursor.execute(f"EXPLAIN QUERY PLAN {statement}", parameters or ()).fetchall()
+    finally:
+        cursor.close()
+
+    depths = {0: -1}
+    lines = []
+    for step_id, parent_id, _, detail in rows:
+        depths[step_id] = depths.get(parent_id, -1) + 1
+        lines.append("  " * depths[step_id] + detail)
+    return lines
+
+
+def full_scans(plan: List[str]) -> List[str]:
+    """Steps reading every row of a table instead of using an index"""
+    return [
+        step.strip() for step in plan
+        if step.strip().startswith("SCAN ")
+        and " USING " not in step
+        and "VIRTUAL TABLE" not in step
+        and step.strip() != "SCAN CONSTANT ROW"
+    ]
+
+
+def record(
+    dbapi_cursor: Any,
+    dialect: str,
+    statement: str,
+    parameters: Any,
+    seconds: float,
+    executemany: bool,
+    route: Optional[str]
+) -> Dict[str, Any]:
+    """
+    Writes a slow statement to the log, with its plan when SQLite can explain it,
+    and keeps a sample of them in memory
+    """
+    plan: List[str] = []
+    if dialect == "sqlite" and not executemany:
+        try:
+            plan = explain(dbapi_cursor.connection, statement, parameters)
+        except Exception as error:       # the plan is a diagnostic; never fail the query over it
+            plan = [f"EXPLAIN failed: {error}"]
+
+    entry = {
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "duration_ms": round(seconds * 1000, 3),
+        "route": route,
+        "statement": statement,
+        "parameters": redact(parameters[:1] if executemany else parameters),
+        "executemany": executemany,
+        "plan": plan,
+        "full_scans": full_scans(plan),
+    }
+
+    _ensure_handler()
+    logger.warning(json.dumps(entry))
+    if random.random() < SAMPLE_RATE:
+        _buffer.append(entry)
+    return entry
+
+
+def recent(limit: Optional[int] = None) -> List[Dict[str, Any]]:
+    """Sampled slow queries, newest first"""
+    entries = list(_buffer)[::-1]
+    return entries[:limit] if limit is not None else entries
+
+
+def clear() -> None:
+    _buffer.clear()
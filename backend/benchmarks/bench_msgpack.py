@@ -0,0 +1,98 @@
+# backend/benchmarks/bench_msgpack.py
+"""
+Compares JSON and MessagePack bodies for the recipe list, schedule range and ingredient list:
+payload size, time to render on the server and time to decode on the client.
+
+Run from the backend directory:
+    python -m benchmarks.bench_msgpack
+"""
+
+import json
+import os
+import tempfile
+import time
+
+import msgpack
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.models import Base
+from app.responses import json_to_msgpack, msgpack_requested
+from app.routes import ingredient_routes, recipes_routes, schedule_routes
+from benchmarks.bench_responses import RANGE, REPEATS, load
+
+ENDPOINTS = {
+    "recipe list": lambda db: recipes_routes.get_recipes(offset=0, limit=100, db=db).body,
+    "schedule range": lambda db: schedule_routes.get_schedules_by_date_Range(
+        start_date=RANGE[0], end_date=RANGE[1], expand=None, limit=None, cursor=None,
+        response_format="json", db=db
+    ).body,
+    "schedule range, expand": lambda db: schedule_routes.get_schedules_by_date_Range(
+        start_date=RANGE[0], end_date=RANGE[1], expand="recipe", limit=None, cursor=None,
+        response_format="json", db=db
+    ).body,
+    "ingredient list": lambda db: ingredient_routes._render_ingredients(
+        db, offset=0, limit=100, category=None, search=None
+    ),
+}
+
+
+def render(endpoint, session_factory, packed: bool):
+    """Best time to render the endpoint's body, and the body"""
+    token = msgpack_requested.set(packed)
+    try:
+        timings = []
+        for _ in range(REPEATS):
+            db = session_factory()
+            start = time.perf_counter()
+            body = endpoint(db)
+            timings.append(time.perf_counter() - start)
+            db.close()
+    finally:
+        msgpack_requested.reset(token)
+
+    # The ingredient list renders JSON bytes for the cache; MessagePack is converted from them once
+    if packed and body[:1] in (b"[", b"{"):
+        start = time.perf_counter()
+        body = json_to_msgpack(body)
+        timings = [timing + time.perf_counter() - start for timing in timings]
+    return min(timings), body
+
+
+def decode(loads, body: bytes) -> float:
+    timings = []
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        loads(body)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    path = os.path.join(tempfile.mkdtemp(), "bench_msgpack.db")
+    engine = create_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(bind=engine)
+    session_factory = sessionmaker(bind=engine)
+    load(session_factory)
+
+    print(f"{'endpoint':<24}{'format':<9}{'KB':>7}{'render ms':>11}{'decode ms':>11}")
+    for name, endpoint in ENDPOINTS.items():
+        json_time, json_body = render(endpoint, session_factory, packed=False)
+        msgpack_time, msgpack_body = render(endpoint, session_factory, packed=True)
+        assert msgpack.unpackb(msgpack_body) == json.loads(json_body)
+
+        for label, body, render_time, loads in [
+            ("json", json_body, json_time, json.loads),
+            ("msgpack", msgpack_body, msgpack_time, msgpack.unpackb),
+        ]:
+            print(
+                f"{name if label == 'json' else '':<24}{label:<9}{len(body) / 1024:>7.0f}"
+                f"{render_time * 1000:>11.2f}{decode(loads, body) * 1000:>11.2f}"
+            )
+
+    engine.dispose()
+    os.remove(path)
+
+
+if __name__ == "__main__":
+    main()
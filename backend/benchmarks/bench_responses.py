@@ -0,0 +1,158 @@
+# backend/benchmarks/bench_responses.py
+"""
+Compares the response_model path (ORM objects validated by FastAPI, then dumped to JSON) against
+the fast response layer on the recipe list, schedule range and ingredient list endpoints.
+
+Run from the backend directory:
+    python -m benchmarks.bench_responses
+"""
+
+import os
+import random
+import tempfile
+import time
+from datetime import date, timedelta
+from typing import List
+
+from pydantic import TypeAdapter
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.models import (
+    Base, Direction, Ingredient, IngredientCategory, MeasurementUnit, Recipe, RecipeIngredient, Schedule, UnitCategory
+)
+from app.models.schedule_model import overlapping
+from app.routes import ingredient_routes, recipes_routes, schedule_routes
+from app.schemas import ingredient_schema, recipe_schema, schedule_schema
+
+N_RECIPES = 100
+N_INGREDIENTS = 100
+N_SCHEDULES = 2_000
+REPEATS = 10
+RANGE = (date(2025, 1, 1), date(2025, 12, 31))
+
+
+def load(session_factory, seed: int = 0) -> None:
+    """
+    Recipes with 8 directions and 10 ingredients each, a page of ingredients and a year of schedules
+    """
+    rng = random.Random(seed)
+    db = session_factory()
+    db.add_all([
+        MeasurementUnit(id=unit_id, name=f"Unit {unit_id}", abbreviation=f"u{unit_id}",
+                        category=UnitCategory.WEIGHT, is_metric=True, is_common=True)
+        for unit_id in range(1, 6)
+    ])
+    ingredients = [
+        Ingredient(name=f"Ingredient {i}", preferred_unit_id=1 + i % 5,
+                   category=rng.choice(list(IngredientCategory)), description="A fine ingredient " * 3)
+        for i in range(N_INGREDIENTS)
+    ]
+    db.add_all(ingredients)
+    db.flush()
+
+    recipes = []
+    for r in range(N_RECIPES):
+        recipe = Recipe(title=f"Recipe {r}", description="Tasty " * 30, cooking_time=30, servings=4)
+        recipe.directions = [Direction(direction_number=k, instruction="Stir gently " * 10) for k in range(8)]
+        recipe.recipe_ingredients = [
+            RecipeIngredient(ingredient_id=rng.choice(ingredients).id, quantity=rng.uniform(1, 500), unit_id=1 + k % 5)
+            for k in range(10)
+        ]
+        recipes.append(recipe)
+    db.add_all(recipes)
+    db.flush()
+
+    for _ in range(N_SCHEDULES):
+        start = RANGE[0] + timedelta(days=rng.randrange(365))
+        db.add(Schedule(recipe_id=rng.choice(recipes).id, start_date=start, end_date=start + timedelta(days=rng.choice([0, 0, 1]))))
+    db.commit()
+    db.close()
+
+
+def response_model_path(adapter: TypeAdapter, content) -> bytes:
+    """What FastAPI does with a response_model: validate the returned objects, then dump them"""
+    return adapter.dump_json(adapter.validate_python(content, from_attributes=True))
+
+
+def best_of(fn, session_factory) -> float:
+    timings = []
+    for _ in range(REPEATS):
+        db = session_factory()
+        start = time.perf_counter()
+        fn(db)
+        timings.append(time.perf_counter() - start)
+        db.close()
+    return min(timings)
+
+
+def main():
+    path = os.path.join(tempfile.mkdtemp(), "bench_responses.db")
+    engine = create_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(bind=engine)
+    session_factory = sessionmaker(bind=engine)
+    load(session_factory)
+
+    # Previous handlers: ORM objects (lazy relationships) or handler-built models through response_model
+    before = {
+        "recipe list": lambda db: response_model_path(
+            TypeAdapter(List[recipe_schema.Recipe]),
+            db.query(Recipe).offset(0).limit(100).all()
+        ),
+        "schedule range": lambda db: response_model_path(
+            TypeAdapter(List[schedule_schema.CalendarSchedule]),
+            [
+                schedule_schema.CalendarSchedule(
+                    id=row.id, recipe_id=row.recipe_id, start_date=row.start_date, end_date=row.end_date,
+                    meal_type=row.meal_type, notes=row.notes,
+                    recipe=recipe_schema.RecipeSummary(
+                        id=row.recipe_id, title=row.title, cooking_time=row.cooking_time, servings=row.servings
+                    )
+                )
+                for row in db.query(*schedule_routes._calendar_columns).join(
+                    Recipe, Recipe.id == Schedule.recipe_id
+                ).filter(overlapping(*RANGE)).order_by(Schedule.start_date, Schedule.id).all()
+            ]
+        ),
+        "schedule range, expand": lambda db: response_model_path(
+            TypeAdapter(List[schedule_schema.Schedule]),
+            db.query(Schedule).options(*schedule_routes._full_recipe_options).filter(
+                overlapping(*RANGE)
+            ).order_by(Schedule.start_date, Schedule.id).all()
+        ),
+        "ingredient list": lambda db: response_model_path(
+            TypeAdapter(List[ingredient_schema.Ingredient]),
+            db.query(Ingredient).offset(0).limit(100).all()
+        ),
+    }
+    after = {
+        "recipe list": lambda db: recipes_routes.get_recipes(offset=0, limit=100, db=db).body,
+        "schedule range": lambda db: schedule_routes.get_schedules_by_date_Range(
+            start_date=RANGE[0], end_date=RANGE[1], expand=None, limit=None, cursor=None,
+            response_format="json", db=db
+        ).body,
+        "schedule range, expand": lambda db: schedule_routes.get_schedules_by_date_Range(
+            start_date=RANGE[0], end_date=RANGE[1], expand="recipe", limit=None, cursor=None,
+            response_format="json", db=db
+        ).body,
+        # The route caches rendered bodies by ETag, so time the render it caches
+        "ingredient list": lambda db: ingredient_routes._render_ingredients(
+            db, offset=0, limit=100, category=None, search=None
+        ),
+    }
+
+    print(f"{'endpoint':<24}{'KB':>8}{'before ms':>11}{'after ms':>10}{'speedup':>9}")
+    for name in before:
+        db = session_factory()
+        size = len(after[name](db)) / 1024
+        db.close()
+        before_time = best_of(before[name], session_factory)
+        after_time = best_of(after[name], session_factory)
+        print(f"{name:<24}{size:>8.0f}{before_time * 1000:>11.2f}{after_time * 1000:>10.2f}{before_time / after_time:>8.1f}x")
+
+    engine.dispose()
+    os.remove(path)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+# backend/benchmarks/bench_schedule_overlap.py
+"""
+Compares calendar overlap queries on 1M schedules: full scan, B-tree index and R*Tree.
+
+Run from the backend directory:
+    python -m benchmarks.bench_schedule_overlap
+"""
+
+import os
+import tempfile
+import time
+from datetime import date, timedelta
+
+import numpy as np
+from sqlalchemy import create_engine, select
+
+from app.models import Base, Schedule
+from app.models.schedule_model import overlapping
+
+N_SCHEDULES = 1_000_000
+REPEATS = 5
+FIRST_DAY = date(2000, 1, 1)
+SPAN_DAYS = 365 * 25
+
+WINDOWS = {
+    "week, early": (date(2001, 3, 4), 7),
+    "week, recent": (date(2024, 6, 2), 7),
+    "month, recent": (date(2024, 6, 1), 30),
+    "year, recent": (date(2024, 1, 1), 365),
+}
+
+
+def load(engine, n: int, seed: int = 0) -> None:
+    """
+    Schedules spread evenly over 25 years, mostly single-day with some multi-day spans
+    """
+    rng = np.random.default_rng(seed)
+    starts = rng.integers(0, SPAN_DAYS, size=n)
+    lengths = rng.choice([0, 0, 0, 0, 1, 2, 6], size=n)
+    rows = [
+        (
+            1,
+            (FIRST_DAY + timedelta(days=int(start))).isoformat(),
+            (FIRST_DAY + timedelta(days=int(start + length))).isoformat(),
+        )
+        for start, length in zip(starts, lengths)
+    ]
+    with engine.begin() as conn:
+        conn.exec_driver_sql("INSERT INTO recipes (id, title, description, cooking_time, servings) VALUES (1, 'r', '', 1, 1)")
+        conn.exec_driver_sql(
+            "INSERT INTO schedules (recipe_id, start_date, end_date) VALUES (?, ?, ?)",
+            rows
+        )
+        conn.exec_driver_sql("ANALYZE")
+
+
+def best_of(query) -> float:
+    timings = []
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        query()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    path = os.path.join(tempfile.mkdtemp(), "bench_schedules.db")
+    engine = create_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(bind=engine)
+
+    start = time.perf_counter()
+    load(engine, N_SCHEDULES)
+    print(f"Loaded {N_SCHEDULES:,} schedules in {time.perf_counter() - start:.1f} s\n")
+
+    scan = "SELECT id FROM schedules NOT INDEXED WHERE start_date <= ? AND end_date >= ?"
+    btree = "SELECT id FROM schedules INDEXED BY ix_schedules_start_date_end_date WHERE start_date <= ? AND end_date >= ?"
+
+    print(f"{'window':<16}{'rows':>8}{'scan ms':>10}{'b-tree ms':>11}{'r*tree ms':>11}")
+    with engine.connect() as conn:
+        for name, (first, days) in WINDOWS.items():
+            last = first + timedelta(days=days - 1)
+            params = (last.isoformat(), first.isoformat())
+            rtree = select(Schedule.id).where(overlapping(first, last))
+
+            rows = len(conn.execute(rtree).fetchall())
+            assert rows == len(conn.exec_driver_sql(scan, params).fetchall())
+            print(
+                f"{name:<16}{rows:>8}"
+                f"{best_of(lambda: conn.exec_driver_sql(scan, params).fetchall()) * 1000:>10.2f}"
+                f"{best_of(lambda: conn.exec_driver_sql(btree, params).fetchall()) * 1000:>11.2f}"
+                f"{best_of(lambda: conn.execute(rtree).fetchall()) * 1000:>11.2f}"
+            )
+
+    engine.dispose()
+    os.remove(path)
+
+
+if __name__ == "__main__":
+    main()
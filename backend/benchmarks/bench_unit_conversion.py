@@ -0,0 +1,98 @@
+# backend/benchmarks/bench_unit_conversion.py
+"""
+Compares vectorized bulk unit conversion against a per-item Python loop.
+
+Run from the backend directory:
+    python -m benchmarks.bench_unit_conversion
+"""
+
+import time
+
+import numpy as np
+
+from app.models.measurement_model import UnitCategory
+from app.services.unit_conversion import ConversionMatrix
+
+N_ITEMS = 100_000
+REPEATS = 5
+TARGET_SPEEDUP = 100
+
+# Mirrors the seeded measurement units and base-unit conversions
+UNITS = {
+    **{unit_id: UnitCategory.VOLUME for unit_id in range(1, 10)},
+    **{unit_id: UnitCategory.WEIGHT for unit_id in range(10, 15)},
+    **{unit_id: UnitCategory.QUANTITY for unit_id in range(15, 21)},
+}
+CONVERSIONS = [
+    (2, 1, 1000.0), (3, 1, 4.92892), (4, 1, 14.7868), (5, 1, 29.5735),
+    (6, 1, 236.588), (7, 1, 473.176), (8, 1, 946.353), (9, 1, 3785.41),
+    (10, 11, 0.001), (12, 11, 1000.0), (13, 11, 28.3495), (14, 11, 453.592),
+    (16, 15, 12.0),
+]
+
+
+def make_items(n: int, seed: int = 0):
+    """
+    Random same-category conversions, the shape a shopping list or scaling request produces
+    """
+    rng = np.random.default_rng(seed)
+    groups = [np.arange(1, 10), np.arange(10, 15), np.array([15, 16])]
+    choice = rng.integers(0, len(groups), size=n)
+    from_ids = np.empty(n, dtype=np.intp)
+    to_ids = np.empty(n, dtype=np.intp)
+    for g, members in enumerate(groups):
+        mask = choice == g
+        from_ids[mask] = rng.choice(members, size=mask.sum())
+        to_ids[mask] = rng.choice(members, size=mask.sum())
+    quantities = rng.uniform(0.1, 500, size=n)
+    return quantities, from_ids, to_ids
+
+
+def per_item_loop(matrix: ConversionMatrix, quantities, from_ids, to_ids):
+    results = []
+    for quantity, from_id, to_id in zip(quantities, from_ids, to_ids):
+        ratio = matrix.ratio(from_id, to_id)
+        if ratio is None:
+            raise ValueError(f"Cannot convert from unit {from_id} to unit {to_id}")
+        results.append(quantity * ratio)
+    return results
+
+
+def best_of(fn, *args, number: int = 1) -> float:
+    """
+    Best per-call time over REPEATS rounds of number calls
+    """
+    timings = []
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        for _ in range(number):
+            fn(*args)
+        timings.append((time.perf_counter() - start) / number)
+    return min(timings)
+
+
+def main():
+    matrix = ConversionMatrix(UNITS, CONVERSIONS)
+    quantities, from_ids, to_ids = make_items(N_ITEMS)
+
+    # The loop gets plain lists, its fastest input. The vectorized path gets the arrays internal
+    # callers (scaling, shopping lists) hand it and returns one, which is what the target is about.
+    # List input is timed separately: the batch endpoint pays that conversion at its JSON boundary.
+    items = (quantities.tolist(), from_ids.tolist(), to_ids.tolist())
+    vectorized = matrix.convert_many(quantities, from_ids, to_ids)
+    assert np.allclose(vectorized, per_item_loop(matrix, *items))
+
+    loop_time = best_of(per_item_loop, matrix, *items)
+    vector_time = best_of(matrix.convert_many, quantities, from_ids, to_ids, number=50)
+    list_time = best_of(matrix.convert_many, *items, number=20)
+
+    speedup = loop_time / vector_time
+    print(f"{N_ITEMS:,} conversions")
+    print(f"  per-item loop:          {loop_time * 1000:8.2f} ms")
+    print(f"  vectorized, arrays:     {vector_time * 1000:8.2f} ms  {speedup:6.1f}x")
+    print(f"  vectorized, from lists: {list_time * 1000:8.2f} ms  {loop_time / list_time:6.1f}x")
+    print(f"  target {TARGET_SPEEDUP}x on arrays: {'met' if speedup >= TARGET_SPEEDUP else 'NOT met'}")
+
+
+if __name__ == "__main__":
+    main()
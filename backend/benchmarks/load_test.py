@@ -0,0 +1,311 @@
+# backend/benchmarks/load_test.py
+"""
+Load driver replaying a weighted traffic mix (recipe list and detail, ingredient search, calendar
+and range reads, schedule, recipe and direction writes) against the API, reporting throughput and
+p50/p95/p99 latency per operation. Results can be saved as JSON and compared with a baseline.
+
+In-process against a synthetic database (seeded into a temporary file by app.seed unless --db is given):
+    python -m benchmarks.load_test --recipes 2000 --requests 5000 --concurrency 16 --output results.json
+Against a running server on a database seeded by python -m app.seed, started with DATABASE_URL=sqlite:///bench.db:
+    python -m benchmarks.load_test --url http://127.0.0.1:8000 --compare results.json
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import tempfile
+import time
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta, timezone
+from typing import Callable, Dict, List, Optional, Tuple
+
+import httpx
+import numpy as np
+from sqlalchemy import create_engine, func
+from sqlalchemy.orm import Session, sessionmaker
+
+from app import seed
+from app.models import Recipe, Schedule
+
+API = "/api/v1"
+LAST_DAY = seed.FIRST_DAY + timedelta(days=365 * 3 - 1)
+PERCENTILES = (50, 95, 99)
+
+# (method, path, query params, JSON body)
+Call = Tuple[str, str, Optional[dict], Optional[dict]]
+
+
+@dataclass
+class Dataset:
+    """What the traffic generator needs to know about the target database"""
+    recipes: int
+    first_day: date
+    last_day: date
+
+
+def _day(rng: np.random.Generator, dataset: Dataset) -> date:
+    return dataset.first_day + timedelta(days=int(rng.integers((dataset.last_day - dataset.first_day).days + 1)))
+
+
+def _recipe_id(rng: np.random.Generator, dataset: Dataset) -> int:
+    return int(rng.integers(1, dataset.recipes + 1))
+
+
+def recipe_list(rng, dataset) -> Call:
+    return "GET", f"{API}/recipe/", {"offset": int(rng.integers(0, max(dataset.recipes - 20, 1))), "limit": 20}, None
+
+
+def recipe_detail(rng, dataset) -> Call:
+    return "GET", f"{API}/recipe/{_recipe_id(rng, dataset)}", None, None
+
+
+def ingredient_search(rng, dataset) -> Call:
+    term = seed.FOODS[rng.integers(len(seed.FOODS))][:3]
+    return "GET", f"{API}/ingredients/", {"search": term, "limit": 20}, None
+
+
+def calendar_week(rng, dataset) -> Call:
+    return "GET", f"{API}/schedule/calendar/", {"view": "week", "day": _day(rng, dataset).isoformat()}, None
+
+
+def calendar_month(rng, dataset) -> Call:
+    return "GET", f"{API}/schedule/calendar/", {"view": "month", "day": _day(rng, dataset).isoformat()}, None
+
+
+def schedule_range(rng, dataset) -> Call:
+    start = _day(rng, dataset)
+    params = {"start_date": start.isoformat(), "end_date": (start + timedelta(days=27)).isoformat()}
+    return "GET", f"{API}/schedule/range/", params, None
+
+
+def create_schedule(rng, dataset) -> Call:
+    start = _day(rng, dataset)
+    body = {"start_date": start.isoformat(), "end_date": start.isoformat(), "meal_type": "snacks"}
+    return "POST", f"{API}/schedule/recipe/{_recipe_id(rng, dataset)}", None, body
+
+
+def update_recipe(rng, dataset) -> Call:
+    recipe_id = _recipe_id(rng, dataset)
+    body = {
+        "title": f"Benchmark Recipe #{recipe_id}",
+        "description": "Updated by the load driver.",
+        "cooking_time": int(rng.integers(10, 120)),
+        "servings": int(rng.integers(1, 8)),
+    }
+    return "PUT", f"{API}/recipe/{recipe_id}", None, body
+
+
+def add_direction(rng, dataset) -> Call:
+    # Far past the generated direction numbers, and unlikely to repeat within a run
+    body = {"direction_number": int(rng.integers(100, 1_000_000_000)), "instruction": "Serve warm."}
+    return "POST", f"{API}/direction/recipe/{_recipe_id(rng, dataset)}", None, body
+
+
+# Operation weights of each traffic mix
+MIXES: Dict[str, Dict[Callable, int]] = {
+    "browse": {
+        recipe_list: 20, recipe_detail: 30, ingredient_search: 15, calendar_week: 15, calendar_month: 5,
+        schedule_range: 5, create_schedule: 5, update_recipe: 3, add_direction: 2,
+    },
+    "planning": {
+        recipe_list: 5, recipe_detail: 15, ingredient_search: 5, calendar_week: 25, calendar_month: 15,
+        schedule_range: 10, create_schedule: 20, update_recipe: 2, add_direction: 3,
+    },
+    "reads": {
+        recipe_list: 20, recipe_detail: 35, ingredient_search: 15, calendar_week: 15, calendar_month: 10,
+        schedule_range: 5,
+    },
+}
+
+
+def plan(mix: str, requests: int, dataset: Dataset, seed: int = 0) -> List[Tuple[str, Call]]:
+    """The seeded sequence of (operation name, call) to replay"""
+    rng = np.random.default_rng(seed)
+    operations = list(MIXES[mix])
+    weights = np.array([MIXES[mix][operation] for operation in operations], dtype=float)
+    choices = rng.choice(len(operations), size=requests, p=weights / weights.sum())
+    return [(operations[choice].__name__, operations[choice](rng, dataset)) for choice in choices]
+
+
+async def replay(
+    client: httpx.AsyncClient,
+    calls: List[Tuple[str, Call]],
+    concurrency: int
+) -> Tuple[Dict[str, List[float]], Dict[str, int], float]:
+    """
+    Sends the calls from concurrency workers taking the next call as they finish one.
+    Returns each operation's latencies in seconds, its error count and the wall time.
+    """
+    latencies: Dict[str, List[float]] = {name: [] for name, _ in calls}
+    errors: Dict[str, int] = {name: 0 for name in latencies}
+    pending = iter(calls)
+
+    async def worker() -> None:
+        for name, (method, path, params, body) in pending:
+            start = time.perf_counter()
+            try:
+                response = await client.request(method, path, params=params, json=body)
+                failed = response.status_code >= 400
+            except httpx.HTTPError:
+                failed = True
+            latencies[name].append(time.perf_counter() - start)
+            errors[name] += failed
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return latencies, errors, time.perf_counter() - start
+
+
+def summarize(latencies: List[float], errors: int, wall_seconds: float) -> dict:
+    values = np.array(latencies) * 1000
+    summary = {
+        "requests": len(latencies),
+        "errors": errors,
+        "throughput": round(len(latencies) / wall_seconds, 2),
+        "mean_ms": round(float(values.mean()), 3),
+    }
+    for percentile, value in zip(PERCENTILES, np.percentile(values, PERCENTILES)):
+        summary[f"p{percentile}_ms"] = round(float(value), 3)
+    return summary
+
+
+def report(latencies: Dict[str, List[float]], errors: Dict[str, int], wall_seconds: float) -> dict:
+    return {
+        "overall": summarize(
+            [latency for values in latencies.values() for latency in values], sum(errors.values()), wall_seconds
+        ),
+        "operations": {
+            name: summarize(values, errors[name], wall_seconds) for name, values in sorted(latencies.items())
+        },
+    }
+
+
+def describe(db: Session) -> Dataset:
+    """Recipe count and schedule span of an existing database"""
+    first_day, last_day = db.query(func.min(Schedule.start_date), func.max(Schedule.end_date)).one()
+    return Dataset(
+        recipes=db.query(func.max(Recipe.id)).scalar() or 1,
+        first_day=first_day or seed.FIRST_DAY,
+        last_day=last_day or LAST_DAY,
+    )
+
+
+async def run_in_process(path: str, calls_for: Callable[[Dataset], List[Tuple[str, Call]]], concurrency: int):
+    """Serves the app in this process from the database at path, through the full middleware stack"""
+    from app.database import get_db
+    from app.main import app
+
+    engine = create_engine(f"sqlite:///{path}", connect_args={"check_same_thread": False, "timeout": 30})
+    session_factory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+    def override_get_db():
+        db = session_factory()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    with session_factory() as db:
+        calls = calls_for(describe(db))
+    app.dependency_overrides[get_db] = override_get_db
+    try:
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://benchmark") as client:
+            return await replay(client, calls, concurrency)
+    finally:
+        app.dependency_overrides.pop(get_db, None)
+        engine.dispose()
+
+
+async def run_http(url: str, calls: List[Tuple[str, Call]], concurrency: int):
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(base_url=url, limits=limits, timeout=60) as client:
+        return await replay(client, calls, concurrency)
+
+
+def _change(new: float, old: float) -> str:
+    return f"{(new - old) / old * 100:+.1f}%" if old else "n/a"
+
+
+def compare(results: dict, baseline: dict) -> None:
+    """Prints throughput and latency changes against a baseline result file"""
+    columns = ("throughput", *(f"p{percentile}_ms" for percentile in PERCENTILES))
+    print(f"\n{'vs baseline':<20}" + "".join(f"{column:>14}" for column in columns))
+    rows = [("overall", results["overall"], baseline.get("overall"))]
+    rows += [(name, summary, baseline["operations"].get(name)) for name, summary in results["operations"].items()]
+    for name, summary, old in rows:
+        if old is None:
+            continue
+        print(f"{name:<20}" + "".join(f"{_change(summary[column], old[column]):>14}" for column in columns))
+
+
+def print_report(results: dict) -> None:
+    columns = ("requests", "errors", "throughput", "mean_ms", *(f"p{percentile}_ms" for percentile in PERCENTILES))
+    print(f"{'operation':<20}" + "".join(f"{column:>12}" for column in columns))
+    for name, summary in [*results["operations"].items(), ("overall", results["overall"])]:
+        print(f"{name:<20}" + "".join(f"{summary[column]:>12}" for column in columns))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay a traffic mix against the API and report latencies")
+    target = parser.add_mutually_exclusive_group()
+    target.add_argument("--url", help="Base URL of a running server; the app is served in-process without it")
+    target.add_argument("--db", help="Existing database to serve in-process; a synthetic one is generated without it")
+    parser.add_argument("--recipes", type=int, default=1_000, help="Recipes in the seeded database")
+    parser.add_argument("--years", type=int, default=3, help="Years of schedules in the seeded database")
+    parser.add_argument("--mix", choices=sorted(MIXES), default="browse")
+    parser.add_argument("--requests", type=int, default=2_000)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="Write the results to this JSON file")
+    parser.add_argument("--compare", help="Baseline JSON results to compare against")
+    args = parser.parse_args()
+
+    def calls_for(dataset: Dataset) -> List[Tuple[str, Call]]:
+        return plan(args.mix, args.requests, dataset, args.seed)
+
+    with tempfile.TemporaryDirectory() as directory:
+        if args.url:
+            # Assumes the server's database was seeded with the same --recipes and --years
+            dataset = Dataset(
+                args.recipes, seed.FIRST_DAY, seed.FIRST_DAY + timedelta(days=365 * args.years - 1)
+            )
+            latencies, errors, wall_seconds = asyncio.run(run_http(args.url, calls_for(dataset), args.concurrency))
+        else:
+            path = args.db
+            if path is None:
+                path = os.path.join(directory, "bench.db")
+                engine = create_engine(f"sqlite:///{path}")
+                seed.seed(engine, recipes=args.recipes, years=args.years, seed=args.seed)
+                engine.dispose()
+            latencies, errors, wall_seconds = asyncio.run(run_in_process(path, calls_for, args.concurrency))
+
+    results = {
+        "meta": {
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "target": args.url or args.db or "in-process synthetic",
+            "recipes": args.recipes,
+            "years": args.years,
+            "mix": args.mix,
+            "requests": args.requests,
+            "concurrency": args.concurrency,
+            "seed": args.seed,
+            "python": platform.python_version(),
+        },
+        **report(latencies, errors, wall_seconds),
+    }
+    print_report(results)
+
+    if args.compare:
+        with open(args.compare) as baseline_file:
+            compare(results, json.load(baseline_file))
+    if args.output:
+        with open(args.output, "w") as output_file:
+            json.dump(results, output_file, indent=2)
+        print(f"\nSaved results to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,15 +1,23 @@
 # backend/tests/conftest.py
 
+from contextlib import contextmanager
+
 import pytest
+from fastapi import status
 from fastapi.testclient import TestClient
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 
+from app import cache, queries
 from app.main import app
 from app.database import get_db
 from app.models.base import Base
 from app.models.ingredient_model import IngredientCategory
-from app.models.measurement_model import MeasurementUnit, UnitCategory
+from app.models.measurement_model import MeasurementUnit, UnitCategory, UnitConversion
+from app.services import similarity, unit_conversion
+
+# Every TestClient runs the app's lifespan; tests hash in-process instead of forking a pool each time
+similarity.WORKERS = 0
 
 # Create test database engine
 # We create this at module level since it's used by multiple fixtures
@@ -139,6 +147,27 @@ def seed_measurement_units(db_session):
         db_session.rollback()
         raise e
 
+def seed_unit_conversions(db_session):
+    """Seed the unit conversions table with ratios to each category's base unit"""
+    conversions = [
+        UnitConversion(from_unit_id=2, to_unit_id=1, ratio=1000.0),     # L -> ml
+        UnitConversion(from_unit_id=3, to_unit_id=1, ratio=4.92892),    # tsp -> ml
+        UnitConversion(from_unit_id=4, to_unit_id=1, ratio=14.7868),    # tbsp -> ml
+        UnitConversion(from_unit_id=6, to_unit_id=1, ratio=236.588),    # cup -> ml
+        UnitConversion(from_unit_id=12, to_unit_id=11, ratio=1000.0),   # kg -> g
+        UnitConversion(from_unit_id=13, to_unit_id=11, ratio=28.3495),  # oz -> g
+        UnitConversion(from_unit_id=14, to_unit_id=11, ratio=453.592),  # lb -> g
+        UnitConversion(from_unit_id=16, to_unit_id=15, ratio=12.0),     # doz -> pc
+    ]
+    for conversion in conversions:
+        db_session.add(conversion)
+
+    try:
+        db_session.commit()
+    except Exception as e:
+        db_session.rollback()
+        raise e
+
 @pytest.fixture(scope="session")
 def test_engine():
     """
@@ -160,8 +189,9 @@ def test_db(test_engine):
     # Create a session to seed unit data
     session = TestingSessionLocal()
     try:
-        # Seed measurement units
+        # Seed measurement units and their conversions
         seed_measurement_units(session)
+        seed_unit_conversions(session)
         yield test_engine
     finally:
         session.close()
@@ -200,10 +230,47 @@ def client(db_session):
             pass
 
     app.dependency_overrides[get_db] = override_get_db
+    # In-process indexes must not outlive the test database
+    similarity.index.clear()
+    unit_conversion.reset()
+    cache.watch(engine)
+    cache.clear_all()
     with TestClient(app) as test_client:
         yield test_client
     app.dependency_overrides.clear()
 
+@pytest.fixture
+def query_budget():
+    """
+    Asserts how many SQL statements the requests made inside a block may run:
+        with query_budget(3):
+            client.get("/api/v1/recipe/1")
+    The yielded QueryStats lists what ran, and the failure message shows each statement shape.
+    """
+    @contextmanager
+    def budget(max_queries: int):
+        with queries.track("query budget") as stats:
+            yield stats
+        assert stats.count <= max_queries, f"Query budget of {max_queries} exceeded: {stats.summary()}"
+
+    return budget
+
+@pytest.fixture
+def add_schedule(client):
+    """
+    Schedules a recipe and returns the created schedule:
+        add_schedule(recipe, "2025-01-06", "2025-01-08", "Dinner")
+    """
+    def schedule(recipe, start_date, end_date, meal_type=None):
+        response = client.post(
+            f"/api/v1/schedule/recipe/{recipe['id']}",
+            json={"start_date": start_date, "end_date": end_date, "meal_type": meal_type}
+        )
+        assert response.status_code == status.HTTP_201_CREATED, response.text
+        return response.json()
+
+    return schedule
+
 @pytest.fixture
 def sample_recipe():
     """
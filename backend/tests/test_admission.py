@@ -0,0 +1,150 @@
+import asyncio
+
+import pytest
+from fastapi import status
+
+from app import admission
+from app.admission import AdmissionController, Priority, Rejected
+
+def test_waiters_admitted_by_priority():
+    """
+    Test that a freed slot goes to the highest priority waiter, oldest first
+    """
+    async def run():
+        controller = AdmissionController(concurrency=1, queue_size=10, max_wait=5)
+        await controller.acquire(Priority.READ)
+        admitted = []
+
+        async def request(name, priority):
+            await controller.acquire(priority)
+            admitted.append(name)
+            controller.release()
+
+        tasks = [
+            asyncio.create_task(request(name, priority))
+            for name, priority in [("bulk", Priority.BULK), ("write", Priority.WRITE), ("read", Priority.READ), ("read 2", Priority.READ)]
+        ]
+        await asyncio.sleep(0)
+        assert controller.queued == 4
+        controller.release()
+        await asyncio.gather(*tasks)
+        return admitted, controller.active, controller.queued
+
+    assert asyncio.run(run()) == (["read", "read 2", "write", "bulk"], 0, 0)
+
+def test_full_queue_rejected():
+    """
+    Test that requests past the queue are rejected, bulk ones once half the queue is taken
+    """
+    async def run():
+        controller = AdmissionController(concurrency=1, queue_size=2, max_wait=5)
+        await controller.acquire(Priority.READ)
+        waiting = asyncio.create_task(controller.acquire(Priority.READ))
+        await asyncio.sleep(0)
+
+        with pytest.raises(Rejected):
+            await controller.acquire(Priority.BULK)
+        second = asyncio.create_task(controller.acquire(Priority.WRITE))
+        await asyncio.sleep(0)
+        with pytest.raises(Rejected) as rejected:
+            await controller.acquire(Priority.READ)
+
+        controller.release()
+        controller.release()
+        await asyncio.gather(waiting, second)
+        return rejected.value.queued, rejected.value.retry_after, controller.active
+
+    assert asyncio.run(run()) == (2, 1, 1)
+
+def test_wait_times_out():
+    """
+    Test that a waiter gives up after max_wait and its place is freed
+    """
+    async def run():
+        controller = AdmissionController(concurrency=1, queue_size=5, max_wait=0.01)
+        await controller.acquire(Priority.READ)
+        with pytest.raises(Rejected):
+            await controller.acquire(Priority.READ)
+        queued = controller.queued
+        controller.release()
+        return queued, controller.active
+
+    assert asyncio.run(run()) == (0, 0)
+
+@pytest.fixture
+def saturated(monkeypatch):
+    """
+    Admission control with every slot taken and no queue
+    """
+    controller = AdmissionController(concurrency=1, queue_size=0, max_wait=0.01)
+    controller.active = 1
+    monkeypatch.setattr(admission, "_controller", controller)
+    return controller
+
+def test_busy_route_returns_503(client, saturated):
+    """
+    Test that a request finding no slot and no queue room is shed with Retry-After
+    """
+    response = client.get("/api/v1/recipe/")
+    assert response.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+    assert response.headers["Retry-After"] == "1"
+    assert "busy" in response.json()["detail"]
+
+    metrics = client.get("/metrics")
+    assert metrics.status_code == status.HTTP_200_OK
+    assert 'http_requests_rejected_total{method="GET",route="/api/v1/recipe/"}' in metrics.text
+    assert "http_requests_queued" in metrics.text
+
+def test_exempt_route_skips_admission(client, saturated):
+    """
+    Test that routes exempted from admission control still answer
+    """
+    response = client.get("/api/v1/admin/slow-queries")
+    assert response.status_code == status.HTTP_200_OK
+    assert saturated.active == 1
+
+def test_route_priorities():
+    """
+    Test that reads, writes and bulk routes get their priorities
+    """
+    from app.routes import admin_routes, measurement_routes, recipes_routes, schedule_routes
+
+    priorities = {
+        (route.path, tuple(sorted(route.methods))): route.admission_priority
+        for router in (admin_routes.router, measurement_routes.router, recipes_routes.router, schedule_routes.router)
+        for route in router.routes
+    }
+    assert priorities[("/recipe/", ("GET",))] == Priority.READ
+    assert priorities[("/recipe/", ("POST",))] == Priority.WRITE
+    assert priorities[("/schedule/copy", ("POST",))] == Priority.BULK
+    assert priorities[("/units/convert/batch", ("POST",))] == Priority.READ
+    assert priorities[("/admin/slow-queries", ("GET",))] is None
+
+def test_stream_holds_slot_until_sent(client, created_schedule, monkeypatch):
+    """
+    Test that a streamed response keeps its admission slot while its body is sent, and frees it after
+    """
+    controller = AdmissionController(concurrency=2, queue_size=0, max_wait=0.01)
+    monkeypatch.setattr(admission, "_controller", controller)
+    query = b"start_date=2025-01-01&end_date=2025-01-31&format=ndjson"
+    scope = {
+        "type": "http", "asgi": {"version": "3.0", "spec_version": "2.4"}, "http_version": "1.1",
+        "method": "GET", "scheme": "http", "server": ("testserver", 80), "client": ("testclient", 50000),
+        "root_path": "", "path": "/api/v1/schedule/range/", "raw_path": b"/api/v1/schedule/range/",
+        "query_string": query, "headers": [(b"host", b"testserver")],
+    }
+
+    async def run():
+        active_while_sending = []
+
+        async def receive():
+            return {"type": "http.request", "body": b"", "more_body": False}
+
+        async def send(message):
+            if message["type"] == "http.response.body" and message.get("body"):
+                active_while_sending.append(controller.active)
+
+        await client.app(scope, receive, send)
+        return active_while_sending, controller.active
+
+    assert asyncio.run(run()) == ([1], 0)
@@ -0,0 +1,115 @@
+import multiprocessing
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app import cache
+from app.models.base import Base
+from app.models.cache_model import CacheVersion
+from app.services import unit_conversion
+
+def commit_touch(session_factory, *names):
+    with session_factory() as db:
+        cache.touch(db, *names)
+        db.commit()
+
+def _other_worker(path, names):
+    engine = create_engine(f"sqlite:///{path}")
+    commit_touch(sessionmaker(bind=engine), *names)
+    engine.dispose()
+
+@pytest.fixture
+def workers(tmp_path):
+    """
+    A session factory for this worker, which watches the database file, and a function
+    committing touches from another worker process
+    """
+    path = tmp_path / "shared.db"
+    engine = create_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(bind=engine)
+    cache.clear_all()
+    cache.watch(engine)
+
+    def other_worker(*names):
+        process = multiprocessing.get_context("fork").Process(target=_other_worker, args=(path, names))
+        process.start()
+        process.join()
+        assert process.exitcode == 0
+
+    yield sessionmaker(bind=engine), other_worker
+    cache.watch(None)
+    cache.clear_all()
+    unit_conversion.reset()
+    engine.dispose()
+
+def test_versions_written_in_commit(workers):
+    """
+    Test that touched namespaces get increasing versions in cache_versions, and rollbacks write none
+    """
+    first, _ = workers
+    commit_touch(first, "ingredients", "recipe:1")
+    commit_touch(first, "ingredients")
+    with first() as db:
+        cache.touch(db, "units")
+        db.flush()
+        db.rollback()
+        versions = dict(db.query(CacheVersion.name, CacheVersion.version).all())
+
+    assert set(versions) == {"ingredients", "recipe:1"}
+    assert versions["ingredients"] > versions["recipe:1"]
+    assert cache.version("ingredients") == versions["ingredients"]
+    assert cache.version("units") == 0
+
+def test_commit_elsewhere_picked_up(workers):
+    """
+    Test that a version committed by another worker is seen on the next sync, changing ETags
+    """
+    _, other_worker = workers
+    before = cache.etag("ingredients", search="egg")
+    assert cache.sync() == []
+
+    other_worker("ingredients")
+    assert cache.sync() == ["ingredients"]
+    assert cache.version("ingredients") > 0
+    assert cache.etag("ingredients", search="egg") != before
+    assert cache.sync() == []
+
+def test_new_worker_loads_versions(workers, tmp_path):
+    """
+    Test that a worker starting later agrees with existing versions, so ETags match across workers
+    """
+    first, _ = workers
+    commit_touch(first, "recipe:7")
+    expected = cache.etag("recipe:7")
+
+    cache.clear_all()
+    cache.watch(create_engine(f"sqlite:///{tmp_path / 'shared.db'}"))
+    assert cache.etag("recipe:7") == expected
+
+def test_subscribers_get_remote_changes_only(workers, monkeypatch):
+    """
+    Test that subscribers hear about other workers' changes but not this worker's own commits
+    """
+    first, other_worker = workers
+    heard = []
+    monkeypatch.setattr(cache, "_subscribers", [heard.extend])
+
+    commit_touch(first, "recipe:1")
+    cache.sync()
+    other_worker("recipe:2")
+    cache.sync()
+    assert heard == ["recipe:2"]
+
+def test_conversion_matrix_reloaded_after_remote_change(workers):
+    """
+    Test that the shared conversion matrix is rebuilt once another worker touches units
+    """
+    first, other_worker = workers
+    with first() as db:
+        matrix = unit_conversion.get_matrix(db)
+        assert unit_conversion.get_matrix(db) is matrix
+
+        other_worker("units")
+        cache.sync()
+        assert unit_conversion.get_matrix(db) is not matrix
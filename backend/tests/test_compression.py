@@ -0,0 +1,157 @@
+import json
+
+from fastapi import status
+
+from app.compression import MINIMUM_SIZE, negotiate
+
+def test_negotiate_encoding():
+    """
+    Test that the supported encoding with the highest q-value is chosen
+    """
+    assert negotiate("gzip, deflate") == "gzip"
+    assert negotiate("deflate;q=1.0, *;q=0.5") == "gzip"
+    assert negotiate("gzip;q=0, identity") is None
+    assert negotiate(None) is None
+
+def test_large_response_compressed(client, created_ingredient):
+    """
+    Test that bodies over the threshold are gzipped, and small ones and non-accepting clients are not
+    """
+    for number in range(20):
+        client.post("/api/v1/ingredients/", json={
+            "name": f"Ingredient {number}", "preferred_unit_id": 1, "category": "produce", "description": "x" * 50
+        })
+
+    response = client.get("/api/v1/ingredients/", headers={"Accept-Encoding": "gzip"})
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["content-encoding"] == "gzip"
+    assert "Accept-Encoding" in response.headers["vary"]
+    assert len(response.json()) == 21
+
+    plain = client.get("/api/v1/ingredients/", headers={"Accept-Encoding": "identity"})
+    assert "content-encoding" not in plain.headers
+    assert len(plain.content) >= MINIMUM_SIZE
+    assert plain.json() == response.json()
+
+    small = client.get(f"/api/v1/ingredients/{created_ingredient['id']}", headers={"Accept-Encoding": "gzip"})
+    assert "content-encoding" not in small.headers
+
+def test_streamed_response_compressed(client, created_recipe):
+    """
+    Test that a streamed NDJSON body is compressed incrementally and decodes to every line
+    """
+    for day in range(1, 29):
+        client.post(
+            f"/api/v1/schedule/recipe/{created_recipe['id']}",
+            json={"start_date": f"2025-02-{day:02d}", "end_date": f"2025-02-{day:02d}"}
+        )
+
+    response = client.get(
+        "/api/v1/schedule/range/",
+        params={"start_date": "2025-02-01", "end_date": "2025-02-28", "format": "ndjson"},
+        headers={"Accept-Encoding": "gzip"}
+    )
+
+    assert response.headers["content-encoding"] == "gzip"
+    assert "content-length" not in response.headers
+    assert len([json.loads(line) for line in response.text.splitlines()]) == 28
+
+def test_cached_response_revalidation(client):
+    """
+    Test that cached GETs answer If-None-Match with a 304 and change ETag when the data changes
+    """
+    response = client.get("/api/v1/units/", headers={"Accept-Encoding": "gzip"})
+    etag = response.headers["etag"]
+    assert response.headers["content-encoding"] == "gzip"
+
+    # The cached compressed body is served again byte for byte
+    raw = client.get("/api/v1/units/", headers={"Accept-Encoding": "gzip"})
+    assert raw.headers["etag"] == etag
+    assert raw.json() == response.json()
+
+    not_modified = client.get("/api/v1/units/", headers={"If-None-Match": etag})
+    assert not_modified.status_code == status.HTTP_304_NOT_MODIFIED
+    assert not_modified.content == b""
+
+    client.post("/api/v1/units/conversions/", json={"from_unit_id": 6, "to_unit_id": 4, "ratio": 16})
+
+    changed = client.get("/api/v1/units/", headers={"If-None-Match": etag})
+    assert changed.status_code == status.HTTP_200_OK
+    assert changed.headers["etag"] != etag
+
+def test_cached_etag_per_encoding(client):
+    """
+    Test that compressed and uncompressed bodies have different strong ETags, so one can't revalidate the other
+    """
+    compressed = client.get("/api/v1/units/", headers={"Accept-Encoding": "gzip"})
+    plain = client.get("/api/v1/units/", headers={"Accept-Encoding": "identity"})
+    assert compressed.headers["etag"] == plain.headers["etag"][:-1] + '-gzip"'
+    assert "Accept-Encoding" in plain.headers["vary"]
+
+    response = client.get("/api/v1/units/", headers={"Accept-Encoding": "identity", "If-None-Match": compressed.headers["etag"]})
+    assert response.status_code == status.HTTP_200_OK
+    assert "content-encoding" not in response.headers
+    response = client.get("/api/v1/units/", headers={"Accept-Encoding": "gzip", "If-None-Match": compressed.headers["etag"]})
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+def test_middleware_weakens_etag(client, created_recipe):
+    """
+    Test that a response compressed by the middleware gets a weak ETag that still revalidates
+    """
+    for day in range(1, 29):
+        client.post(
+            f"/api/v1/schedule/recipe/{created_recipe['id']}",
+            json={"start_date": f"2025-02-{day:02d}", "end_date": f"2025-02-{day:02d}"}
+        )
+    params = {"start_date": "2025-02-01", "end_date": "2025-02-28"}
+
+    plain = client.get("/api/v1/schedule/feed.ics", params=params, headers={"Accept-Encoding": "identity"})
+    compressed = client.get("/api/v1/schedule/feed.ics", params=params, headers={"Accept-Encoding": "gzip"})
+    assert compressed.headers["content-encoding"] == "gzip"
+    assert compressed.headers["etag"] == f"W/{plain.headers['etag']}"
+
+    response = client.get(
+        "/api/v1/schedule/feed.ics", params=params, headers={"Accept-Encoding": "gzip", "If-None-Match": compressed.headers["etag"]}
+    )
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+def test_cached_recipe_not_found(client):
+    """
+    Test that a missing recipe is still a 404 through the cached path
+    """
+    response = client.get("/api/v1/recipe/999")
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+    assert "etag" not in response.headers
+
+def test_cached_recipe_invalidated(client, created_recipe):
+    """
+    Test that a recipe's cached body is replaced once the recipe is updated
+    """
+    etag = client.get(f"/api/v1/recipe/{created_recipe['id']}").headers["etag"]
+    client.put(f"/api/v1/recipe/{created_recipe['id']}", json={**created_recipe, "title": "Renamed"})
+
+    response = client.get(f"/api/v1/recipe/{created_recipe['id']}", headers={"If-None-Match": etag})
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["title"] == "Renamed"
+
+def test_event_stream_not_compressed():
+    """
+    Test that event streams pass through the middleware untouched
+    """
+    import asyncio
+    from app.compression import CompressionMiddleware
+
+    async def app(scope, receive, send):
+        await send({"type": "http.response.start", "status": 200, "headers": [(b"content-type", b"text/event-stream")]})
+        await send({"type": "http.response.body", "body": b"data: x\n\n" * 200, "more_body": True})
+        await send({"type": "http.response.body", "body": b""})
+
+    sent = []
+    async def send(message):
+        sent.append(message)
+
+    scope = {"type": "http", "headers": [(b"accept-encoding", b"gzip")]}
+    asyncio.run(CompressionMiddleware(app)(scope, None, send))
+
+    assert sent[1]["body"] == b"data: x\n\n" * 200
+    assert not any(name == b"content-encoding" for name, _ in sent[0]["headers"])
@@ -0,0 +1,80 @@
+import asyncio
+import json
+
+from app import events
+from app.schemas.event_schema import ChangeEvent, EventAction, EventTopic
+
+def test_websocket_receives_committed_changes(client, created_recipe):
+    """
+    Test that schedule and recipe writes are pushed to subscribers after they commit
+    """
+    with client.websocket_connect("/api/v1/events/ws") as websocket:
+        schedule = client.post(
+            f"/api/v1/schedule/recipe/{created_recipe['id']}",
+            json={"start_date": "2025-01-05", "end_date": "2025-01-05"}
+        ).json()
+        client.post(
+            f"/api/v1/direction/recipe/{created_recipe['id']}",
+            json={"direction_number": 1, "instruction": "Stir"}
+        )
+        client.delete(f"/api/v1/recipe/{created_recipe['id']}")
+
+        received = [json.loads(websocket.receive_text()) for _ in range(4)]
+
+    assert received == [
+        {"topic": "schedule", "action": "created", "id": schedule["id"], "recipe_id": created_recipe["id"]},
+        {"topic": "recipe", "action": "updated", "id": created_recipe["id"], "recipe_id": None},
+        {"topic": "recipe", "action": "deleted", "id": created_recipe["id"], "recipe_id": None},
+        {"topic": "schedule", "action": "deleted", "id": schedule["id"], "recipe_id": created_recipe["id"]},
+    ]
+    assert len(events.bus) == 0
+
+def test_websocket_topic_filter(client, created_recipe):
+    """
+    Test that subscribers only receive the topics they asked for
+    """
+    with client.websocket_connect("/api/v1/events/ws?topic=schedule") as websocket:
+        client.put(f"/api/v1/recipe/{created_recipe['id']}", json={**created_recipe, "title": "Renamed"})
+        schedule = client.post(
+            f"/api/v1/schedule/recipe/{created_recipe['id']}",
+            json={"start_date": "2025-01-05", "end_date": "2025-01-05"}
+        ).json()
+
+        received = json.loads(websocket.receive_text())
+
+    assert received["topic"] == "schedule"
+    assert received["id"] == schedule["id"]
+
+def test_failed_write_publishes_nothing(client, created_schedule, sample_recipe):
+    """
+    Test that a rolled back write publishes no event
+    """
+    with client.websocket_connect("/api/v1/events/ws") as websocket:
+        response = client.put(
+            f"/api/v1/schedule/{created_schedule['id']}",
+            json={"end_date": "2024-01-01"}
+        )
+        assert response.status_code == 400
+        recipe = client.post("/api/v1/recipe/", json=sample_recipe).json()
+
+        received = json.loads(websocket.receive_text())
+
+    assert received == {"topic": "recipe", "action": "created", "id": recipe["id"], "recipe_id": None}
+
+def test_slow_subscriber_drops_oldest():
+    """
+    Test that a full queue drops the oldest events and counts them instead of growing
+    """
+    async def run():
+        bus = events.EventBus(queue_size=3)
+        subscription = bus.subscribe()
+        for schedule_id in range(1, 6):
+            bus.publish(ChangeEvent(topic=EventTopic.SCHEDULE, action=EventAction.CREATED, id=schedule_id))
+        await asyncio.sleep(0)      # let the loop deliver the queued offers
+
+        received = [(await subscription.get()).id for _ in range(3)]
+        missed = subscription.take_missed()
+        bus.unsubscribe(subscription)
+        return received, missed, len(bus)
+
+    assert asyncio.run(run()) == ([3, 4, 5], 2, 0)
@@ -0,0 +1,69 @@
+import re
+
+from fastapi import status
+
+from app import metrics
+
+def _metric(text, name, **labels):
+    """Value of a metric line with the given labels, or 0 if absent"""
+    label_text = ",".join(f'{key}="{value}"' for key, value in labels.items())
+    match = re.search(rf"^{name}\{{{re.escape(label_text)}\}} (\S+)$", text, re.MULTILINE)
+    return float(match.group(1)) if match else 0.0
+
+def test_server_timing_header(client, created_recipe):
+    """
+    Test that responses carry the db, serialize and total phases
+    """
+    response = client.get(f"/api/v1/recipe/{created_recipe['id']}")
+
+    phases = dict(re.findall(r"(\w+);dur=([\d.]+)", response.headers["server-timing"]))
+    assert set(phases) == {"db", "serialize", "total"}
+    assert float(phases["db"]) > 0
+    assert float(phases["total"]) >= float(phases["db"])
+
+def test_metrics_endpoint(client, created_recipe):
+    """
+    Test that requests are counted per route and status class in the Prometheus text format
+    """
+    labels = {"method": "GET", "route": "/api/v1/recipe/{recipe_id}"}
+    before = client.get("/metrics").text
+
+    client.get(f"/api/v1/recipe/{created_recipe['id']}")
+    client.get("/api/v1/recipe/999")
+
+    response = client.get("/metrics")
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+
+    text = response.text
+    assert "# TYPE http_request_duration_seconds histogram" in text
+    count = "http_request_duration_seconds_count"
+    assert _metric(text, count, **labels) == _metric(before, count, **labels) + 2
+    for status_class in ("2xx", "4xx"):
+        assert _metric(text, "http_responses_total", **labels, status=status_class) == \
+            _metric(before, "http_responses_total", **labels, status=status_class) + 1
+    assert _metric(text, "http_request_duration_seconds_bucket", **labels, le="+Inf") == _metric(text, count, **labels)
+    assert _metric(text, "http_requests_in_flight", **labels) == 0
+    assert _metric(text, "http_request_db_seconds_total", **labels) > 0
+
+def test_multiprocess_collection(tmp_path):
+    """
+    Test that series written by several worker processes are summed when collected
+    """
+    first = metrics.MetricsStore(str(tmp_path), pid=101)
+    second = metrics.MetricsStore(str(tmp_path), pid=102)
+
+    metrics.observe(first.series("GET", "/recipe/"), 0.003, 200, 0.001, 0.001)
+    metrics.observe(second.series("GET", "/recipe/"), 0.2, 500, 0.1, 0.05)
+    metrics.observe(second.series("POST", "/recipe/"), 0.02, 201, 0.01, 0.0)
+
+    totals = metrics.collect_directory(str(tmp_path))
+    assert set(totals) == {("GET", "/recipe/"), ("POST", "/recipe/")}
+
+    text = metrics.exposition(totals)
+    labels = {"method": "GET", "route": "/recipe/"}
+    assert _metric(text, "http_request_duration_seconds_count", **labels) == 2
+    assert _metric(text, "http_request_duration_seconds_bucket", **labels, le="0.005") == 1
+    assert _metric(text, "http_request_duration_seconds_bucket", **labels, le="0.25") == 2
+    assert _metric(text, "http_responses_total", **labels, status="5xx") == 1
+    assert _metric(text, "http_request_db_seconds_total", **labels) == 0.101
@@ -0,0 +1,92 @@
+import msgpack
+from fastapi import status
+
+from app.routing import accepts_msgpack
+
+MSGPACK = "application/msgpack"
+
+def test_accepts_msgpack():
+    """
+    Test that MessagePack is only chosen when asked for explicitly and ranked at least as high as JSON
+    """
+    assert accepts_msgpack("application/msgpack")
+    assert accepts_msgpack("application/x-msgpack, application/json;q=0.5")
+    assert not accepts_msgpack("application/json, application/msgpack;q=0.5")
+    assert not accepts_msgpack("*/*")
+    assert not accepts_msgpack(None)
+
+def test_msgpack_request_and_response(client, sample_recipe):
+    """
+    Test that a MessagePack body is validated by the usual schema and answered in MessagePack
+    """
+    response = client.post(
+        "/api/v1/recipe/",
+        content=msgpack.packb(sample_recipe),
+        headers={"Content-Type": MSGPACK, "Accept": MSGPACK}
+    )
+
+    assert response.status_code == status.HTTP_201_CREATED
+    assert response.headers["content-type"] == MSGPACK
+    assert "Accept" in response.headers["vary"]
+    recipe = msgpack.unpackb(response.content)
+    assert recipe["title"] == sample_recipe["title"]
+
+    # Same document as the JSON representation
+    assert client.get(f"/api/v1/recipe/{recipe['id']}").json() == recipe
+
+def test_msgpack_invalid_body(client, sample_recipe):
+    """
+    Test that MessagePack bodies are validated, and undecodable ones rejected
+    """
+    response = client.post(
+        "/api/v1/recipe/",
+        content=msgpack.packb({**sample_recipe, "servings": "many"}),
+        headers={"Content-Type": MSGPACK}
+    )
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_CONTENT
+
+    response = client.post("/api/v1/recipe/", content=b"\xc1", headers={"Content-Type": MSGPACK})
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+def test_msgpack_fast_responses(client, created_schedule, created_recipe_ingredient):
+    """
+    Test that responses rendered by the fast response layer and the cache match their JSON versions
+    """
+    for url, params in [
+        ("/api/v1/recipe/", {}),
+        (f"/api/v1/recipe/{created_schedule['recipe_id']}", {}),
+        ("/api/v1/ingredients/", {}),
+        ("/api/v1/units/", {}),
+        ("/api/v1/schedule/range/", {"start_date": "2025-01-01", "end_date": "2025-01-31"}),
+        ("/api/v1/schedule/range/", {"start_date": "2025-01-01", "end_date": "2025-01-31", "expand": "recipe"}),
+        ("/api/v1/schedule/calendar/", {"view": "month", "day": created_schedule["start_date"]}),
+    ]:
+        packed = client.get(url, params=params, headers={"Accept": MSGPACK})
+        assert packed.status_code == status.HTTP_200_OK
+        assert packed.headers["content-type"] == MSGPACK
+        assert msgpack.unpackb(packed.content) == client.get(url, params=params).json()
+
+def test_msgpack_cached_etag(client):
+    """
+    Test that cached bodies have a separate ETag per representation
+    """
+    json_etag = client.get("/api/v1/units/").headers["etag"]
+    packed = client.get("/api/v1/units/", headers={"Accept": MSGPACK})
+
+    assert packed.headers["etag"] != json_etag
+    response = client.get("/api/v1/units/", headers={"Accept": MSGPACK, "If-None-Match": packed.headers["etag"]})
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+def test_msgpack_bulk_conversion(client):
+    """
+    Test a bulk request and response in MessagePack
+    """
+    response = client.post(
+        "/api/v1/units/convert/batch",
+        content=msgpack.packb({"quantities": [1, 2], "from_unit_ids": [4, 4], "to_unit_ids": [2, 2]}),
+        headers={"Content-Type": MSGPACK, "Accept": MSGPACK}
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    converted = msgpack.unpackb(response.content)["converted_quantities"]
+    assert converted[1] == 2 * converted[0]
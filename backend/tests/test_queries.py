@@ -0,0 +1,96 @@
+import logging
+
+import pytest
+
+from app import queries
+from app.models import IngredientCategory
+
+def test_fingerprint():
+    """
+    Test that literals and IN lists of any length share a statement shape
+    """
+    assert queries.fingerprint("SELECT * FROM t WHERE id IN (?, ?, ?)") == queries.fingerprint(
+        "SELECT *\n FROM t WHERE id IN (?, ?)"
+    ) == "SELECT * FROM t WHERE id IN (?)"
+    assert queries.fingerprint("SELECT 'a' LIMIT 10") == "SELECT ? LIMIT ?"
+    assert queries.fingerprint("SELECT anon_1.id FROM anon_1") == "SELECT anon_1.id FROM anon_1"
+
+def test_repeated_statement_warning(caplog):
+    """
+    Test that one request running the same statement shape past the threshold logs a single warning
+    """
+    with caplog.at_level(logging.WARNING, logger="app.queries"):
+        with queries.track("GET /test", warn=True) as stats:
+            for recipe_id in range(queries.REPEAT_WARNING_THRESHOLD + 5):
+                stats.record(f"SELECT * FROM recipes WHERE id = {recipe_id}", 0.001)
+
+    assert stats.count == queries.REPEAT_WARNING_THRESHOLD + 5
+    assert stats.repeated() == [("SELECT * FROM recipes WHERE id = ?", queries.REPEAT_WARNING_THRESHOLD + 5)]
+    assert len(caplog.records) == 1
+    assert "GET /test" in caplog.records[0].getMessage()
+
+def test_nested_tracking(client, created_recipe):
+    """
+    Test that an outer tracker totals the statements of the requests run inside it
+    """
+    with queries.track() as stats:
+        client.get(f"/api/v1/recipe/{created_recipe['id']}")
+        client.get("/api/v1/recipe/")
+
+    assert stats.count > 0
+    assert stats.seconds > 0
+
+@pytest.fixture
+def recipe_graphs(client):
+    """
+    Several recipes, each with several directions and ingredients and a schedule, so a lazy load
+    per row shows up as extra queries rather than fitting in a budget by coincidence
+    """
+    ingredient_ids = [
+        client.post("/api/v1/ingredients/", json={
+            "name": f"Budget ingredient {i}", "category": IngredientCategory.SPICES.value, "preferred_unit_id": unit_id
+        }).json()["id"]
+        for i, unit_id in enumerate((4, 1, 11, 15))
+    ]
+    recipe_ids = []
+    for r in range(4):
+        recipe_id = client.post("/api/v1/recipe/", json={
+            "title": f"Budget recipe {r}", "description": "Many parts", "cooking_time": 20, "servings": 2
+        }).json()["id"]
+        for number in range(1, 4):
+            client.post(f"/api/v1/direction/recipe/{recipe_id}", json={"direction_number": number, "instruction": "Stir"})
+        for ingredient_id, unit_id in zip(ingredient_ids, (1, 11, 15, 2)):
+            client.post(f"/api/v1/recipe_ingredients/recipe/{recipe_id}", json={
+                "ingredient_id": ingredient_id, "quantity": 2, "unit_id": unit_id
+            })
+        client.post(f"/api/v1/schedule/recipe/{recipe_id}", json={"start_date": f"2025-01-0{r + 1}", "end_date": f"2025-01-0{r + 2}"})
+        recipe_ids.append(recipe_id)
+    return recipe_ids
+
+def test_endpoint_query_budgets(client, recipe_graphs, query_budget):
+    """
+    Test that list, detail and create endpoints load their graphs in a fixed number of queries,
+    however many recipes, directions and ingredients they return
+    """
+    recipe_id = recipe_graphs[0]
+    for method, url, params, budget in [
+        ("GET", "/api/v1/recipe/", {}, 3),
+        ("GET", f"/api/v1/recipe/{recipe_id}", {}, 1),
+        ("GET", "/api/v1/ingredients/", {}, 1),
+        ("GET", "/api/v1/schedule/range/", {"start_date": "2025-01-01", "end_date": "2025-01-31"}, 1),
+        ("GET", "/api/v1/schedule/range/", {"start_date": "2025-01-01", "end_date": "2025-01-31", "expand": "recipe"}, 3),
+        ("GET", "/api/v1/schedule/calendar/", {"view": "month", "day": "2025-01-01"}, 1),
+    ]:
+        with query_budget(budget) as stats:
+            response = client.request(method, url, params=params)
+        assert response.status_code == 200, response.text
+        # Exactly, so a budget left loose by a later speedup gets tightened
+        assert stats.count == budget, (url, params, stats.summary())
+
+    # Recipe check, insert, cache version, days, then the schedule with its recipe graph
+    with query_budget(7) as stats:
+        response = client.post(f"/api/v1/schedule/recipe/{recipe_id}", json={"start_date": "2025-02-01", "end_date": "2025-02-03"})
+    assert response.status_code == 201, response.text
+    assert stats.count == 7, stats.summary()
+    assert len(response.json()["recipe"]["directions"]) == 3
+    assert len(response.json()["recipe"]["recipe_ingredients"]) == 4
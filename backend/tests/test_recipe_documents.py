@@ -0,0 +1,70 @@
+import json
+
+from fastapi import status
+
+from app.models.recipe_document_model import RecipeDocument
+
+def stored(db_session, recipe_id):
+    db_session.expire_all()
+    return db_session.get(RecipeDocument, recipe_id)
+
+def test_document_written_with_recipe(client, db_session, created_direction, created_recipe_ingredient, query_budget):
+    """
+    Test that a recipe's document is written as it changes and served as-is by the detail endpoint
+    """
+    recipe_id = created_direction["recipe_id"]
+    document = stored(db_session, recipe_id)
+    assert document.version == 3        # created, then a direction and an ingredient added
+
+    with query_budget(1):
+        response = client.get(f"/api/v1/recipe/{recipe_id}", headers={"Accept-Encoding": "identity"})
+    assert response.status_code == status.HTTP_200_OK
+    assert response.content == document.body
+    assert response.json()["directions"][0]["instruction"] == created_direction["instruction"]
+    assert response.json()["recipe_ingredients"][0]["ingredient"]["id"] == created_recipe_ingredient["ingredient_id"]
+
+def test_ingredient_rename_fans_out(client, db_session, created_recipe_ingredient, sample_recipe):
+    """
+    Test that renaming an ingredient rewrites the document of every recipe using it
+    """
+    ingredient = client.get(f"/api/v1/ingredients/{created_recipe_ingredient['ingredient_id']}").json()
+    other = client.post("/api/v1/recipe/", json={**sample_recipe, "title": "Second Helping"}).json()
+    client.post(f"/api/v1/recipe_ingredients/recipe/{other['id']}", json={
+        key: created_recipe_ingredient[key] for key in ("ingredient_id", "quantity", "unit_id")
+    })
+    before = client.get(f"/api/v1/recipe/{other['id']}")
+
+    response = client.put(f"/api/v1/ingredients/{ingredient['id']}", json={
+        **{key: ingredient[key] for key in ("category", "description", "preferred_unit_id")},
+        "name": "Moon Dust"
+    })
+    assert response.status_code == status.HTTP_200_OK
+
+    for recipe_id in (created_recipe_ingredient["recipe_id"], other["id"]):
+        document = json.loads(stored(db_session, recipe_id).body)
+        assert document["recipe_ingredients"][0]["ingredient"]["name"] == "Moon Dust"
+    after = client.get(f"/api/v1/recipe/{other['id']}", headers={"If-None-Match": before.headers["ETag"]})
+    assert after.status_code == status.HTTP_200_OK
+    assert after.json()["recipe_ingredients"][0]["ingredient"]["name"] == "Moon Dust"
+
+def test_missing_document_rebuilt_on_read(client, db_session, created_recipe_ingredient):
+    """
+    Test that recipes without a document, e.g. after a conversion changes, get one on their next read
+    """
+    recipe_id = created_recipe_ingredient["recipe_id"]
+    db_session.query(RecipeDocument).delete()
+    db_session.flush()
+
+    response = client.get(f"/api/v1/recipe/{recipe_id}", headers={"Accept-Encoding": "identity"})
+    assert response.status_code == status.HTTP_200_OK
+    assert stored(db_session, recipe_id).body == response.content
+    assert client.get("/api/v1/recipe/999999").status_code == status.HTTP_404_NOT_FOUND
+
+def test_document_removed_with_recipe(client, db_session, created_direction):
+    """
+    Test that deleting a recipe deletes its document
+    """
+    recipe_id = created_direction["recipe_id"]
+    assert client.delete(f"/api/v1/recipe/{recipe_id}").status_code == status.HTTP_204_NO_CONTENT
+    assert stored(db_session, recipe_id) is None
+    assert client.get(f"/api/v1/recipe/{recipe_id}").status_code == status.HTTP_404_NOT_FOUND
@@ -98,4 +98,38 @@ def test_delete_nonexistent_direction(client):
     response = client.delete(f"/api/v1/recipe_ingredients/{nonexistent_id}")
 
     assert response.status_code == status.HTTP_404_NOT_FOUND
-    assert f"Recipe Ingredient with id {nonexistent_id} not found" in response.json()["detail"]
\ No newline at end of file
+    assert f"Recipe Ingredient with id {nonexistent_id} not found" in response.json()["detail"]
+
+def test_recipe_ingredient_base_quantity(client, created_recipe_ingredient):
+    """
+    Test that quantities are normalized to the category's base unit on create and update
+    """
+    # 2 tablespoons -> ml
+    assert created_recipe_ingredient["base_unit_id"] == 1
+    assert abs(created_recipe_ingredient["base_quantity"] - 2 * 14.7868) < 1e-6
+
+    # 3 pounds -> g
+    response = client.put(
+        f"/api/v1/recipe_ingredients/{created_recipe_ingredient['id']}",
+        json={"ingredient_id": created_recipe_ingredient["ingredient_id"], "quantity": 3, "unit_id": 14}
+    )
+    updated_recipe_ingredient = response.json()
+
+    assert updated_recipe_ingredient["base_unit_id"] == 11
+    assert abs(updated_recipe_ingredient["base_quantity"] - 3 * 453.592) < 1e-6
+
+def test_recipe_ingredient_base_quantity_follows_conversions(client, created_recipe_ingredient):
+    """
+    Test that changing a conversion renormalizes existing base quantities
+    """
+    conversions = client.get("/api/v1/units/conversions/").json()
+    tbsp_to_ml = next(c for c in conversions if c["from_unit_id"] == 4)
+    client.delete(f"/api/v1/units/conversions/{tbsp_to_ml['id']}")
+
+    response = client.get(f"/api/v1/recipe_ingredients/{created_recipe_ingredient['id']}")
+    assert response.json()["base_quantity"] is None
+
+    client.post("/api/v1/units/conversions/", json={"from_unit_id": 4, "to_unit_id": 3, "ratio": 3})
+
+    response = client.get(f"/api/v1/recipe_ingredients/{created_recipe_ingredient['id']}")
+    assert abs(response.json()["base_quantity"] - 2 * 3 * 4.92892) < 1e-6
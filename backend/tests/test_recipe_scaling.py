@@ -0,0 +1,103 @@
+from fastapi import status
+import pytest
+
+@pytest.fixture
+def recipe_with_ingredients(client, sample_recipe):
+    """
+    Create a 4 serving recipe with volume, weight and quantity ingredients
+    """
+    recipe = client.post("/api/v1/recipe/", json={**sample_recipe, "servings": 4}).json()
+    ingredients = [
+        # (name, preferred unit, quantity, unit)
+        ("Milk", 1, 2, 6),      # 2 cups, prefers ml
+        ("Flour", 11, 1, 14),   # 1 lb, prefers g
+        ("Eggs", 15, 6, 15),    # 6 pieces, prefers pieces
+        ("Salt", 11, 1, 3),     # 1 tsp, prefers g (different category)
+    ]
+    for name, preferred_unit_id, quantity, unit_id in ingredients:
+        ingredient = client.post(
+            "/api/v1/ingredients/",
+            json={"name": name, "category": "pantry", "preferred_unit_id": preferred_unit_id}
+        ).json()
+        client.post(
+            f"/api/v1/recipe_ingredients/recipe/{recipe['id']}",
+            json={"ingredient_id": ingredient["id"], "quantity": quantity, "unit_id": unit_id}
+        )
+    return recipe
+
+def test_scale_recipe_servings(client, recipe_with_ingredients):
+    """
+    Test scaling quantities without changing units
+    """
+    response = client.get(
+        f"/api/v1/recipe/{recipe_with_ingredients['id']}/scaled",
+        params={"servings": 6}
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    data = response.json()
+
+    assert data["servings"] == 6
+    assert data["original_servings"] == 4
+    assert data["scale_factor"] == 1.5
+    assert [(i["quantity"], i["unit_abbreviation"]) for i in data["ingredients"]] == [
+        (3, "cup"), (1.5, "lb"), (9, "pc"), (1.5, "tsp")
+    ]
+
+def test_scale_recipe_preferred_units(client, recipe_with_ingredients):
+    """
+    Test converting to each ingredient's preferred unit, keeping units that can't convert
+    """
+    response = client.get(
+        f"/api/v1/recipe/{recipe_with_ingredients['id']}/scaled",
+        params={"units": "preferred"}
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    ingredients = response.json()["ingredients"]
+
+    assert ingredients[0]["unit_abbreviation"] == "ml"
+    assert ingredients[0]["quantity"] == pytest.approx(473.176)
+    assert ingredients[1]["unit_abbreviation"] == "g"
+    assert ingredients[1]["quantity"] == pytest.approx(453.592)
+    assert ingredients[3]["unit_abbreviation"] == "tsp"
+
+def test_scale_recipe_metric_units(client, recipe_with_ingredients):
+    """
+    Test that metric conversion picks the largest unit keeping the quantity at least 1
+    """
+    response = client.get(
+        f"/api/v1/recipe/{recipe_with_ingredients['id']}/scaled",
+        params={"servings": 12, "units": "metric"}
+    )
+
+    ingredients = response.json()["ingredients"]
+    assert (ingredients[0]["quantity"], ingredients[0]["unit_abbreviation"]) == (1.42, "L")
+    assert (ingredients[1]["quantity"], ingredients[1]["unit_abbreviation"]) == (1.361, "kg")
+    assert ingredients[2]["unit_abbreviation"] == "pc"
+
+def test_scaled_recipe_reflects_changes(client, recipe_with_ingredients):
+    """
+    Test that cached results are not served after the recipe changes
+    """
+    url = f"/api/v1/recipe/{recipe_with_ingredients['id']}/scaled"
+    first = client.get(url).json()
+
+    milk = client.get(f"/api/v1/recipe_ingredients/recipe/{recipe_with_ingredients['id']}").json()[0]
+    client.put(
+        f"/api/v1/recipe_ingredients/{milk['id']}",
+        json={"ingredient_id": milk["ingredient_id"], "quantity": 5, "unit_id": 6}
+    )
+
+    second = client.get(url).json()
+    assert first["ingredients"][0]["quantity"] == 2
+    assert second["ingredients"][0]["quantity"] == 5
+
+def test_scale_nonexistent_recipe(client):
+    """
+    Test scaling a nonexistent recipe
+    """
+    nonexistent_id = 42069
+    response = client.get(f"/api/v1/recipe/{nonexistent_id}/scaled")
+
+    assert response.status_code == status.HTTP_404_NOT_FOUND
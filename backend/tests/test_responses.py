@@ -0,0 +1,40 @@
+from fastapi import status
+
+from app.schemas import schedule_schema
+
+def test_ingredient_list_matches_schema(client, created_ingredient):
+    """
+    Test that the ingredient list, rendered from column rows, matches the Ingredient response schema
+    """
+    response = client.get("/api/v1/ingredients/")
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["content-type"] == "application/json"
+    assert response.json() == [client.get(f"/api/v1/ingredients/{created_ingredient['id']}").json()]
+
+def test_recipe_list_matches_schema(client, created_recipe, created_direction, created_recipe_ingredient):
+    """
+    Test that the eagerly loaded recipe list matches the single recipe response
+    """
+    response = client.get("/api/v1/recipe/")
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == [client.get(f"/api/v1/recipe/{created_recipe['id']}").json()]
+
+def test_schedule_range_matches_schema(client, created_schedule):
+    """
+    Test that both schedule range projections, and the calendar, match their response schemas
+    """
+    params = {"start_date": "2025-01-01", "end_date": "2025-01-31"}
+
+    summaries = client.get("/api/v1/schedule/range/", params=params).json()
+    assert summaries == [
+        schedule_schema.CalendarSchedule.model_validate(summary).model_dump(mode="json") for summary in summaries
+    ]
+
+    expanded = client.get("/api/v1/schedule/range/", params={**params, "expand": "recipe"}).json()
+    assert expanded == [client.get(f"/api/v1/schedule/{created_schedule['id']}").json()]
+
+    days = client.get("/api/v1/schedule/calendar/", params={"view": "week", "day": created_schedule["start_date"]}).json()
+    assert days == [schedule_schema.CalendarDay.model_validate(day).model_dump(mode="json") for day in days]
+    assert sum(len(day["schedules"]) for day in days) == 2
@@ -0,0 +1,69 @@
+from fastapi import status
+
+def check(client, start_date, end_date, meal_types=None):
+    params = {"start_date": start_date, "end_date": end_date}
+    if meal_types:
+        params["meal_type"] = meal_types
+    response = client.get("/api/v1/schedule/check", params=params)
+    assert response.status_code == status.HTTP_200_OK
+    return response.json()
+
+def test_check_conflicts(client, created_recipe, add_schedule):
+    """
+    Test that overlapping schedules with the same meal type are reported as one conflict per run of days
+    """
+    first = add_schedule(created_recipe, "2025-01-01", "2025-01-03", "dinner")
+    second = add_schedule(created_recipe, "2025-01-03", "2025-01-05", "dinner")
+    third = add_schedule(created_recipe, "2025-01-05", "2025-01-05", "dinner")
+    add_schedule(created_recipe, "2025-01-03", "2025-01-03", "lunch")      # different meal type
+    add_schedule(created_recipe, "2025-01-03", "2025-01-03", None)         # no meal type
+
+    data = check(client, "2025-01-01", "2025-01-07", ["dinner"])
+
+    assert data["conflicts"] == [
+        {"meal_type": "dinner", "start_date": "2025-01-03", "end_date": "2025-01-03", "schedule_ids": [first["id"], second["id"]]},
+        {"meal_type": "dinner", "start_date": "2025-01-05", "end_date": "2025-01-05", "schedule_ids": [second["id"], third["id"]]},
+    ]
+    assert data["gaps"] == [
+        {"meal_type": "dinner", "start_date": "2025-01-06", "end_date": "2025-01-07"},
+    ]
+
+def test_check_conflicts_clipped_to_range(client, created_recipe, add_schedule):
+    """
+    Test that a conflict spanning the range edges is clipped to the range
+    """
+    first = add_schedule(created_recipe, "2025-01-01", "2025-01-10", "lunch")
+    second = add_schedule(created_recipe, "2025-01-02", "2025-01-09", "lunch")
+
+    data = check(client, "2025-01-05", "2025-01-06", ["lunch"])
+
+    assert data["conflicts"] == [
+        {"meal_type": "lunch", "start_date": "2025-01-05", "end_date": "2025-01-06", "schedule_ids": [first["id"], second["id"]]},
+    ]
+    assert data["gaps"] == []
+
+def test_check_gaps_for_every_meal_type(client, created_recipe, add_schedule):
+    """
+    Test that every meal type is checked by default and that empty slots are reported as ranges
+    """
+    add_schedule(created_recipe, "2025-01-02", "2025-01-02", "breakfast")
+
+    data = check(client, "2025-01-01", "2025-01-03")
+
+    assert data["conflicts"] == []
+    assert data["gaps"] == [
+        {"meal_type": "breakfast", "start_date": "2025-01-01", "end_date": "2025-01-01"},
+        {"meal_type": "lunch", "start_date": "2025-01-01", "end_date": "2025-01-03"},
+        {"meal_type": "dinner", "start_date": "2025-01-01", "end_date": "2025-01-03"},
+        {"meal_type": "snacks", "start_date": "2025-01-01", "end_date": "2025-01-03"},
+        {"meal_type": "breakfast", "start_date": "2025-01-03", "end_date": "2025-01-03"},
+    ]
+
+def test_check_invalid_date_range(client):
+    """
+    Test that an end date before the start date returns an empty check
+    """
+    data = check(client, "2025-01-15", "2025-01-10")
+
+    assert data["conflicts"] == []
+    assert data["gaps"] == []
@@ -0,0 +1,88 @@
+from fastapi import status
+
+def test_schedule_feed(client, created_recipe):
+    """
+    Test that schedules are served as all-day iCalendar events
+    """
+    schedule = client.post(
+        f"/api/v1/schedule/recipe/{created_recipe['id']}",
+        json={"start_date": "2025-01-05", "end_date": "2025-01-06", "meal_type": "dinner", "notes": "Bring salt, pepper; and a pan"}
+    ).json()
+
+    response = client.get("/api/v1/schedule/feed.ics")
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["content-type"].startswith("text/calendar")
+    assert response.headers["etag"]
+
+    body = response.content.decode()
+    lines = body.split("\r\n")
+    assert lines[0] == "BEGIN:VCALENDAR"
+    assert lines[-2:] == ["END:VCALENDAR", ""]
+    assert f"UID:schedule-{schedule['id']}@turtle-cafeteria" in lines
+    assert "DTSTART;VALUE=DATE:20250105" in lines
+    assert "DTEND;VALUE=DATE:20250107" in lines      # exclusive end
+    assert f"SUMMARY:Dinner: {created_recipe['title']}" in lines
+    assert "DESCRIPTION:Bring salt\\, pepper\\; and a pan" in lines
+
+def test_schedule_feed_date_range(client, created_recipe):
+    """
+    Test that the feed only includes schedules overlapping the requested range
+    """
+    for start_date in ("2025-01-05", "2025-03-05"):
+        client.post(
+            f"/api/v1/schedule/recipe/{created_recipe['id']}",
+            json={"start_date": start_date, "end_date": start_date}
+        )
+
+    body = client.get(
+        "/api/v1/schedule/feed.ics",
+        params={"start_date": "2025-03-01", "end_date": "2025-03-31"}
+    ).content.decode()
+
+    assert body.count("BEGIN:VEVENT") == 1
+    assert "DTSTART;VALUE=DATE:20250305" in body
+
+def test_schedule_feed_long_lines_are_folded(client, created_recipe):
+    """
+    Test that content lines longer than 75 octets are folded
+    """
+    client.post(
+        f"/api/v1/schedule/recipe/{created_recipe['id']}",
+        json={"start_date": "2025-01-05", "end_date": "2025-01-05", "notes": "é" * 100}
+    )
+
+    body = client.get("/api/v1/schedule/feed.ics").content
+
+    assert all(len(line) <= 75 for line in body.split(b"\r\n"))
+    assert "DESCRIPTION:" + "é" * 100 in body.decode().replace("\r\n ", "")
+
+def test_schedule_feed_etag(client, created_recipe, created_schedule):
+    """
+    Test that polls with a matching ETag get a 304 until a schedule or recipe changes
+    """
+    etag = client.get("/api/v1/schedule/feed.ics").headers["etag"]
+
+    response = client.get("/api/v1/schedule/feed.ics", headers={"If-None-Match": etag})
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+    assert response.content == b""
+
+    # A different range has its own ETag
+    response = client.get(
+        "/api/v1/schedule/feed.ics",
+        params={"start_date": "2025-01-01"},
+        headers={"If-None-Match": etag}
+    )
+    assert response.status_code == status.HTTP_200_OK
+
+    # Schedule changes invalidate the ETag
+    client.put(f"/api/v1/schedule/{created_schedule['id']}", json={"notes": "Changed"})
+    response = client.get("/api/v1/schedule/feed.ics", headers={"If-None-Match": etag})
+    assert response.status_code == status.HTTP_200_OK
+    etag = response.headers["etag"]
+
+    # So do recipe title changes
+    client.put(f"/api/v1/recipe/{created_recipe['id']}", json={**created_recipe, "title": "Renamed"})
+    response = client.get("/api/v1/schedule/feed.ics", headers={"If-None-Match": etag})
+    assert response.status_code == status.HTTP_200_OK
+    assert "Renamed" in response.content.decode()
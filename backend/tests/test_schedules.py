@@ -1,5 +1,10 @@
+import json
+from datetime import date
+
 from fastapi import status
 
+from app.routes import schedule_routes
+
 def test_create_schedule(client, created_recipe, sample_schedule):
     """
     Test creating a schedule for an existing recipe
@@ -250,4 +255,180 @@ def test_get_schedules_missing_parameters(client):
     # Missing both parameters
     response = client.get("/api/v1/schedule/range/")
 
-    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
\ No newline at end of file
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+def test_get_schedules_by_date_range_after_update(client, created_schedule):
+    """
+    Test that the date range index follows schedule updates and deletes
+    """
+    client.put(
+        f"/api/v1/schedule/{created_schedule['id']}",
+        json={"start_date": "2025-03-01", "end_date": "2025-03-03"}
+    )
+
+    old_range = client.get(
+        "/api/v1/schedule/range/",
+        params={"start_date": "2025-01-01", "end_date": "2025-01-31"}
+    ).json()
+    new_range = client.get(
+        "/api/v1/schedule/range/",
+        params={"start_date": "2025-03-03", "end_date": "2025-03-10"}
+    ).json()
+
+    assert old_range == []
+    assert [schedule["id"] for schedule in new_range] == [created_schedule["id"]]
+
+    client.delete(f"/api/v1/schedule/{created_schedule['id']}")
+    new_range = client.get(
+        "/api/v1/schedule/range/",
+        params={"start_date": "2025-03-03", "end_date": "2025-03-10"}
+    ).json()
+    assert new_range == []
+
+def test_get_schedules_by_date_range_projection(client, created_schedule, created_recipe, created_direction):
+    """
+    Test that the calendar range returns a recipe summary by default and the full recipe with expand=recipe
+    """
+    params = {"start_date": "2025-01-01", "end_date": "2025-01-31"}
+
+    response = client.get("/api/v1/schedule/range/", params=params)
+    assert response.status_code == status.HTTP_200_OK
+    summary = response.json()[0]
+
+    assert summary["id"] == created_schedule["id"]
+    assert summary["recipe"] == {
+        "id": created_recipe["id"],
+        "title": created_recipe["title"],
+        "cooking_time": created_recipe["cooking_time"],
+        "servings": created_recipe["servings"]
+    }
+
+    response = client.get("/api/v1/schedule/range/", params={**params, "expand": "recipe"})
+    assert response.status_code == status.HTTP_200_OK
+    expanded = response.json()[0]
+
+    assert expanded["recipe"]["description"] == created_recipe["description"]
+    assert [direction["id"] for direction in expanded["recipe"]["directions"]] == [created_direction["id"]]
+
+def test_get_calendar_views(client, created_recipe):
+    """
+    Test day, week and month calendar views built from the per-day index
+    """
+    multi_day = client.post(
+        f"/api/v1/schedule/recipe/{created_recipe['id']}",
+        json={"start_date": "2025-01-31", "end_date": "2025-02-02", "meal_type": "dinner"}
+    ).json()
+    single_day = client.post(
+        f"/api/v1/schedule/recipe/{created_recipe['id']}",
+        json={"start_date": "2025-02-01", "end_date": "2025-02-01", "meal_type": "lunch"}
+    ).json()
+
+    # Day view
+    response = client.get("/api/v1/schedule/calendar/", params={"view": "day", "day": "2025-02-01"})
+    assert response.status_code == status.HTTP_200_OK
+    days = response.json()
+    assert [day["day"] for day in days] == ["2025-02-01"]
+    assert [schedule["id"] for schedule in days[0]["schedules"]] == [multi_day["id"], single_day["id"]]
+    assert days[0]["schedules"][0]["recipe"]["title"] == created_recipe["title"]
+
+    # Week view runs Sunday to Saturday and includes empty days
+    days = client.get("/api/v1/schedule/calendar/", params={"view": "week", "day": "2025-01-29"}).json()
+    assert [day["day"] for day in days][0] == "2025-01-26"
+    assert len(days) == 7
+    assert [len(day["schedules"]) for day in days] == [0, 0, 0, 0, 0, 1, 2]
+
+    # Month view
+    days = client.get("/api/v1/schedule/calendar/", params={"view": "month", "day": "2025-02-14"}).json()
+    assert len(days) == 28
+    assert [len(day["schedules"]) for day in days[:3]] == [2, 1, 0]
+
+def test_calendar_follows_schedule_changes(client, created_schedule):
+    """
+    Test that the per-day index is rebuilt on update and cleared on delete
+    """
+    params = {"view": "month", "day": "2025-03-01"}
+    client.put(
+        f"/api/v1/schedule/{created_schedule['id']}",
+        json={"start_date": "2025-03-01", "end_date": "2025-03-03"}
+    )
+
+    march = client.get("/api/v1/schedule/calendar/", params=params).json()
+    january = client.get("/api/v1/schedule/calendar/", params={"view": "month", "day": "2025-01-01"}).json()
+    assert [day["day"] for day in march if day["schedules"]] == ["2025-03-01", "2025-03-02", "2025-03-03"]
+    assert all(day["schedules"] == [] for day in january)
+
+    # Updating only the notes keeps the index as it is
+    client.put(f"/api/v1/schedule/{created_schedule['id']}", json={"notes": "Moved"})
+    march = client.get("/api/v1/schedule/calendar/", params=params).json()
+    assert march[0]["schedules"][0]["notes"] == "Moved"
+
+    client.delete(f"/api/v1/schedule/{created_schedule['id']}")
+    march = client.get("/api/v1/schedule/calendar/", params=params).json()
+    assert all(day["schedules"] == [] for day in march)
+
+def test_get_calendar_invalid_view(client):
+    """
+    Test that an unknown calendar view is rejected
+    """
+    response = client.get("/api/v1/schedule/calendar/", params={"view": "year", "day": "2025-01-01"})
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+def test_get_schedules_by_date_range_pages(client, created_recipe):
+    """
+    Test keyset pagination through the date range with the X-Next-Cursor header
+    """
+    created = [
+        client.post(
+            f"/api/v1/schedule/recipe/{created_recipe['id']}",
+            json={"start_date": start_date, "end_date": start_date}
+        ).json()["id"]
+        for start_date in ("2025-01-03", "2025-01-01", "2025-01-02", "2025-01-02", "2025-01-05")
+    ]
+    expected = [created[1], created[2], created[3], created[0], created[4]]
+
+    params = {"start_date": "2025-01-01", "end_date": "2025-01-31", "limit": 2}
+    pages = []
+    cursor = None
+    while True:
+        response = client.get("/api/v1/schedule/range/", params={**params, **({"cursor": cursor} if cursor else {})})
+        assert response.status_code == status.HTTP_200_OK
+        pages.append([schedule["id"] for schedule in response.json()])
+        cursor = response.headers.get("x-next-cursor")
+        if cursor is None:
+            break
+
+    assert pages == [expected[0:2], expected[2:4], expected[4:5]]
+
+    response = client.get("/api/v1/schedule/range/", params={**params, "cursor": "not-a-cursor"})
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+def test_date_range_pages_read_in_index_order(db_session):
+    """
+    Test that first and later pages of the date range are read in order from the (start_date, id)
+    index, stopping at the limit, rather than the whole range being sorted
+    """
+    for cursor in (None, "2025-01-15:10"):
+        query = schedule_routes._range_query(db_session, date(2025, 1, 1), date(2025, 12, 31), None, cursor).limit(101)
+        statement = query.statement.compile(db_session.get_bind(), compile_kwargs={"literal_binds": True})
+        plan = [row[3] for row in db_session.connection().exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}")]
+
+        assert any("USING INDEX ix_schedules_start_date_id" in step for step in plan), plan
+        assert not any("TEMP B-TREE" in step for step in plan), plan
+
+def test_get_schedules_by_date_range_ndjson(client, created_schedule, created_recipe):
+    """
+    Test streaming the date range as newline-delimited JSON, with and without full recipes
+    """
+    params = {"start_date": "2025-01-01", "end_date": "2025-01-31", "format": "ndjson"}
+
+    response = client.get("/api/v1/schedule/range/", params=params)
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["content-type"] == "application/x-ndjson"
+    lines = response.text.splitlines()
+    assert len(lines) == 1
+    assert json.loads(lines[0])["recipe"]["title"] == created_recipe["title"]
+
+    response = client.get("/api/v1/schedule/range/", params={**params, "expand": "recipe"})
+    schedule = json.loads(response.text.splitlines()[0])
+    assert schedule["id"] == created_schedule["id"]
+    assert schedule["recipe"]["description"] == created_recipe["description"]
@@ -0,0 +1,126 @@
+import pytest
+from sqlalchemy import create_engine, insert, inspect
+from sqlalchemy.orm import Session
+
+from app import seed
+from app.models import Base, Ingredient, IngredientCategory
+from app.services import unit_conversion
+
+@pytest.fixture
+def seeded(tmp_path):
+    """
+    A small seeded database file
+    """
+    engine = create_engine(f"sqlite:///{tmp_path / 'seeded.db'}")
+    counts = seed.seed(engine, recipes=200, ingredients=50, years=1, chunk_size=100)
+    yield engine, counts
+    engine.dispose()
+
+def test_seed_counts_and_shape(seeded):
+    """
+    Test that every recipe gets 3-15 numbered directions and 4-14 distinct ingredients
+    """
+    engine, counts = seeded
+    assert counts["recipes"] == 200
+    assert counts["ingredients"] == 50
+    assert counts["schedules"] == 365 * 3
+    assert counts["schedule_days"] > counts["schedules"]
+
+    with engine.connect() as connection:
+        directions = connection.exec_driver_sql(
+            "SELECT COUNT(*), MIN(direction_number), MAX(direction_number) FROM directions GROUP BY recipe_id"
+        ).all()
+        ingredients = connection.exec_driver_sql(
+            "SELECT COUNT(*), COUNT(DISTINCT ingredient_id) FROM recipe_ingredients GROUP BY recipe_id"
+        ).all()
+        base_query = "SELECT base_quantity, base_unit_id FROM recipe_ingredients ORDER BY id"
+        base_quantities = connection.exec_driver_sql(base_query).all()
+        # The conversion service's own refresh computes the same values
+        session = Session(bind=connection)
+        unit_conversion.refresh_base_quantities(session, unit_conversion.load_matrix(session))
+        recomputed = connection.exec_driver_sql(base_query).all()
+        session.rollback()
+        intervals = connection.exec_driver_sql("SELECT COUNT(*) FROM schedule_intervals").scalar()
+
+    assert len(directions) == 200
+    assert all(3 <= count <= 15 and low == 1 and high == count for count, low, high in directions)
+    assert all(4 <= count <= 14 and distinct == count for count, distinct in ingredients)
+    assert [unit for _, unit in base_quantities] == [unit for _, unit in recomputed]
+    assert [quantity for quantity, _ in base_quantities] == pytest.approx([quantity for quantity, _ in recomputed])
+    assert intervals == counts["schedules"]
+
+def test_seed_rebuilds_indexes(seeded):
+    """
+    Test that indexes dropped for the load exist afterwards and the journal is back to normal
+    """
+    engine, _ = seeded
+    inspector = inspect(engine)
+    assert "ix_recipes_title" in {index["name"] for index in inspector.get_indexes("recipes")}
+    assert "ix_schedules_end_date" in {index["name"] for index in inspector.get_indexes("schedules")}
+    with engine.connect() as connection:
+        assert connection.exec_driver_sql("PRAGMA journal_mode").scalar() == "delete"
+
+def test_seed_is_deterministic(seeded, tmp_path):
+    """
+    Test that the same arguments produce the same rows, and seeding twice is refused
+    """
+    engine, _ = seeded
+    other = create_engine(f"sqlite:///{tmp_path / 'other.db'}")
+    seed.seed(other, recipes=200, ingredients=50, years=1, chunk_size=100)
+
+    query = "SELECT recipe_id, ingredient_id, quantity, unit_id FROM recipe_ingredients ORDER BY id"
+    with engine.connect() as first, other.connect() as second:
+        assert first.exec_driver_sql(query).all() == second.exec_driver_sql(query).all()
+
+    with pytest.raises(ValueError, match="already has 50 ingredients, 200 recipes"):
+        seed.seed(other, recipes=10)
+    other.dispose()
+
+def index_names(engine):
+    inspector = inspect(engine)
+    return {index["name"] for table in inspector.get_table_names() for index in inspector.get_indexes(table)}
+
+def test_seed_refuses_partial_data(tmp_path):
+    """
+    Test that a database with any seeded table already filled is refused before anything is dropped
+    """
+    engine = create_engine(f"sqlite:///{tmp_path / 'partial.db'}")
+    Base.metadata.create_all(bind=engine)
+    with engine.begin() as connection:
+        seed.seed_reference_data(connection)
+        connection.execute(insert(Ingredient.__table__).values(
+            id=1, name="salt", preferred_unit_id=1, category=IngredientCategory.SPICES
+        ))
+    indexes = index_names(engine)
+
+    with pytest.raises(ValueError, match="already has 1 ingredients"):
+        seed.seed(engine, recipes=10, ingredients=5, years=1)
+    with pytest.raises(ValueError, match="already exists"):
+        seed.seed(engine, recipes=10, ingredients=5, years=1, new_file=True)
+    assert index_names(engine) == indexes
+    engine.dispose()
+
+def test_failed_load_rolled_back(tmp_path, monkeypatch):
+    """
+    Test that a load failing part way through an existing file keeps its journal, so nothing is
+    left behind and the dropped indexes are back
+    """
+    engine = create_engine(f"sqlite:///{tmp_path / 'existing.db'}")
+    Base.metadata.create_all(bind=engine)
+    indexes = index_names(engine)
+    insert_columns = seed.insert_columns
+
+    def failing_insert(connection, table, columns, chunk_size):
+        if table.name == "schedules":
+            assert connection.exec_driver_sql("PRAGMA journal_mode").scalar() == "delete"
+            raise RuntimeError("disk full")
+        return insert_columns(connection, table, columns, chunk_size)
+
+    monkeypatch.setattr(seed, "insert_columns", failing_insert)
+    with pytest.raises(RuntimeError):
+        seed.seed(engine, recipes=10, ingredients=20, years=1)
+
+    assert index_names(engine) == indexes
+    with engine.connect() as connection:
+        assert connection.exec_driver_sql("SELECT COUNT(*) FROM recipes").scalar() == 0
+    engine.dispose()
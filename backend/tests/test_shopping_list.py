@@ -0,0 +1,84 @@
+from fastapi import status
+import pytest
+
+@pytest.fixture
+def pancakes(client, sample_recipe):
+    """
+    Create a recipe using milk (2 cups, prefers L), flour (200 g, prefers kg) and eggs (2, prefers dozen)
+    """
+    recipe = client.post("/api/v1/recipe/", json={**sample_recipe, "title": "Pancakes"}).json()
+    ingredients = [
+        # (name, category, preferred unit, quantity, unit)
+        ("Milk", "dairy", 2, 2, 6),
+        ("Flour", "grains", 12, 200, 11),
+        ("Eggs", "dairy", 16, 2, 15),
+    ]
+    for name, category, preferred_unit_id, quantity, unit_id in ingredients:
+        ingredient = client.post(
+            "/api/v1/ingredients/",
+            json={"name": name, "category": category, "preferred_unit_id": preferred_unit_id}
+        ).json()
+        client.post(
+            f"/api/v1/recipe_ingredients/recipe/{recipe['id']}",
+            json={"ingredient_id": ingredient["id"], "quantity": quantity, "unit_id": unit_id}
+        )
+    return recipe
+
+def test_shopping_list_totals(client, pancakes, add_schedule):
+    """
+    Test totals across schedules, counting multi-day schedules once per day in range
+    """
+    add_schedule(pancakes, "2025-01-06", "2025-01-06")     # 1 day
+    add_schedule(pancakes, "2025-01-08", "2025-01-09")     # 2 days
+    add_schedule(pancakes, "2025-01-12", "2025-01-20")     # 2 days inside the range
+    add_schedule(pancakes, "2025-02-01", "2025-02-01")     # outside the range
+
+    response = client.get(
+        "/api/v1/schedule/shopping-list",
+        params={"start_date": "2025-01-05", "end_date": "2025-01-13"}
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    data = response.json()
+
+    categories = {category["category"]: category["items"] for category in data["categories"]}
+    assert set(categories) == {"dairy", "grains"}
+
+    items = {item["name"]: item for items in categories.values() for item in items}
+    # 5 days worth of pancakes
+    assert items["Milk"]["quantity"] == pytest.approx(5 * 2 * 0.236588, abs=1e-3)
+    assert items["Milk"]["unit_abbreviation"] == "L"
+    assert items["Flour"]["quantity"] == pytest.approx(1.0)
+    assert items["Flour"]["unit_abbreviation"] == "kg"
+    assert items["Eggs"]["quantity"] == pytest.approx(10 / 12, abs=1e-3)
+    assert items["Eggs"]["unit_abbreviation"] == "doz"
+    assert items["Milk"]["schedule_count"] == 3
+
+def test_shopping_list_multi_day_schedule(client, pancakes, add_schedule):
+    """
+    Test that one schedule over several days needs the recipe once per day within the range
+    """
+    add_schedule(pancakes, "2025-01-06", "2025-01-08")
+
+    for start_date, end_date, days in [("2025-01-01", "2025-01-31", 3), ("2025-01-07", "2025-01-31", 2)]:
+        response = client.get(
+            "/api/v1/schedule/shopping-list",
+            params={"start_date": start_date, "end_date": end_date}
+        )
+        items = {item["name"]: item for category in response.json()["categories"] for item in category["items"]}
+        assert items["Flour"]["quantity"] == pytest.approx(days * 0.2)
+        assert items["Flour"]["schedule_count"] == 1
+
+def test_shopping_list_empty_range(client, pancakes, add_schedule):
+    """
+    Test a range with nothing scheduled
+    """
+    add_schedule(pancakes, "2025-01-06", "2025-01-06")
+
+    response = client.get(
+        "/api/v1/schedule/shopping-list",
+        params={"start_date": "2025-03-01", "end_date": "2025-03-31"}
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["categories"] == []
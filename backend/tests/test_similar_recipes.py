@@ -0,0 +1,115 @@
+import numpy as np
+from fastapi import status
+
+from app.services import similarity
+
+def create_ingredient(client, name):
+    response = client.post(
+        "/api/v1/ingredients/",
+        json={"name": name, "category": "pantry", "preferred_unit_id": 4}
+    )
+    return response.json()["id"]
+
+def create_recipe_with_ingredients(client, sample_recipe, title, ingredient_ids):
+    recipe = client.post("/api/v1/recipe/", json={**sample_recipe, "title": title}).json()
+    for ingredient_id in ingredient_ids:
+        client.post(
+            f"/api/v1/recipe_ingredients/recipe/{recipe['id']}",
+            json={"ingredient_id": ingredient_id, "quantity": 1, "unit_id": 4}
+        )
+    return recipe
+
+def test_similar_recipes_ranked_by_ingredient_overlap(client, sample_recipe):
+    """
+    Test that recipes sharing ingredients are returned, most similar first
+    """
+    ids = [create_ingredient(client, f"Ingredient {i}") for i in range(12)]
+
+    base = create_recipe_with_ingredients(client, sample_recipe, "Base", ids[:8])
+    close = create_recipe_with_ingredients(client, sample_recipe, "Close", ids[:7])
+    identical = create_recipe_with_ingredients(client, sample_recipe, "Identical", ids[:8])
+    unrelated = create_recipe_with_ingredients(client, sample_recipe, "Unrelated", ids[8:])
+
+    response = client.get(f"/api/v1/recipe/{base['id']}/similar")
+
+    assert response.status_code == status.HTTP_200_OK
+    data = response.json()
+
+    returned_ids = [recipe["id"] for recipe in data]
+    assert returned_ids[:2] == [identical["id"], close["id"]]
+    assert unrelated["id"] not in returned_ids
+    assert data[0]["similarity"] == 1.0
+    assert data[0]["title"] == "Identical"
+
+def test_similar_recipes_updated_incrementally(client, sample_recipe):
+    """
+    Test that ingredient changes after the index is built are reflected
+    """
+    ids = [create_ingredient(client, f"Ingredient {i}") for i in range(8)]
+
+    base = create_recipe_with_ingredients(client, sample_recipe, "Base", ids[:4])
+    other = create_recipe_with_ingredients(client, sample_recipe, "Other", ids[4:])
+
+    # Builds the index
+    response = client.get(f"/api/v1/recipe/{base['id']}/similar")
+    assert response.json() == []
+
+    # Give the other recipe the same ingredient set as the base recipe
+    other_ingredients = client.get(f"/api/v1/recipe_ingredients/recipe/{other['id']}").json()
+    for recipe_ingredient, ingredient_id in zip(other_ingredients, ids[:4]):
+        client.put(
+            f"/api/v1/recipe_ingredients/{recipe_ingredient['id']}",
+            json={"ingredient_id": ingredient_id, "quantity": 1, "unit_id": 4}
+        )
+
+    response = client.get(f"/api/v1/recipe/{base['id']}/similar")
+    assert [recipe["id"] for recipe in response.json()] == [other["id"]]
+
+    # Deleting the recipe removes it from the index
+    client.delete(f"/api/v1/recipe/{other['id']}")
+    response = client.get(f"/api/v1/recipe/{base['id']}/similar")
+    assert response.json() == []
+
+def test_similar_recipes_nonexistent_recipe(client):
+    """
+    Test requesting similar recipes for a nonexistent recipe
+    """
+    nonexistent_id = 42069
+    response = client.get(f"/api/v1/recipe/{nonexistent_id}/similar")
+
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+    assert f"Recipe with id {nonexistent_id} not found" in response.json()["detail"]
+
+def test_index_build_chunked_and_pooled(client, sample_recipe, db_session, monkeypatch):
+    """
+    Test that building a chunk of rows at a time, in-process or across the pool, gives the same
+    signatures as hashing every row at once
+    """
+    ids = [create_ingredient(client, f"Ingredient {i}") for i in range(10)]
+    recipes = [
+        create_recipe_with_ingredients(client, sample_recipe, f"Recipe {i}", ids[i:i + 4])["id"]
+        for i in range(6)
+    ]
+    rows = sorted((recipe_id, ingredient_id) for i, recipe_id in enumerate(recipes) for ingredient_id in ids[i:i + 4])
+    expected_ids, expected = similarity.compute_signatures(*np.array(rows, dtype=np.int64).T)
+
+    monkeypatch.setattr(similarity, "CHUNK_ROWS", 5)
+    monkeypatch.setattr(similarity, "PARALLEL_THRESHOLD_ROWS", 0)
+    monkeypatch.setattr(similarity, "WORKERS", 1)
+
+    def built_signatures():
+        index = similarity.MinHashLSHIndex()
+        index.build(db_session)
+        return index._signatures
+
+    serial = built_signatures()
+    similarity.start_pool()
+    try:
+        assert similarity._pool is not None
+        pooled = built_signatures()
+    finally:
+        similarity.shutdown_pool()
+
+    for signatures in (serial, pooled):
+        assert sorted(signatures) == expected_ids.tolist()
+        assert all((signatures[recipe_id] == signature).all() for recipe_id, signature in zip(expected_ids.tolist(), expected))
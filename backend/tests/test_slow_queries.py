@@ -0,0 +1,71 @@
+import json
+
+import pytest
+from fastapi import status
+
+from app import slow_queries
+
+@pytest.fixture
+def slow_log(tmp_path, monkeypatch):
+    """
+    Treat every statement as slow and log to a temporary file
+    """
+    path = tmp_path / "slow_queries.log"
+    monkeypatch.setattr(slow_queries, "THRESHOLD_SECONDS", 0.0)
+    slow_queries.configure_log(str(path))
+    slow_queries.clear()
+    yield path
+    for handler in slow_queries.logger.handlers[:]:
+        slow_queries.logger.removeHandler(handler)
+        handler.close()
+    slow_queries.clear()
+
+def test_slow_query_logged_with_plan(client, created_ingredient, slow_log):
+    """
+    Test that a slow search is logged with redacted parameters and a plan showing the full scan
+    """
+    client.get("/api/v1/ingredients/", params={"search": "secret"})
+
+    entries = [json.loads(line) for line in slow_log.read_text().splitlines()]
+    search = next(entry for entry in entries if "LIKE" in entry["statement"])
+    assert search["route"] == "GET /api/v1/ingredients/"
+    assert "<str:8>" in search["parameters"]      # %secret%
+    assert "secret" not in json.dumps(search)
+    assert any(scan.startswith("SCAN ingredients") for scan in search["full_scans"])
+
+def test_index_lookup_not_full_scan(client, created_recipe, slow_log):
+    """
+    Test that primary key lookups are explained as index searches
+    """
+    client.get(f"/api/v1/direction/recipe/{created_recipe['id']}")
+
+    entries = [json.loads(line) for line in slow_log.read_text().splitlines()]
+    lookup = next(entry for entry in entries if "WHERE recipes.id = ?" in entry["statement"])
+    assert lookup["plan"] and lookup["plan"][0].startswith("SEARCH recipes USING INTEGER PRIMARY KEY")
+    assert lookup["full_scans"] == []
+
+def test_slow_queries_endpoint(client, created_ingredient, slow_log):
+    """
+    Test that the sampled slow queries can be listed, filtered and cleared
+    """
+    client.get("/api/v1/ingredients/", params={"search": "salt"})
+
+    response = client.get("/api/v1/admin/slow-queries", params={"full_scans_only": True})
+    assert response.status_code == status.HTTP_200_OK
+    entries = response.json()
+    assert entries and all(entry["full_scans"] for entry in entries)
+
+    assert len(client.get("/api/v1/admin/slow-queries", params={"limit": 1}).json()) == 1
+
+    assert client.delete("/api/v1/admin/slow-queries").status_code == status.HTTP_204_NO_CONTENT
+    slow_queries.clear()    # the request above was itself logged
+    assert slow_queries.recent() == []
+
+def test_redact():
+    """
+    Test that text is redacted but numbers, dates and NULLs are kept
+    """
+    from datetime import date
+    assert slow_queries.redact((1, "abc", None, date(2025, 1, 2), b"\x00\x01")) == [
+        1, "<str:3>", None, "2025-01-02", "<bytes:2>"
+    ]
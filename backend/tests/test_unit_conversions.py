@@ -0,0 +1,166 @@
+from fastapi import status
+import pytest
+
+def test_convert_direct(client):
+    """
+    Test converting between units with a stored conversion
+    """
+    response = client.get(
+        "/api/v1/units/convert",
+        params={"quantity": 2, "from_unit_id": 6, "to_unit_id": 1}
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    data = response.json()
+    assert data["ratio"] == pytest.approx(236.588)
+    assert data["converted_quantity"] == pytest.approx(473.176)
+
+def test_convert_transitive(client):
+    """
+    Test converting between units that only share an intermediate unit (tsp -> L through ml)
+    """
+    response = client.get(
+        "/api/v1/units/convert",
+        params={"quantity": 1000, "from_unit_id": 3, "to_unit_id": 2}
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["converted_quantity"] == pytest.approx(4.92892)
+
+    # Reverse direction of a stored conversion
+    response = client.get(
+        "/api/v1/units/convert",
+        params={"quantity": 3, "from_unit_id": 15, "to_unit_id": 16}
+    )
+    assert response.json()["converted_quantity"] == pytest.approx(0.25)
+
+def test_convert_across_categories(client):
+    """
+    Test that converting volume to weight is rejected
+    """
+    response = client.get(
+        "/api/v1/units/convert",
+        params={"quantity": 1, "from_unit_id": 6, "to_unit_id": 11}
+    )
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert "Cannot convert" in response.json()["detail"]
+
+def test_convert_nonexistent_unit(client):
+    """
+    Test converting from a unit that doesn't exist
+    """
+    nonexistent_id = 42069
+    response = client.get(
+        "/api/v1/units/convert",
+        params={"quantity": 1, "from_unit_id": nonexistent_id, "to_unit_id": 1}
+    )
+
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+    assert f"Measurement unit with id {nonexistent_id} not found" in response.json()["detail"]
+
+def test_create_conversion_rebuilds_matrix(client):
+    """
+    Test that a new conversion is usable immediately, including through derived paths
+    """
+    # Load the matrix before Liter -> Cup can be derived from anything new
+    client.get("/api/v1/units/convert", params={"quantity": 1, "from_unit_id": 1, "to_unit_id": 2})
+
+    # Remove cup -> ml so cup is disconnected
+    conversions = client.get("/api/v1/units/conversions/").json()
+    cup_to_ml = next(c for c in conversions if c["from_unit_id"] == 6)
+    delete_response = client.delete(f"/api/v1/units/conversions/{cup_to_ml['id']}")
+    assert delete_response.status_code == status.HTTP_204_NO_CONTENT
+
+    response = client.get("/api/v1/units/convert", params={"quantity": 1, "from_unit_id": 6, "to_unit_id": 2})
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    # Reconnect cup through tablespoons
+    create_response = client.post(
+        "/api/v1/units/conversions/",
+        json={"from_unit_id": 6, "to_unit_id": 4, "ratio": 16}
+    )
+    assert create_response.status_code == status.HTTP_201_CREATED
+    assert create_response.json()["from_unit"]["abbreviation"] == "cup"
+
+    response = client.get("/api/v1/units/convert", params={"quantity": 1, "from_unit_id": 6, "to_unit_id": 2})
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["converted_quantity"] == pytest.approx(16 * 14.7868 / 1000)
+
+def test_create_conversion_across_categories(client):
+    """
+    Test that conversions between categories can't be stored
+    """
+    response = client.post(
+        "/api/v1/units/conversions/",
+        json={"from_unit_id": 6, "to_unit_id": 11, "ratio": 120}
+    )
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+def test_create_duplicate_conversion(client):
+    """
+    Test that a conversion pair can only be stored once
+    """
+    response = client.post(
+        "/api/v1/units/conversions/",
+        json={"from_unit_id": 2, "to_unit_id": 1, "ratio": 1000}
+    )
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert "already exists" in response.json()["detail"]
+
+def test_convert_batch(client):
+    """
+    Test converting many quantities in one request
+    """
+    response = client.post(
+        "/api/v1/units/convert/batch",
+        json={
+            "quantities": [2, 1000, 24, 1],
+            "from_unit_ids": [6, 3, 15, 14],
+            "to_unit_ids": [1, 2, 16, 13]
+        }
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["converted_quantities"] == pytest.approx([473.176, 4.92892, 2, 16], rel=1e-4)
+
+def test_convert_batch_rejects_invalid_items(client):
+    """
+    Test that cross-category and unknown-unit items reject the batch and are reported
+    """
+    response = client.post(
+        "/api/v1/units/convert/batch",
+        json={
+            "quantities": [1, 1, 1, 1],
+            "from_unit_ids": [6, 6, 42069, 100000],
+            "to_unit_ids": [1, 11, 1, 1]
+        }
+    )
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert "[1, 2, 3]" in response.json()["detail"]
+
+def test_convert_batch_mismatched_lengths(client):
+    """
+    Test that the input lists must line up
+    """
+    response = client.post(
+        "/api/v1/units/convert/batch",
+        json={"quantities": [1, 2], "from_unit_ids": [6], "to_unit_ids": [1]}
+    )
+
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+def test_convert_batch_out_of_range_ids(client):
+    """
+    Test that ids outside the id range are rejected as invalid input rather than overflowing
+    """
+    for unit_id in (-1, 2**63):
+        response = client.post(
+            "/api/v1/units/convert/batch",
+            json={"quantities": [1], "from_unit_ids": [unit_id], "to_unit_ids": [1]}
+        )
+
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
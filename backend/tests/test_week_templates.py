@@ -0,0 +1,197 @@
+from datetime import date
+
+from fastapi import status
+from sqlalchemy import create_engine, event, func
+from sqlalchemy.orm import Session
+
+from app.models import Base, Recipe, Schedule, ScheduleDay
+from app.services import schedule_copy
+
+def calendar_week(client, day):
+    days = client.get("/api/v1/schedule/calendar/", params={"view": "week", "day": day}).json()
+    return {day["day"]: [s["id"] for s in day["schedules"]] for day in days if day["schedules"]}
+
+def test_copy_schedules(client, created_recipe, add_schedule):
+    """
+    Test copying a week of schedules forward, including multi-day schedules
+    """
+    add_schedule(created_recipe, "2025-01-05", "2025-01-05", "dinner")
+    add_schedule(created_recipe, "2025-01-07", "2025-01-08", "lunch")
+    add_schedule(created_recipe, "2025-01-12", "2025-01-12", "dinner")     # outside the source range
+
+    response = client.post(
+        "/api/v1/schedule/copy",
+        json={"source_start_date": "2025-01-05", "source_end_date": "2025-01-11", "target_start_date": "2025-01-19"}
+    )
+
+    assert response.status_code == status.HTTP_201_CREATED
+    new_ids = response.json()["schedule_ids"]
+    assert len(new_ids) == 2
+
+    copied = client.get(
+        "/api/v1/schedule/range/",
+        params={"start_date": "2025-01-19", "end_date": "2025-01-25"}
+    ).json()
+    assert [(s["id"], s["start_date"], s["end_date"], s["meal_type"]) for s in copied] == [
+        (new_ids[0], "2025-01-19", "2025-01-19", "dinner"),
+        (new_ids[1], "2025-01-21", "2025-01-22", "lunch"),
+    ]
+
+    # The per-day calendar index covers the copies
+    assert calendar_week(client, "2025-01-19") == {
+        "2025-01-19": [new_ids[0]],
+        "2025-01-21": [new_ids[1]],
+        "2025-01-22": [new_ids[1]],
+    }
+
+def test_copy_schedules_backwards_into_overlap(client, created_recipe, add_schedule):
+    """
+    Test that copying into an overlapping range copies only the original schedules
+    """
+    add_schedule(created_recipe, "2025-01-05", "2025-01-05")
+    add_schedule(created_recipe, "2025-01-06", "2025-01-06")
+
+    response = client.post(
+        "/api/v1/schedule/copy",
+        json={"source_start_date": "2025-01-05", "source_end_date": "2025-01-06", "target_start_date": "2025-01-06"}
+    )
+
+    assert len(response.json()["schedule_ids"]) == 2
+    schedules = client.get(
+        "/api/v1/schedule/range/",
+        params={"start_date": "2025-01-01", "end_date": "2025-01-31"}
+    ).json()
+    assert [s["start_date"] for s in schedules] == ["2025-01-05", "2025-01-06", "2025-01-06", "2025-01-07"]
+
+def test_copy_ignores_concurrent_inserts(tmp_path):
+    """
+    Test that a schedule another writer commits just before a copy's insert isn't taken as one of its copies
+    """
+    path = tmp_path / "copy.db"
+    engine = create_engine(f"sqlite:///{path}")
+    other = create_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(bind=engine)
+    with Session(engine) as db:
+        recipe = Recipe(title="Soup", description="Hot", cooking_time=10, servings=2)
+        db.add(recipe)
+        db.flush()
+        db.add(Schedule(recipe_id=recipe.id, start_date=date(2025, 1, 5), end_date=date(2025, 1, 5)))
+        db.commit()
+        recipe_id = recipe.id
+
+    inserted = []
+
+    def insert_elsewhere(connection, cursor, statement, parameters, context, executemany):
+        if statement.startswith("INSERT INTO schedules") and not inserted:
+            inserted.append(True)
+            with Session(other) as db:
+                db.add(Schedule(recipe_id=recipe_id, start_date=date(2025, 3, 1), end_date=date(2025, 3, 2)))
+                db.commit()
+
+    event.listen(engine, "before_cursor_execute", insert_elsewhere)
+    with Session(engine) as db:
+        created = schedule_copy.copy_range(db, date(2025, 1, 5), date(2025, 1, 11), date(2025, 1, 19))
+        db.commit()
+
+        assert len(created) == 1
+        assert db.get(Schedule, created[0][0]).start_date == date(2025, 1, 19)
+        assert db.query(func.count()).select_from(ScheduleDay).scalar() == 1      # the other writer's days aren't indexed here
+    engine.dispose()
+    other.dispose()
+
+def test_copy_schedules_invalid_range(client):
+    """
+    Test that a source range ending before it starts is rejected
+    """
+    response = client.post(
+        "/api/v1/schedule/copy",
+        json={"source_start_date": "2025-01-11", "source_end_date": "2025-01-05", "target_start_date": "2025-01-19"}
+    )
+
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+def test_create_and_apply_week_template(client, created_recipe):
+    """
+    Test creating a template from entries and applying it to a week
+    """
+    response = client.post(
+        "/api/v1/week-templates/",
+        json={
+            "name": "Weeknights",
+            "entries": [
+                {"recipe_id": created_recipe["id"], "day_offset": 3, "meal_type": "dinner"},
+                {"recipe_id": created_recipe["id"], "day_offset": 1, "duration_days": 2, "meal_type": "lunch"},
+            ]
+        }
+    )
+    assert response.status_code == status.HTTP_201_CREATED
+    template = response.json()
+    assert [entry["day_offset"] for entry in template["entries"]] == [1, 3]
+
+    response = client.post(f"/api/v1/week-templates/{template['id']}/apply", params={"start_date": "2025-02-02"})
+    assert response.status_code == status.HTTP_201_CREATED
+    lunch_id, dinner_id = response.json()["schedule_ids"]
+
+    assert calendar_week(client, "2025-02-02") == {
+        "2025-02-03": [lunch_id],
+        "2025-02-04": [lunch_id],
+        "2025-02-05": [dinner_id],
+    }
+
+def test_create_week_template_from_week(client, created_recipe, add_schedule):
+    """
+    Test saving an existing week as a template
+    """
+    add_schedule(created_recipe, "2025-01-06", "2025-01-07", "dinner")
+    add_schedule(created_recipe, "2025-01-13", "2025-01-13", "dinner")     # next week
+
+    response = client.post(
+        "/api/v1/week-templates/from-week",
+        params={"start_date": "2025-01-05"},
+        json={"name": "Last week"}
+    )
+
+    assert response.status_code == status.HTTP_201_CREATED
+    entries = response.json()["entries"]
+    assert [(e["recipe_id"], e["day_offset"], e["duration_days"], e["meal_type"]) for e in entries] == [
+        (created_recipe["id"], 1, 2, "dinner")
+    ]
+
+def test_week_template_errors(client, created_recipe):
+    """
+    Test unknown recipes, duplicate names, invalid offsets and unknown templates
+    """
+    response = client.post(
+        "/api/v1/week-templates/",
+        json={"name": "Bad", "entries": [{"recipe_id": 999, "day_offset": 0}]}
+    )
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    response = client.post(
+        "/api/v1/week-templates/",
+        json={"name": "Bad", "entries": [{"recipe_id": created_recipe["id"], "day_offset": 7}]}
+    )
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+    client.post("/api/v1/week-templates/", json={"name": "Twice"})
+    response = client.post("/api/v1/week-templates/", json={"name": "Twice"})
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    response = client.post("/api/v1/week-templates/999/apply", params={"start_date": "2025-01-05"})
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+
+def test_delete_week_template(client, created_recipe):
+    """
+    Test deleting a template, and that deleting a recipe removes its template entries
+    """
+    template = client.post(
+        "/api/v1/week-templates/",
+        json={"name": "Temp", "entries": [{"recipe_id": created_recipe["id"], "day_offset": 0}]}
+    ).json()
+
+    client.delete(f"/api/v1/recipe/{created_recipe['id']}")
+    assert client.get(f"/api/v1/week-templates/{template['id']}").json()["entries"] == []
+
+    response = client.delete(f"/api/v1/week-templates/{template['id']}")
+    assert response.status_code == status.HTTP_204_NO_CONTENT
+    assert client.get(f"/api/v1/week-templates/{template['id']}").status_code == status.HTTP_404_NOT_FOUND